@@ -57,6 +57,9 @@
 ::     configuration for the various lint projects.
 ::   2021-Apr-29 by Jonathon Church - Case 69412, Review 11576
 ::   - Modified to allow Compiler_path and Compiler_pathx86 to be set externally, to support other versions of Tasking.
+::   2026-Oct-18 - Request user-004
+::   - All the LintList file lists are now built by a single call to makeLintFileList.py in batch mode, so the source tree is only walked once.
+::     Each configuration now gets its own file list, lint_files_#.lnt.
 :: **************************************************************************************************************************************************
 
 :: Setup the batch file to expand variables within the exclamation marks (example: !var!) every time the line is executed, instead of at parse time.
@@ -88,7 +91,8 @@ if exist lint_project_config.bat (
 :: End of initialization.
 :::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
 
-set lintFiles=lint_files.lnt
+set lintFiles=lint_files
+set lintBatch=lint_files_batch.txt
 ::set finalOutput=lint_all_output.txt
 set outFile=lint_output.txt
 
@@ -113,6 +117,14 @@ set LibIncPath= ^
 set maxLoopValue=%LintListLength%
 set /a maxLoopValue-=1
 
+:: Build the file list for every configuration with one call to makeLintFileList.py, so directories shared by the lists are only walked once.
+if exist %lintBatch% del %lintBatch%
+for /l %%x in (0, 1, %maxLoopValue%) do (
+  echo "!LintList[%%x][lintFileList]!" "%lintFiles%_%%x.lnt">> %lintBatch%
+)
+call py -3 makeLintFileList.py --batch %lintBatch%
+if errorlevel 1 goto Python_Script_Failure
+
 for /l %%x in (0, 1, %maxLoopValue%) do (
   :: Set project_specific_lnt to override the project_specific.lnt file.
   set project_specific_lnt=!LintList[%%x][projectSpecific]!
@@ -122,13 +134,10 @@ for /l %%x in (0, 1, %maxLoopValue%) do (
   echo - proj specific is !LintList[%%x][projectSpecific]!
   echo - finalOut is !LintList[%%x][finalOutput]!
 
-  call py -3 makeLintFileList.py -i !LintList[%%x][lintFileList]! -o %lintFiles%
-  if errorlevel 1 goto Python_Script_Failure
-
   del %outFile%
   del !LintList[%%x][finalOutput]!
   ::set quiet=1
-  call lint.bat %* %lintFiles% > !LintList[%%x][finalOutput]!
+  call lint.bat %* %lintFiles%_%%x.lnt > !LintList[%%x][finalOutput]!
   del %outFile%
   if errorlevel 1 goto Lint_Script_Failure
 )
@@ -21,6 +21,22 @@
 #
 #   Usage: python add_build_and_date.py filename build_num
 #
+#   Any number of files can be stamped in one call, with any "$KEY" placeholders:
+#
+#   Usage: python add_build_and_date.py --build build_num [--date YYYY/MM/DD] [--set KEY=value ...] file_or_glob ...
+#
+#   Exactly two arguments, neither of them an option, are always the first form, so a build number such as -1 is still a build number. To stamp
+#   just two files, give an option (such as --build) or put -- before them.
+#
+#   --build and --date give $BUILD and $DATE, and each --set gives another $KEY. A glob can use ** to match any depth of directories. Where one
+#   key starts another, such as $BUILD and $BUILD_TYPE, the longer one is replaced. Each file is read and searched once, and is only written if
+#   it has a placeholder in it, through a temporary file that then replaces it. Line endings and the rest of the file are kept byte for byte.
+#   The files are stamped in parallel.
+#
+#   Files of --mmap_size bytes or more (1 MB by default) are memory mapped rather than read, so large generated files are never held in memory.
+#   If every placeholder in such a file has a value of the same length, the values are written over the placeholders in place; otherwise the
+#   file is rewritten a piece at a time.
+#
 # Input Documents:
 #   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
 #   impact on this document.
@@ -29,6 +45,12 @@
 # History:
 #   2018 November 20 by Stuart Thain - Case 52219, Review 8966
 #     - Created.
+#   2026-Oct-18 - Request user-019
+#     - Added stamping many files with any placeholders in one call.
+#   2026-Oct-18 - Request user-020
+#     - Large files are memory mapped, and patched in place when the values are the same length as the placeholders.
+#   2026-Oct-18 - Request user-019
+#     - The two argument form is stamped by Stamper too, and is picked by the number of arguments rather than by whether any starts with "-".
 #
 # ***************************************************************************************************************************************************
 
@@ -36,39 +58,280 @@
 # ***************************************************************************************************************************************************
 #   IMPORTS
 # ***************************************************************************************************************************************************
-import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 import datetime
+import codecs
+import glob
+import mmap
+import os
+import re
+import sys
+
+import rw_variable
 
 # ***************************************************************************************************************************************************
 #   CONSTANTS
 # ***************************************************************************************************************************************************
 DATE_FORMAT = "%Y/%m/%d"
 
+PLACEHOLDER_PREFIX = b"$"
+
+# Files this size or larger are memory mapped.
+DEFAULT_MMAP_SIZE = 1024 * 1024
+
+# The most of a memory mapped file copied at once when it is rewritten.
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# An option of the batch form, such as --build or -b5. A negative number such as -1 isn't one, as argparse reads it as a value too.
+OPTION = re.compile(r"--?[A-Za-z]")
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# Replaces "$KEY" placeholders with their values in a single search of a file.
+class Stamper:
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   values    : A dict of key, without the $, to its value.
+    #   mmap_size : Files this size or larger are memory mapped.
+    # ***********************************************************************************************************************************************
+    def __init__(self, values, mmap_size=DEFAULT_MMAP_SIZE):
+        self.values = values
+        self.mmap_size = mmap_size
+        # Longest first, as the first alternative that matches is taken.
+        keys = sorted(values, key=len, reverse=True)
+        self.pattern = re.compile(re.escape(PLACEHOLDER_PREFIX) +
+                                  b"(" + b"|".join(re.escape(key.encode("utf-8")) for key in keys) + b")")
+        # Encoded values by file encoding. Values that are plain ASCII are the same in every encoding a file can be read as.
+        self.encoded = {}
+        self.ascii = all(ord(char) < 128 for value in values.values() for char in value)
+
+    # ***********************************************************************************************************************************************
+    # Returns the values encoded for a file, by key as bytes. buffer is the contents of the file, as bytes or memory mapped.
+    # ***********************************************************************************************************************************************
+    def encoded_values(self, buffer):
+        if self.ascii:
+            encoding = "ascii"
+        elif isinstance(buffer, bytes):
+            encoding = rw_variable.detect_encoding(buffer)
+        else:
+            encoding = detect_mapped_encoding(buffer)
+        if encoding not in self.encoded:
+            self.encoded[encoding] = {key.encode("utf-8"): value.encode(encoding, "replace") for key, value in self.values.items()}
+        return self.encoded[encoding]
+
+    # ***********************************************************************************************************************************************
+    # Stamps a file.
+    #
+    # Returns:
+    #   The number of placeholders replaced. The file is only written if this isn't 0.
+    # ***********************************************************************************************************************************************
+    def stamp(self, filename):
+        if os.path.getsize(filename) >= max(self.mmap_size, 1):
+            return self.stamp_mapped(filename)
+
+        with open(filename, "rb") as file:
+            buffer = file.read()
+        # Most files have no $ at all, which is found much faster than a pattern.
+        if PLACEHOLDER_PREFIX not in buffer:
+            return 0
+
+        values = self.encoded_values(buffer)
+        stamped, count = self.pattern.subn(lambda match: values[match.group(1)], buffer)
+        if count:
+            rw_variable.replace_file(filename, [stamped])
+        return count
+
+    # ***********************************************************************************************************************************************
+    # Stamps a file by memory mapping it, and returns the number of placeholders replaced.
+    # ***********************************************************************************************************************************************
+    def stamp_mapped(self, filename):
+        with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped.find(PLACEHOLDER_PREFIX) == -1:
+                return 0
+            values = self.encoded_values(mapped)
+            size = len(mapped)
+            matches = [(match.start(), match.end(), values[match.group(1)]) for match in self.pattern.finditer(mapped)]
+        if not matches:
+            return 0
+
+        if all((end - start) == len(value) for start, end, value in matches):
+            with open(filename, "r+b") as file, mmap.mmap(file.fileno(), 0) as mapped:
+                for start, end, value in matches:
+                    mapped[start:end] = value
+                mapped.flush()
+        else:
+            rw_variable.replace_file(filename, mapped_pieces(filename, size, matches))
+        return len(matches)
+
+
 # ***************************************************************************************************************************************************
 #   FUNCTIONS
 # ***************************************************************************************************************************************************
 
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# detect_mapped_encoding
+#   The same as rw_variable.detect_encoding for a memory mapped file, decoding it a chunk at a time rather than all at once.
+# ***************************************************************************************************************************************************
+def detect_mapped_encoding(mapped):
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for offset in range(0, len(mapped), COPY_CHUNK_SIZE):
+            decoder.decode(mapped[offset:offset + COPY_CHUNK_SIZE])
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8"
+
+
+# ***************************************************************************************************************************************************
+# mapped_pieces
+#   Yields the contents of a file with values in place of the placeholders, in pieces of at most COPY_CHUNK_SIZE bytes.
+#
+#   Parameters:
+#       filename : The file, which is memory mapped while the pieces are read.
+#       size     : The size of the file when the placeholders were found.
+#       matches  : The (start, end, value) of each placeholder, in order.
+# ***************************************************************************************************************************************************
+def mapped_pieces(filename, size, matches):
+    # The pieces are copied out of the map rather than viewed, so the map can be closed before the file is replaced (Windows can't replace a
+    # mapped file).
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if len(mapped) != size:
+            raise OSError("{} changed while it was being stamped".format(filename))
+        offset = 0
+        for start, end, value in matches + [(size, size, b"")]:
+            for chunk in range(offset, start, COPY_CHUNK_SIZE):
+                yield mapped[chunk:min(chunk + COPY_CHUNK_SIZE, start)]
+            yield value
+            offset = end
+
+
+# ***************************************************************************************************************************************************
+# expand_files
+#   Returns the files named by a list of file names and globs, each once, in the order given. A name that matches nothing is reported, and None
+#   is returned.
+# ***************************************************************************************************************************************************
+def expand_files(names):
+    files = []
+    seen = set()
+    missing = False
+    for name in names:
+        if any(char in name for char in "*?["):
+            matches = sorted(path for path in glob.glob(name, recursive=True) if os.path.isfile(path))
+        else:
+            matches = [name] if os.path.isfile(name) else []
+        if not matches:
+            stderr_out("Error: No files match {}".format(name))
+            missing = True
+        for path in matches:
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                files.append(path)
+    return None if missing else files
+
+
+# ***************************************************************************************************************************************************
+# parse_value
+#   Parses a KEY=value argument of --set into a (KEY, value) tuple.
+# ***************************************************************************************************************************************************
+def parse_value(text):
+    key, equals, value = text.partition("=")
+    key = key.lstrip("$")
+    if (not equals) or (not re.match(r"\w+$", key)):
+        raise argparse.ArgumentTypeError("expected KEY=value, not {}".format(text))
+    return key, value
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments for stamping many files.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Replaces $BUILD, $DATE and other $KEY placeholders in files.")
+    parser.add_argument("files", nargs="+", help="The files to stamp, or globs matching them.")
+    parser.add_argument("--build", "-b", default=None, help="The value of $BUILD.")
+    parser.add_argument("--date", "-d", default=datetime.date.today().strftime(DATE_FORMAT),
+                        help="The value of $DATE (Default = today, as {}).".format(DATE_FORMAT.replace("%", "%%")))
+    parser.add_argument("--set", "-s", type=parse_value, action="append", default=[], metavar="KEY=value",
+                        help="The value of $KEY. May be given more than once.")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="The maximum number of files to stamp at once (Default = number of CPU cores).")
+    parser.add_argument("--mmap_size", type=int, default=DEFAULT_MMAP_SIZE,
+                        help="Memory map files of this many bytes or more (Default = {}).".format(DEFAULT_MMAP_SIZE))
+    args = parser.parse_args(args)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+
+# ***************************************************************************************************************************************************
+# stamp_files
+#   Stamps the files of a parsed command line, and returns the exit status.
+# ***************************************************************************************************************************************************
+def stamp_files(args):
+    values = {"DATE": args.date}
+    if args.build is not None:
+        values["BUILD"] = args.build
+    values.update(args.set)
+
+    files = expand_files(args.files)
+    if files is None:
+        return -1
+
+    stamper = Stamper(values, args.mmap_size)
+
+    def stamp(filename):
+        try:
+            stamper.stamp(filename)
+            return True
+        except OSError as error:
+            stderr_out("Error: Couldn't stamp {}: {}".format(filename, error))
+            return False
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(stamp, files))
+    return 0 if all(results) else -1
+
 
 def add_build_and_date():
     exit_status = -1
-    if len(sys.argv) == 3:
+    if (len(sys.argv) == 3) and not any(OPTION.match(arg) for arg in sys.argv[1:]):
         filename = sys.argv[1]
         build_num = sys.argv[2]
         date = datetime.date.today().strftime(DATE_FORMAT)
 
-        # Read contents of file.
-        file = open(filename, "r")
-        out = file.read()
-        file.close()
-
         # Replace keywords, and write contents back
-        out = out.replace("$BUILD", build_num).replace("$DATE", date)
-        file = open(filename, "w")
-        file.write(out)
-        file.close()
-        exit_status = 0
+        try:
+            Stamper({"BUILD": build_num, "DATE": date}).stamp(filename)
+            exit_status = 0
+        except OSError as error:
+            stderr_out("Error: Couldn't stamp {}: {}".format(filename, error))
     else:
-        print("Error: Expected 2 arguments, got " + str(len(sys.argv) - 1))
+        exit_status = stamp_files(parse_args(sys.argv[1:]))
     exit(exit_status)
 
 
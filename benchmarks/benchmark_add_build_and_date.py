@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Compares stamping a large generated file by reading it with stamping it through a memory map, as add_build_and_date.py does for files of
+#   --mmap_size bytes or more. A file of --size MB with a placeholder every --spacing KB is generated in a temporary directory, and stamped with
+#   values of the same length as the placeholders (patched in place) and of different lengths (rewritten a piece at a time).
+#
+#   Reading holds the whole file, and the stamped copy of it, in memory. The memory mapped stamp only holds the offsets of the placeholders and
+#   a piece of the file at a time. Peak memory is measured with tracemalloc, which counts the memory Python allocates but not the pages of the
+#   map, in a separate run from the timing since tracing slows Python down. Every way must give the same file.
+#
+#   Each timing is the best of --repeats runs, as the other processes on a build machine can slow any single run.
+#
+#   Usage: python benchmark_add_build_and_date.py [--size MB] [--spacing KB] [--repeats N]
+#
+# History:
+#   2026-Oct-18 - Request user-020
+#     - Created.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import add_build_and_date  # noqa: E402
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+FILLER_LINE = b":10010000214601360121470136007EFE09D2190140\r\n"
+
+# Values the same length as "$BUILD" and "$DATE", and of different lengths.
+SAME_LENGTH_VALUES = {"BUILD": "123456", "DATE": "18/10"}
+OTHER_LENGTH_VALUES = {"BUILD": "1234", "DATE": "2026/10/18"}
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+
+# ***************************************************************************************************************************************************
+# write_file
+#   Writes a file of about size bytes, with $BUILD and $DATE in turn every spacing bytes.
+# ***************************************************************************************************************************************************
+def write_file(file_name, size, spacing):
+    block = FILLER_LINE * max(1, spacing // len(FILLER_LINE))
+    with open(file_name, "wb") as file:
+        written = 0
+        placeholders = [b"$BUILD", b"$DATE"]
+        while written < size:
+            file.write(block)
+            file.write(placeholders[0])
+            placeholders.reverse()
+            written += len(block) + 6
+
+
+# ***************************************************************************************************************************************************
+# run_stamp
+#   Stamps a fresh copy of the file, and returns the time the stamp took in seconds and its peak traced memory in bytes (0 unless trace is
+#   asserted).
+# ***************************************************************************************************************************************************
+def run_stamp(stamper, source, target, trace=False):
+    shutil.copyfile(source, target)
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    stamper.stamp(target)
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    parser = argparse.ArgumentParser(description="Benchmarks add_build_and_date.py on a large file.")
+    parser.add_argument("--size", type=int, default=64, help="Size of the file in MB (Default = 64)")
+    parser.add_argument("--spacing", type=int, default=256, help="KB between placeholders (Default = 256)")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs of each stamp, of which the best is reported (Default = 3)")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    same = True
+    try:
+        source = os.path.join(directory, "source.hex")
+        write_file(source, args.size * 1024 * 1024, args.spacing * 1024)
+
+        print("File:  {:.1f} MB".format(os.path.getsize(source) / 1e6))
+        print("{:<16}{:<20}{:>12}{:>20}".format("Values", "Stamp", "Time (ms)", "Peak memory (KB)"))
+        for label, values in (("Same length", SAME_LENGTH_VALUES), ("Other length", OTHER_LENGTH_VALUES)):
+            outputs = []
+            # A size no file reaches means every file is read rather than mapped.
+            for name, mmap_size in (("Read", sys.maxsize), ("Memory mapped", 0)):
+                stamper = add_build_and_date.Stamper(values, mmap_size)
+                target = os.path.join(directory, "target.hex")
+                elapsed = min(run_stamp(stamper, source, target)[0] for _ in range(args.repeats))
+                peak = run_stamp(stamper, source, target, trace=True)[1]
+                print("{:<16}{:<20}{:>12.1f}{:>20.0f}".format(label, name, 1000 * elapsed, peak / 1024))
+                with open(target, "rb") as file:
+                    outputs.append(file.read())
+            same = same and (outputs[0] == outputs[1])
+        print("Same output:  {}".format("yes" if same else "NO"))
+    finally:
+        shutil.rmtree(directory)
+
+    sys.exit(0 if same else 1)
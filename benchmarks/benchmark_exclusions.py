@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Compares the list based exclusion check that makeLintFileList.py used to do with the compiled ExclusionFilter. A synthetic tree of source
+#   file paths is generated in memory, along with a mix of 'f' and 'd' style exclusions, and both filters are timed against it.
+#
+#   The list based check costs O(files x exclusions), so by default it is only timed on a sample of the files and the total is extrapolated.
+#   Both filters must agree on every sampled file.
+#
+#   Usage: python benchmark_exclusions.py [--files N] [--exclusions N] [--legacy-sample N]
+#
+# History:
+#   2026-Oct-18 - Request user-002
+#     - Created.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import makeLintFileList  # noqa: E402
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+FILES_PER_DIR = 20
+DIRS_PER_LEVEL = 8
+SEED = 1090601
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+
+# ***************************************************************************************************************************************************
+# make_tree
+#   Returns a list of file_count file paths spread over a tree of directories, similar to what the 'i' command produces.
+# ***************************************************************************************************************************************************
+def make_tree(file_count):
+    root = os.path.abspath(os.path.join("root", "Indy", "source"))
+    files = []
+    dirs = [root]
+    ix = 0
+    while len(files) < file_count:
+        directory = dirs[ix]
+        ix += 1
+        for child in range(DIRS_PER_LEVEL):
+            dirs.append(os.path.join(directory, "module_{}".format(child)))
+        for file_ix in range(FILES_PER_DIR):
+            files.append(os.path.join(directory, "file_{}.c".format(file_ix)))
+    return files[:file_count], dirs
+
+
+# ***************************************************************************************************************************************************
+# legacy_not_excluded
+#   The check makeLintFileList.py did before the ExclusionFilter was added.
+# ***************************************************************************************************************************************************
+def legacy_not_excluded(line, exclude_file_list, exclude_dir_list):
+    path = os.path.dirname(line)
+    excluded = (line in exclude_file_list) or (path in exclude_dir_list)
+    return not excluded
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    parser = argparse.ArgumentParser(description="Benchmarks makeLintFileList.py exclusion filtering.")
+    parser.add_argument("--files", type=int, default=100000, help="Number of synthetic files (Default = 100000)")
+    parser.add_argument("--exclusions", type=int, default=10000, help="Number of exclusions (Default = 10000)")
+    parser.add_argument("--legacy-sample", type=int, default=2000, help="Files timed with the list based check (Default = 2000)")
+    args = parser.parse_args()
+
+    rng = random.Random(SEED)
+    files, dirs = make_tree(args.files)
+
+    # Ten percent directory exclusions, the rest file exclusions like an expanded 'r' command. Half of the file exclusions do not exist, which is
+    # the worst case for the list based check.
+    dir_count = args.exclusions // 10
+    exclude_dir_list = rng.sample(dirs[:len(files) // FILES_PER_DIR], min(dir_count, len(files) // FILES_PER_DIR))
+    exclude_file_list = rng.sample(files, (args.exclusions - len(exclude_dir_list)) // 2)
+    exclude_file_list += [path + ".missing" for path in rng.sample(files, args.exclusions - len(exclude_dir_list) - len(exclude_file_list))]
+
+    start = time.perf_counter()
+    exclusions = makeLintFileList.ExclusionFilter(exclude_file_list, exclude_dir_list)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    kept = [path for path in files if not exclusions.is_excluded(path)]
+    filter_time = time.perf_counter() - start
+
+    sample = files[::max(1, len(files) // args.legacy_sample)][:args.legacy_sample]
+    start = time.perf_counter()
+    legacy = [legacy_not_excluded(path, exclude_file_list, exclude_dir_list) for path in sample]
+    legacy_time = time.perf_counter() - start
+    legacy_total = legacy_time * len(files) / len(sample)
+
+    mismatches = sum(1 for path, result in zip(sample, legacy) if result == exclusions.is_excluded(path))
+
+    print("Files:                 {}".format(len(files)))
+    print("Exclusions:            {} files, {} directories".format(len(exclude_file_list), len(exclude_dir_list)))
+    print("Files kept:            {}".format(len(kept)))
+    print("ExclusionFilter:       {:.3f} s compile, {:.3f} s filter ({:.2f} us/file)".format(
+        compile_time, filter_time, 1e6 * filter_time / len(files)))
+    print("List based (sampled):  {:.3f} s for {} files ({:.2f} us/file), ~{:.1f} s extrapolated".format(
+        legacy_time, len(sample), 1e6 * legacy_time / len(sample), legacy_total))
+    print("Speed-up:              ~{:.0f}x".format(legacy_total / (compile_time + filter_time)))
+    print("Mismatches in sample:  {}".format(mismatches))
+
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Compares the string building move_version_info.py used to do with its streaming merge_version_info. A doxygen version history page of
+#   --entries entries (several MB by default) and a page holding one new entry are generated in a temporary directory, and the new entry page is
+#   merged with the history both ways.
+#
+#   The old merge holds both pages in memory as strings, so its peak memory grows with the size of the history. The streaming merge only holds
+#   a line at a time. Peak memory is measured with tracemalloc, in a separate run from the timing since tracing slows Python down. Both merges
+#   must give the same file.
+#
+#   Each timing is the best of --repeats runs, as the other processes on a build machine can slow any single run.
+#
+#   Usage: python benchmark_move_version_info.py [--entries N] [--repeats N]
+#
+# History:
+#   2026-Oct-18 - Request user-017
+#     - Created.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import move_version_info  # noqa: E402
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+PAGE_HEAD = """<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "https://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head>
+<title>Version History</title>
+</head>
+<body>
+<div class="header">
+  <div class="headertitle"><div class="title">Version History </div></div>
+</div><!--header-->
+<div class="contents">
+"""
+
+PAGE_TAIL = """</div><!-- contents -->
+<hr class="footer"/><address class="footer"><small>Generated by doxygen</small></address>
+</body>
+</html>
+"""
+
+ENTRY_TEMPLATE = """<h1><a class="anchor" id="version_{0}"></a>Version 1.{0} Build {0}</h1>
+<p>Released 2026-Oct-18.</p>
+<ul>
+<li>Case {0}: Fixed the handling of fault {0} in the I/O gate keeper task.</li>
+<li>Case {0}: Updated the CAN J1939 parameter table to revision {0}.</li>
+<li>Case {0}: Increased the stack of the logger task.</li>
+</ul>
+"""
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+
+# ***************************************************************************************************************************************************
+# write_page
+#   Writes a version history page holding the entries numbered first to last, newest first.
+# ***************************************************************************************************************************************************
+def write_page(file_name, first, last):
+    with open(file_name, "w") as file:
+        file.write(PAGE_HEAD)
+        for number in range(last, first - 1, -1):
+            file.write(ENTRY_TEMPLATE.format(number))
+        file.write(PAGE_TAIL)
+
+
+# ***************************************************************************************************************************************************
+# legacy_move_version_info
+#   The merge move_version_info.py did before it was streamed.
+# ***************************************************************************************************************************************************
+def legacy_move_version_info(from_file_name, to_file_name):
+    from_file = open(from_file_name, "r")
+    read_lines = False
+    old_version_info = ""
+    for line in from_file:
+        if (line.find(move_version_info.CONTENTS_DIV_CLOSE) > -1):
+            read_lines = False
+        if (read_lines):
+            old_version_info += line
+        if (line.find(move_version_info.CONTENTS_DIV_OPEN) > -1):
+            read_lines = True
+    from_file.close()
+
+    to_file = open(to_file_name, "r")
+    new_version_info = ""
+    for line in to_file:
+        if (line.find(move_version_info.CONTENTS_DIV_CLOSE) > -1):
+            new_version_info += old_version_info
+        new_version_info += line
+    to_file.close()
+
+    to_file = open(to_file_name, "w")
+    to_file.write(new_version_info)
+    to_file.close()
+
+
+# ***************************************************************************************************************************************************
+# run_merge
+#   Merges the history into a fresh copy of the new entry page, and returns the time the merge took in seconds and its peak traced memory in bytes
+#   (0 unless trace is asserted).
+# ***************************************************************************************************************************************************
+def run_merge(merge, history, entry, target, trace=False):
+    shutil.copyfile(entry, target)
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    merge(history, target)
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    parser = argparse.ArgumentParser(description="Benchmarks move_version_info.py on a large version history page.")
+    parser.add_argument("--entries", type=int, default=20000, help="Number of entries in the version history (Default = 20000)")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs of each merge, of which the best is reported (Default = 5)")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        history = os.path.join(directory, "history.html")
+        entry = os.path.join(directory, "entry.html")
+        write_page(history, 1, args.entries)
+        write_page(entry, args.entries + 1, args.entries + 1)
+
+        results = {}
+        outputs = {}
+        for name, merge in (("Strings", legacy_move_version_info), ("Streaming", move_version_info.merge_version_info)):
+            target = os.path.join(directory, "{}.html".format(name))
+            elapsed = min(run_merge(merge, history, entry, target)[0] for _ in range(args.repeats))
+            peak = run_merge(merge, history, entry, target, trace=True)[1]
+            results[name] = (elapsed, peak)
+            with open(target, "rb") as file:
+                outputs[name] = file.read()
+
+        print("History page:  {:.1f} MB, {} entries".format(os.path.getsize(history) / 1e6, args.entries))
+        print("{:<12}{:>12}{:>20}".format("Merge", "Time (ms)", "Peak memory (KB)"))
+        for name, (elapsed, peak) in results.items():
+            print("{:<12}{:>12.1f}{:>20.0f}".format(name, 1000 * elapsed, peak / 1024))
+        same = outputs["Strings"] == outputs["Streaming"]
+        print("Same output:   {}".format("yes" if same else "NO"))
+    finally:
+        shutil.rmtree(directory)
+
+    sys.exit(0 if same else 1)
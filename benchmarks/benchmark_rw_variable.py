@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Compares the per-line #define search rw_variable.py used to do with its index_buffer. Headers of increasing size are generated in memory
+#   (#defines, comments and code), and a sample of variables spread through each header is read both ways.
+#
+#   The old search compiles its patterns for every line and stops at the variable, so its cost per variable grows with the size of the file.
+#   The index is built once per file by a single scan of the whole file, after which the cost per variable should be the same for every size.
+#
+#   Each timing is the best of --repeats runs, as the other processes on a build machine can slow any single run.
+#
+#   Usage: python benchmark_rw_variable.py [--lines N] [--variables N] [--repeats N]
+#
+# History:
+#   2026-Oct-18 - Request user-011
+#     - Created.
+#   2026-Oct-18 - Request user-012
+#     - Time index_buffer, which scans the whole file at once, instead of the line by line index_variables.
+#     - Report the best of --repeats runs.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import rw_variable  # noqa: E402
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+LINE_TEMPLATES = [
+    "#define GENERATED_DEFINE_{0}    ({0}U)    /* Generated value {0}. */\n",
+    "/* Comment line {0}, describing the next block of code. */\n",
+    "static const uint32_t generated_table_{0}[] = {{ {0}U, {0}U }};\n",
+    "#define GENERATED_MASK_{0}      (0x{0:X}U) // Mask {0}\n",
+    "\n",
+]
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+
+# ***************************************************************************************************************************************************
+# make_header
+#   Returns line_count generated header lines.
+# ***************************************************************************************************************************************************
+def make_header(line_count):
+    return [LINE_TEMPLATES[ix % len(LINE_TEMPLATES)].format(ix) for ix in range(line_count)]
+
+
+# ***************************************************************************************************************************************************
+# legacy_read_variable_pound_define
+#   The check rw_variable.py did for every line before index_variables was added (string values only).
+# ***************************************************************************************************************************************************
+def legacy_read_variable_pound_define(variable, line):
+    result = None
+
+    line = re.sub(re.compile(r'/\*.*?\*/', re.DOTALL), " ", line)
+    r_xp = r'[ \t]*#define[ \t]+' + variable + r'[ \t]+.+'
+    if (re.match(r_xp, line)):
+        line = re.sub(re.compile(r'/[\*/].*', re.DOTALL), " ", line)
+        line = re.sub(re.compile(r'#define[ \t]+' + variable), "", line)
+        line = line.strip()
+        if (line != ""):
+            result = line
+
+    return result
+
+
+# ***************************************************************************************************************************************************
+# legacy_read_variable_from_lines
+#   The search rw_variable.py did for each variable before index_variables was added.
+# ***************************************************************************************************************************************************
+def legacy_read_variable_from_lines(variable, content):
+    for line in content:
+        value = legacy_read_variable_pound_define(variable, line)
+        if (value is not None):
+            return value
+    return None
+
+
+# ***************************************************************************************************************************************************
+# best_time
+#   Returns the result of function() and the shortest time in seconds it took over repeats calls.
+# ***************************************************************************************************************************************************
+def best_time(function, repeats):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    return result, best
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    parser = argparse.ArgumentParser(description="Benchmarks rw_variable.py #define lookups.")
+    parser.add_argument("--lines", type=int, default=50000, help="Lines in the largest generated header (Default = 50000)")
+    parser.add_argument("--variables", type=int, default=20, help="Variables read from each header (Default = 20)")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs of each timing, the best of which is reported (Default = 5)")
+    args = parser.parse_args()
+
+    print("{:>8}  {:>16}  {:>16}  {:>16}".format("Lines", "Old per variable", "Scan and index", "Indexed lookup"))
+    mismatches = 0
+    for line_count in (args.lines // 100, args.lines // 10, args.lines):
+        content = make_header(line_count)
+        buffer = "".join(content).encode("utf-8")
+        # Variables spread evenly through the file, so the old search reads half of it on average.
+        defines = [ix for ix in range(line_count) if ix % len(LINE_TEMPLATES) == 0]
+        variables = ["GENERATED_DEFINE_{}".format(ix) for ix in defines[::max(1, len(defines) // args.variables)][:args.variables]]
+
+        legacy, legacy_time = best_time(lambda: [legacy_read_variable_from_lines(variable, content) for variable in variables], args.repeats)
+        legacy_time /= len(variables)
+
+        index, build_time = best_time(lambda: rw_variable.index_buffer(buffer), args.repeats)
+
+        # Lookups are too quick to time one at a time, so each is repeated.
+        repeats = 1000
+        start = time.perf_counter()
+        for _ in range(repeats):
+            indexed = [rw_variable.indexed_value(index.get(variable)) for variable in variables]
+        lookup_time = (time.perf_counter() - start) / (repeats * len(variables))
+
+        mismatches += sum(1 for old, new in zip(legacy, indexed) if old != new)
+        print("{:>8}  {:>13.3f} ms  {:>13.3f} ms  {:>13.3f} us".format(line_count, 1e3 * legacy_time, 1e3 * build_time, 1e6 * lookup_time))
+
+    print("Mismatches:  {}".format(mismatches))
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Compares reading a variable with rw_variable.py, as env.bat does without a server, with reading it through rw_variable_server.py. A server is
+#   started in this process on a free port, and a generated header (see benchmark_rw_variable.py) is read from a temporary directory:
+#     - Script : "python rw_variable.py", a new interpreter that reads and scans the header every time.
+#     - Client : "python -S rw_variable_client.py", a new interpreter that only sends the command line to the server.
+#     - Request: A request sent from this process, which is what a call costs once the interpreter is running.
+#
+#   All three must print the same value. The header is then changed twice in quick succession without its size or modification time changing,
+#   to check the server doesn't answer from a stale index.
+#
+#   Usage: python benchmark_rw_variable_server.py [--lines N] [--calls N]
+#
+# History:
+#   2026-Oct-18 - Request user-014
+#     - Created.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+REPOSITORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, REPOSITORY)
+import benchmark_rw_variable  # noqa: E402
+import rw_variable_client  # noqa: E402
+import rw_variable_server  # noqa: E402
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+HEADER_NAME = "version.h"
+VARIABLE = "GENERATED_DEFINE_0"
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+
+# ***************************************************************************************************************************************************
+# time_calls
+#   Calls function() count times, and returns the output of the last call and the average time per call in seconds.
+# ***************************************************************************************************************************************************
+def time_calls(function, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        output = function()
+    return output, (time.perf_counter() - start) / count
+
+
+# ***************************************************************************************************************************************************
+# run_script
+#   Runs a script with the read command line in a new interpreter, and returns what it printed.
+# ***************************************************************************************************************************************************
+def run_script(python_options, script, directory, port):
+    environment = dict(os.environ, **{rw_variable_client.PORT_VARIABLE: str(port)})
+    result = subprocess.run([sys.executable] + python_options + [os.path.join(REPOSITORY, script), HEADER_NAME, "--read", "--define", "--string",
+                                                                VARIABLE], cwd=directory, env=environment, stdout=subprocess.PIPE)
+    return result.stdout.decode().strip()
+
+
+# ***************************************************************************************************************************************************
+# request_value
+#   Reads the variable through the server from this process, and returns what it printed.
+# ***************************************************************************************************************************************************
+def request_value(directory, port):
+    response = rw_variable_client.send_request(rw_variable_client.connect(port),
+                                               {"cwd": directory, "args": [HEADER_NAME, "--read", "--define", "--string", VARIABLE]})
+    return response["stdout"].strip()
+
+
+# ***************************************************************************************************************************************************
+# write_value
+#   Overwrites the first digit of the variable's value in the header, which keeps the size of the header the same.
+# ***************************************************************************************************************************************************
+def write_value(header, digit):
+    with open(header, "r+b") as file:
+        file.seek(len("#define {}    (".format(VARIABLE)))
+        file.write(digit)
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    parser = argparse.ArgumentParser(description="Benchmarks rw_variable_server.py against running rw_variable.py.")
+    parser.add_argument("--lines", type=int, default=5000, help="Lines in the generated header (Default = 5000)")
+    parser.add_argument("--calls", type=int, default=20, help="Reads timed each way (Default = 20)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        header = os.path.join(directory, HEADER_NAME)
+        with open(header, "w", newline="") as file:
+            file.write("".join(benchmark_rw_variable.make_header(args.lines)))
+
+        server = rw_variable_server.RwVariableServer(0, directory)
+        port = server.server_address[1]
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            script, script_time = time_calls(lambda: run_script([], "rw_variable.py", directory, port), args.calls)
+            client, client_time = time_calls(lambda: run_script(["-S"], "rw_variable_client.py", directory, port), args.calls)
+            request, request_time = time_calls(lambda: request_value(directory, port), args.calls)
+
+            # Another tool writes the header and the server reads it, then the tool writes it again straight away. On a file system with coarse
+            # times the size and modification time are unchanged, which utime() stands in for here.
+            write_value(header, b"8")
+            stat = os.stat(header)
+            request_value(directory, port)
+            write_value(header, b"9")
+            os.utime(header, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            changed = request_value(directory, port)
+        finally:
+            server.shutdown()
+            thread.join()
+            server.server_close()
+
+    print("Header:   {} lines".format(args.lines))
+    print("Script:   {:8.2f} ms per read".format(1e3 * script_time))
+    print("Client:   {:8.2f} ms per read".format(1e3 * client_time))
+    print("Request:  {:8.2f} ms per read".format(1e3 * request_time))
+    print("Values:   script {}, client {}, request {}, after a change it could miss {}".format(script, client, request, changed))
+
+    failed = (len({script, client, request}) != 1) or (changed != "(9U)")
+    sys.exit(1 if failed else 0)
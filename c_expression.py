@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Evaluates the constant integer expressions that #define values are made of, such as "((uint32)BASE_STACK_SIZE * 2U)" or "(1U << 4)". The
+#   expression may use:
+#     - Integer literals: decimal, hexadecimal (0x), octal (leading 0) and binary (0b), with any u/U and l/L/ll/LL suffix, and character
+#       literals such as 'A'.
+#     - The C operators for integers, with C precedence: unary + - ~ !, * / %, + -, << >>, < <= > >=, == !=, &, ^, |, &&, || and ?:.
+#     - Parentheses, and casts to integer types such as (uint32) or (unsigned long).
+#     - Other macros, whose values are found through a lookup function.
+#     - The defined operator of #if lines, "defined NAME" or "defined(NAME)", when a function saying whether a macro is defined is given.
+#
+#   Every value has a C integer type, and the arithmetic is that of the target, whose int and long are 32 bits and long long 64 bits
+#   (INT_BITS, LONG_BITS and LONG_LONG_BITS). A literal has the first type its value fits in, as C gives it from its suffix and base, operands
+#   smaller than int are promoted to int, and the usual arithmetic conversions apply, so "~0U" is 4294967295, "0xFFFFFFFFU + 1" is 0 and
+#   "-1 < 0U" is 0. Unsigned arithmetic wraps around; signed overflow, and shifts by a negative amount or by the width of the type or more, are
+#   errors, as C leaves them undefined. Casts convert to their type, wrapping around as two's complement does; boolean is an unsigned char and
+#   bool is C99's _Bool. / and % truncate towards zero as they do in C. As in C, the right operand of && and || is only evaluated when the left
+#   one doesn't decide the result, and only the chosen operand of ?: is evaluated, so "0 && (1 / 0)" is 0 and "1 || UNDEFINED" is 1. The
+#   operands that aren't evaluated must still be valid expressions.
+#
+#   With preprocessor set, the expression is evaluated as the condition of an #if line is: every integer type is intmax_t or uintmax_t (both 64
+#   bits), so "~0U > 0xFFFF" is 1, and casts are ignored.
+#
+#   MacroEvaluator evaluates macros that refer to other macros, keeping the value of each macro it evaluates so every macro is only evaluated once,
+#   and reports macros that refer to themselves through others.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - ISO/IEC 9899:1999 (C99), 6.4.4 Constants and 6.5 Expressions.
+#
+# History:
+#   2026-Oct-18 - Request user-015
+#     - Created.
+#   2026-Oct-18 - Request user-024
+#     - Added the defined operator, for the conditions of #if and #elif lines.
+#   2026-Oct-18 - Request user-015
+#     - Stopped evaluating the operands of &&, || and ?: that C doesn't evaluate.
+#   2026-Oct-18 - Request user-024
+#     - Added the preprocessor mode, with the intmax_t and uintmax_t arithmetic of #if lines.
+#   2026-Oct-18 - Request user-016
+#     - Values are evaluated with the integer types of the target and C's conversions, rather than as Python integers that never wrap around.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import re
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+
+# One token of an expression, after any whitespace.
+TOKEN = re.compile(r"""\s*(?:
+      (?P<number>(?:0[xX][0-9a-fA-F]+|0[bB][01]+|\d+)(?:[uU](?:ll|LL|l|L)?|(?:ll|LL|l|L)[uU]?)?)(?![\w.])
+    | (?P<char>'(?:\\[^']+|[^'\\])')
+    | (?P<name>[A-Za-z_]\w*)
+    | (?P<operator><<|>>|<=|>=|==|!=|&&|\|\||[-+*/%<>&^|!~?:()])
+    )""", re.VERBOSE)
+
+INTEGER_SUFFIX = re.compile(r"[uUlL]+$")
+
+# The fixed width integer types, such as uint32, sint16 or int8_t, and uint and sint.
+FIXED_WIDTH_TYPE = re.compile(r"([us])?int(8|16|32|64)?(_t)?$")
+
+# The names a cast can be made of. A parenthesised list of these names before an operand is a cast, and anything else in parentheses is an
+# expression.
+CAST_TYPE = re.compile(r"(?:unsigned|signed|int|long|short|char|size_t|u?intptr_t|boolean|bool|[us]?int(?:8|16|32|64)?(?:_t)?)$")
+
+# The binary operators by precedence, higher binding tighter.
+BINARY_PRECEDENCE = {
+    "||": 1, "&&": 2, "|": 3, "^": 4, "&": 5,
+    "==": 6, "!=": 6, "<": 7, "<=": 7, ">": 7, ">=": 7,
+    "<<": 8, ">>": 8, "+": 9, "-": 9, "*": 10, "/": 10, "%": 10,
+}
+# The precedence of ?:, which is below every binary operator.
+CONDITIONAL_PRECEDENCE = 0
+
+# The number of bits of int, long and long long on the target.
+INT_BITS = 32
+LONG_BITS = 32
+LONG_LONG_BITS = 64
+# The number of bits of intmax_t and uintmax_t, which every integer type is in the preprocessor mode.
+INTMAX_BITS = 64
+
+# The type of C99's _Bool, as (bits, unsigned). Converting to it gives 1 for any value that isn't 0.
+BOOL_TYPE = (1, True)
+
+# The operators whose result is an int whatever the types of their operands.
+INT_RESULT_OPERATORS = {"||", "&&", "==", "!=", "<", "<=", ">", ">="}
+
+# The values of the escape sequences of character literals.
+CHAR_ESCAPES = {"n": 10, "t": 9, "r": 13, "0": 0, "a": 7, "b": 8, "f": 12, "v": 11, "\\": 92, "'": 39, '"': 34, "?": 63}
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# Parses and evaluates one expression. See evaluate().
+class ExpressionParser:
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   text         : The expression.
+    #   lookup       : A function that returns the value of a macro name, and raises ValueError if it has none. The value is an integer, which
+    #                  has the type a decimal literal of it would have, or a (value, type) tuple such as MacroEvaluator.typed_value() returns.
+    #   defined      : A function that returns whether a macro name is defined, or None if "defined" is an ordinary name.
+    #   preprocessor : If asserted, the arithmetic is that of #if lines.
+    # ***********************************************************************************************************************************************
+    def __init__(self, text, lookup, defined=None, preprocessor=False):
+        self.text = text
+        self.lookup = lookup
+        self.defined = defined
+        self.preprocessor = preprocessor
+        if preprocessor:
+            self.int_bits = self.long_bits = self.long_long_bits = INTMAX_BITS
+        else:
+            self.int_bits, self.long_bits, self.long_long_bits = INT_BITS, LONG_BITS, LONG_LONG_BITS
+        # Types are (bits, unsigned) tuples, and values (value, type) tuples.
+        self.int_type = (self.int_bits, False)
+        self.tokens = tokenize(text)
+        self.position = 0
+        # Above 0 while parsing an operand that isn't evaluated. Names then aren't looked up and operators aren't applied, so they can't fail.
+        self.skipping = 0
+
+    # ***********************************************************************************************************************************************
+    # Returns the value of the whole expression, as a (value, type) tuple.
+    # ***********************************************************************************************************************************************
+    def parse(self):
+        value = self.expression(CONDITIONAL_PRECEDENCE)
+        if self.position < len(self.tokens):
+            raise ValueError("Unexpected '{}' in '{}'".format(self.tokens[self.position][1], self.text))
+        return value
+
+    # ***********************************************************************************************************************************************
+    # Returns an integer as a value of a type, int if none is given. An unsigned value wraps around; a signed value that doesn't fit is an error.
+    # ***********************************************************************************************************************************************
+    def integer(self, value, type=None):
+        if type is None:
+            type = self.int_type
+        if type[1]:
+            return value % (1 << type[0]), type
+        if not (-(1 << (type[0] - 1)) <= value < (1 << (type[0] - 1))):
+            raise ValueError("Overflow in '{}'".format(self.text))
+        return value, type
+
+    # ***********************************************************************************************************************************************
+    # Returns whether a value is non-zero.
+    # ***********************************************************************************************************************************************
+    def truth(self, value):
+        return bool(value[0])
+
+    # ***********************************************************************************************************************************************
+    # Returns an integer as a value of the first of the types it fits in, or raises ValueError if it fits in none.
+    #
+    # Parameters:
+    #   value    : The integer.
+    #   sizes    : The numbers of bits of the types, in order.
+    #   unsigned : The signedness of the types of each size, in order: (False,), (True,) or (False, True).
+    #   text     : The literal, for the error message.
+    # ***********************************************************************************************************************************************
+    def first_fit(self, value, sizes, unsigned, text):
+        for bits in sizes:
+            for is_unsigned in unsigned:
+                if (0 if is_unsigned else -(1 << (bits - 1))) <= value < (1 << (bits - int(not is_unsigned))):
+                    return value, (bits, is_unsigned)
+        raise ValueError("{} is too big in '{}'".format(text, self.text))
+
+    # ***********************************************************************************************************************************************
+    # Returns the value of an integer literal, of the type C gives it: the first of int, long and long long it fits in, or of those of them the
+    # l/L and ll/LL suffixes allow. With a u/U suffix the types are unsigned; a hexadecimal, octal or binary literal may also be unsigned when
+    # only unsigned fits.
+    # ***********************************************************************************************************************************************
+    def literal(self, text):
+        value = int_literal(text)
+        suffix = INTEGER_SUFFIX.search(text)
+        suffix = suffix.group(0).lower() if suffix else ""
+        if "ll" in suffix:
+            sizes = (self.long_long_bits,)
+        elif "l" in suffix:
+            sizes = (self.long_bits, self.long_long_bits)
+        else:
+            sizes = (self.int_bits, self.long_bits, self.long_long_bits)
+        if "u" in suffix:
+            unsigned = (True,)
+        elif text.startswith("0") and (len(text) > 1):
+            unsigned = (False, True)
+        else:
+            unsigned = (False,)
+        return self.first_fit(value, sizes, unsigned, text)
+
+    # ***********************************************************************************************************************************************
+    # Returns a value promoted as C promotes an operand: types smaller than int become int.
+    # ***********************************************************************************************************************************************
+    def promote(self, value):
+        if value[1][0] < self.int_bits:
+            return value[0], self.int_type
+        return value
+
+    # ***********************************************************************************************************************************************
+    # Returns the type the usual arithmetic conversions give for two promoted types. If both have the same signedness, the larger is used;
+    # otherwise the unsigned one, unless the signed one is larger and so can hold all its values.
+    # ***********************************************************************************************************************************************
+    def common_type(self, left, right):
+        if left[1] == right[1]:
+            return max(left[0], right[0]), left[1]
+        unsigned, signed = (left, right) if left[1] else (right, left)
+        return unsigned if unsigned[0] >= signed[0] else signed
+
+    # ***********************************************************************************************************************************************
+    # Returns a value converted to a type. A value that doesn't fit wraps around, as two's complement does.
+    # ***********************************************************************************************************************************************
+    def convert(self, value, type):
+        if type == BOOL_TYPE:
+            return int(self.truth(value)), type
+        wrapped = value[0] % (1 << type[0])
+        if (not type[1]) and (wrapped >= (1 << (type[0] - 1))):
+            wrapped -= 1 << type[0]
+        return wrapped, type
+
+    # ***********************************************************************************************************************************************
+    # Returns the type a cast is to, from the names it is made of.
+    # ***********************************************************************************************************************************************
+    def cast_type(self, names):
+        if names == ["bool"]:
+            return BOOL_TYPE
+        if names == ["boolean"]:
+            return 8, True
+        if names[-1] in ("size_t", "uintptr_t"):
+            return self.long_bits, True
+        if names[-1] == "intptr_t":
+            return self.long_bits, False
+
+        fixed = FIXED_WIDTH_TYPE.match(names[-1])
+        if fixed and any(fixed.groups()):
+            return (int(fixed.group(2)) if fixed.group(2) else self.int_bits), fixed.group(1) == "u"
+        if "char" in names:
+            bits = 8
+        elif "short" in names:
+            bits = 16
+        elif names.count("long") > 1:
+            bits = self.long_long_bits
+        elif "long" in names:
+            bits = self.long_bits
+        else:
+            bits = self.int_bits
+        return bits, "unsigned" in names
+
+    # ***********************************************************************************************************************************************
+    # Returns the result of a unary operator applied to a value.
+    # ***********************************************************************************************************************************************
+    def apply_unary(self, operator, operand):
+        if operator == "!":
+            return self.integer(int(not self.truth(operand)))
+        value, type = self.promote(operand)
+        return self.integer({"-": -value, "+": value, "~": ~value}[operator], type)
+
+    # ***********************************************************************************************************************************************
+    # Returns the result of a binary operator applied to two values. While skipping, the result is 0, of the type the operator would give.
+    # ***********************************************************************************************************************************************
+    def apply_binary(self, operator, left, right):
+        left = self.promote(left)
+        right = self.promote(right)
+        common = self.common_type(left[1], right[1])
+        if operator in INT_RESULT_OPERATORS:
+            type = self.int_type
+        elif operator in ("<<", ">>"):
+            # The result has the type of the left operand.
+            type = left[1]
+        else:
+            type = common
+        if self.skipping:
+            return 0, type
+
+        if operator in ("<<", ">>"):
+            if not (0 <= right[0] < type[0]):
+                raise ValueError("Shift by {} in '{}'".format(right[0], self.text))
+            if (operator == "<<") and (not type[1]) and (left[0] < 0):
+                raise ValueError("Shift of a negative value in '{}'".format(self.text))
+            return self.integer(left[0] << right[0] if operator == "<<" else left[0] >> right[0], type)
+        if operator not in ("&&", "||"):
+            # Converted to the common type, so negative values wrap around when it is unsigned.
+            left = self.convert(left, common)
+            right = self.convert(right, common)
+        return self.integer(apply_binary(operator, left[0], right[0], self.text), type)
+
+    # ***********************************************************************************************************************************************
+    # Returns the result of ?: from the values of the two operands, of the type both are converted to.
+    # ***********************************************************************************************************************************************
+    def choose(self, condition, if_true, if_false):
+        if_true = self.promote(if_true)
+        if_false = self.promote(if_false)
+        return self.convert(if_true if condition else if_false, self.common_type(if_true[1], if_false[1]))
+
+    # ***********************************************************************************************************************************************
+    # Returns the next token as a (kind, text) tuple without using it, or (None, None) at the end.
+    # ***********************************************************************************************************************************************
+    def peek(self, offset=0):
+        if self.position + offset < len(self.tokens):
+            return self.tokens[self.position + offset]
+        return None, None
+
+    # ***********************************************************************************************************************************************
+    # Uses the next token, which must be the given operator.
+    # ***********************************************************************************************************************************************
+    def expect(self, operator):
+        if self.peek() != ("operator", operator):
+            raise ValueError("Expected '{}' in '{}'".format(operator, self.text))
+        self.position += 1
+
+    # ***********************************************************************************************************************************************
+    # Returns the value of the expression from the current token, made of operators that bind at least as tightly as minimum.
+    # ***********************************************************************************************************************************************
+    def expression(self, minimum):
+        value = self.unary()
+        while True:
+            kind, operator = self.peek()
+            if kind != "operator":
+                break
+
+            if operator == "?" and minimum <= CONDITIONAL_PRECEDENCE:
+                self.position += 1
+                condition = self.truth(value)
+                if_true = self.operand(CONDITIONAL_PRECEDENCE, not condition)
+                self.expect(":")
+                if_false = self.operand(CONDITIONAL_PRECEDENCE, condition)
+                value = self.choose(condition, if_true, if_false)
+                continue
+
+            precedence = BINARY_PRECEDENCE.get(operator)
+            if precedence is None or precedence < minimum:
+                break
+            self.position += 1
+            # Binary operators are left associative, so the right operand only takes operators that bind more tightly. The left operand of && and
+            # || may decide the result on its own, and then the right one isn't evaluated.
+            skip = (operator == "&&" and not self.truth(value)) or (operator == "||" and self.truth(value))
+            right = self.operand(precedence + 1, skip)
+            value = self.apply_binary(operator, value, right)
+        return value
+
+    # ***********************************************************************************************************************************************
+    # Returns the value of expression(minimum), or parses it without evaluating it if skip is set. The value of an operand that isn't evaluated
+    # is 0, of the type it would have.
+    # ***********************************************************************************************************************************************
+    def operand(self, minimum, skip):
+        if not skip:
+            return self.expression(minimum)
+        self.skipping += 1
+        try:
+            return self.expression(minimum)
+        finally:
+            self.skipping -= 1
+
+    # ***********************************************************************************************************************************************
+    # Returns the value of a unary expression: an operand with any unary operators and casts in front of it.
+    # ***********************************************************************************************************************************************
+    def unary(self):
+        kind, text = self.peek()
+        if kind is None:
+            raise ValueError("Unexpected end of '{}'".format(self.text))
+        self.position += 1
+
+        if kind == "number":
+            return self.literal(text)
+        if kind == "char":
+            return self.integer(char_literal(text))
+        if kind == "name":
+            if (text == "defined") and (self.defined is not None):
+                return self.defined_operand()
+            if self.skipping:
+                return self.integer(0)
+            value = self.lookup(text)
+            if isinstance(value, tuple):
+                return value
+            return self.first_fit(value, (self.int_bits, self.long_bits, self.long_long_bits), (False,), text)
+
+        if text == "(":
+            cast_length = self.cast_length()
+            if cast_length:
+                names = [name for _, name in self.tokens[self.position:self.position + cast_length - 1]]
+                self.position += cast_length
+                if self.preprocessor:
+                    return self.unary()
+                return self.convert(self.unary(), self.cast_type(names))
+            value = self.expression(CONDITIONAL_PRECEDENCE)
+            self.expect(")")
+            return value
+        if text in ("-", "+", "~", "!"):
+            # Only literals keep their values while skipping, and no unary operator can fail on one.
+            return self.apply_unary(text, self.unary())
+        raise ValueError("Unexpected '{}' in '{}'".format(text, self.text))
+
+    # ***********************************************************************************************************************************************
+    # Returns 1 if the macro named after "defined", with or without parentheses around it, is defined and 0 if it isn't.
+    # ***********************************************************************************************************************************************
+    def defined_operand(self):
+        parenthesised = self.peek() == ("operator", "(")
+        if parenthesised:
+            self.position += 1
+        kind, name = self.peek()
+        if kind != "name":
+            raise ValueError("Expected a macro name after defined in '{}'".format(self.text))
+        self.position += 1
+        if parenthesised:
+            self.expect(")")
+        if self.skipping:
+            return self.integer(0)
+        return self.integer(int(bool(self.defined(name))))
+
+    # ***********************************************************************************************************************************************
+    # Returns the number of tokens after a "(" that make up a cast, up to and including the ")", or 0 if it isn't a cast.
+    # ***********************************************************************************************************************************************
+    def cast_length(self):
+        length = 0
+        while self.peek(length)[0] == "name" and CAST_TYPE.match(self.peek(length)[1]):
+            length += 1
+        if length and self.peek(length) == ("operator", ")"):
+            return length + 1
+        return 0
+
+
+# Evaluates macros, which may refer to other macros. The value (or the error) of each macro is kept, so a macro that many others refer to is only
+# evaluated once.
+class MacroEvaluator:
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   lookup_text : A function that returns the text of a macro's value, or None if the macro isn't defined.
+    # ***********************************************************************************************************************************************
+    def __init__(self, lookup_text):
+        self.lookup_text = lookup_text
+        # Macro name to its value as a (value, type) tuple, or to the ValueError raised evaluating it.
+        self.results = {}
+        # The macros being evaluated, innermost last, to find macros that refer to themselves.
+        self.evaluating = []
+
+    # ***********************************************************************************************************************************************
+    # Returns the value of a macro as an integer. Raises ValueError if it isn't defined, isn't a constant integer expression, or refers to itself.
+    # ***********************************************************************************************************************************************
+    def value(self, name):
+        return self.typed_value(name)[0]
+
+    # ***********************************************************************************************************************************************
+    # Returns the value of a macro as a (value, type) tuple, for the lookup of other macros' expressions, which are evaluated with its type as
+    # they would be once it is replaced by its text. Raises ValueError as value() does.
+    # ***********************************************************************************************************************************************
+    def typed_value(self, name):
+        if name in self.results:
+            result = self.results[name]
+            if isinstance(result, ValueError):
+                raise result
+            return result
+
+        if name in self.evaluating:
+            cycle = self.evaluating[self.evaluating.index(name):] + [name]
+            raise ValueError("{} refers to itself ({})".format(name, " -> ".join(cycle)))
+
+        text = self.lookup_text(name)
+        if text is None:
+            result = ValueError("{} is not defined".format(name))
+        else:
+            self.evaluating.append(name)
+            try:
+                result = ExpressionParser(text, self.typed_value).parse()
+            except ValueError as error:
+                result = error
+            finally:
+                self.evaluating.pop()
+
+        # A macro in a cycle is only known to be in error from where the cycle was entered, so errors found inside a cycle aren't kept for the
+        # macros still being evaluated; each is kept once its own evaluation ends.
+        self.results[name] = result
+        if isinstance(result, ValueError):
+            raise result
+        return result
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# tokenize
+#   Returns the tokens of an expression as a list of (kind, text) tuples, where kind is "number", "char", "name" or "operator". Raises ValueError at
+#   anything else.
+# ***************************************************************************************************************************************************
+def tokenize(text):
+    tokens = []
+    position = 0
+    end = len(text.rstrip())
+    while position < end:
+        match = TOKEN.match(text, position)
+        if not match:
+            raise ValueError("Can't read '{}' in '{}'".format(text[position:end].strip(), text))
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+    return tokens
+
+
+# ***************************************************************************************************************************************************
+# int_literal
+#   Returns the value of a C integer literal, which may have a suffix. A leading 0 makes it octal, as in C.
+# ***************************************************************************************************************************************************
+def int_literal(text):
+    digits = INTEGER_SUFFIX.sub("", text)
+    if len(digits) > 1 and digits[0] == "0" and digits[1] not in "xXbB":
+        return int(digits, 8)
+    return int(digits, 0)
+
+
+# ***************************************************************************************************************************************************
+# char_literal
+#   Returns the value of a C character literal such as 'A', '\n', '\x41' or '\101'.
+# ***************************************************************************************************************************************************
+def char_literal(text):
+    body = text[1:-1]
+    if body[0] != "\\":
+        return ord(body)
+    if body[1] in "xX":
+        return int(body[2:], 16)
+    if body[1:].isdigit():
+        return int(body[1:], 8)
+    if body[1:] in CHAR_ESCAPES:
+        return CHAR_ESCAPES[body[1:]]
+    raise ValueError("Can't read the character literal {}".format(text))
+
+
+# ***************************************************************************************************************************************************
+# apply_binary
+#   Returns the result of a binary operator, as C gives it for integers. text is the whole expression, for error messages.
+# ***************************************************************************************************************************************************
+def apply_binary(operator, left, right, text):
+    if operator in ("/", "%"):
+        if right == 0:
+            raise ValueError("Division by zero in '{}'".format(text))
+        # C truncates towards zero, where Python's // rounds down.
+        quotient = abs(left) // abs(right)
+        if (left < 0) != (right < 0):
+            quotient = -quotient
+        return quotient if operator == "/" else left - quotient * right
+    if operator in ("<<", ">>") and right < 0:
+        raise ValueError("Negative shift in '{}'".format(text))
+
+    operations = {
+        "||": lambda: int(bool(left) or bool(right)),
+        "&&": lambda: int(bool(left) and bool(right)),
+        "|": lambda: left | right,
+        "^": lambda: left ^ right,
+        "&": lambda: left & right,
+        "==": lambda: int(left == right),
+        "!=": lambda: int(left != right),
+        "<": lambda: int(left < right),
+        "<=": lambda: int(left <= right),
+        ">": lambda: int(left > right),
+        ">=": lambda: int(left >= right),
+        "<<": lambda: left << right,
+        ">>": lambda: left >> right,
+        "+": lambda: left + right,
+        "-": lambda: left - right,
+        "*": lambda: left * right,
+    }
+    return operations[operator]()
+
+
+# ***************************************************************************************************************************************************
+# evaluate
+#   Returns the value of a constant integer expression.
+#
+#   Parameters:
+#       text    : The expression, for example "(BASE_STACK_SIZE * 2U)".
+#       lookup  : A function that returns the value of a macro name, as an integer or a (value, type) tuple, and raises ValueError if it has
+#                 none (for example MacroEvaluator.typed_value). Without it, any name is an error.
+#       defined : A function that returns whether a macro name is defined, for the defined operator of #if lines. Without it, "defined" is
+#                 looked up like any other name.
+#       preprocessor : If asserted, evaluate it with the intmax_t and uintmax_t arithmetic of #if lines.
+#
+#   Returns:
+#       The value as an integer. Raises ValueError if the text isn't a constant integer expression.
+# ***************************************************************************************************************************************************
+def evaluate(text, lookup=None, defined=None, preprocessor=False):
+    if lookup is None:
+        lookup = undefined
+    return ExpressionParser(text, lookup, defined, preprocessor).parse()[0]
+
+
+# ***************************************************************************************************************************************************
+# undefined
+#   The lookup for evaluate() when there are no macros.
+# ***************************************************************************************************************************************************
+def undefined(name):
+    raise ValueError("{} is not defined".format(name))
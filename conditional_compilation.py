@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Works out which files of a lint file list have no code left for a variant once its #if, #ifdef, #ifndef, #elif and #else lines are taken into
+#   account. The variants differ mainly in their -d options (-d_t_indy_075=1, ...), so much of the tree compiles to nothing for each of them.
+#   For example:
+#
+#   Usage: python conditional_compilation.py files.lnt -l project_specific.lnt -l GVI075.lnt
+#
+#   lists the files of files.lnt with no code for GVI075. makeLintFileList.py --variant leaves these files out of the list it writes.
+#
+#   Usage: python conditional_compilation.py --check
+#
+#   evaluates the conditions of CONDITION_CHECKS, which cover the parts of C that are easy to get wrong, and lists any that don't give the
+#   expected result.
+#
+#   Each file is followed as the preprocessor would: starting from the defines of the variant's .lnt files (see lnt_options.py), #define and
+#   #undef lines are applied and #include lines followed where they are compiled, and the condition of each #if and #elif line is evaluated with
+#   c_expression.py. As in C, the macros in a condition are replaced by their values before it is evaluated, with the intmax_t and uintmax_t
+#   arithmetic of #if lines, and a name that isn't a macro is 0. Names reserved for the compiler (starting with __ or _ and a capital letter)
+#   that aren't defined are taken as unknown rather than 0, as the compiler may define them. Only a file's own code counts: a .c file whose code
+#   is all inside #if blocks that aren't compiled has no code, whatever its headers declare. The code of a file that isn't a header, such as a
+#   .inc file holding a function body, is part of the file including it, so a .c file that compiles such an include has code.
+#
+#   Anything that can't be worked out is taken as possibly compiled, so a file is only ever left out when it certainly has no code: a condition
+#   using a function-like macro or something c_expression.py can't evaluate, and everything that depends on a macro defined or undefined under
+#   such a condition. #include lines naming a macro, and headers that can't be found, are skipped.
+#
+#   Headers are only read once. What including a header does (the macros it defines and undefines) is kept along with the values of the macros
+#   its conditions test, and used again wherever it is included with those macros the same, which is most of the time.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - ISO/IEC 9899:1999 (C99), 6.10.1 Conditional inclusion.
+#
+# History:
+#   2026-Oct-18 - Request user-024
+#     - Created.
+#   2026-Oct-18 - Request user-024
+#     - Conditions are macro expanded and then evaluated with the arithmetic of #if lines, lint's __STDC__ is defined, and undefined reserved
+#       names are unknown.
+#   2026-Oct-18 - Request user-024
+#     - The code of included files that aren't headers counts as the code of the file including them.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import os
+import re
+import sys
+
+import c_expression
+import include_graph
+import lnt_options
+import makeLintFileList
+import run_lint_shards
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+
+# Comments, and the string and character literals a comment can't start in. Comments are replaced by a space, or by the new lines they span.
+COMMENT_OR_LITERAL = re.compile(r'''/\*.*?(?:\*/|\Z)|//[^\n]*|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*\'''', re.DOTALL)
+
+# A line continued on the next by a backslash.
+CONTINUATION = re.compile(r"\\[ \t]*\r?\n")
+
+DIRECTIVE = re.compile(r"#[ \t]*(\w*)(.*)$", re.DOTALL)
+DEFINE = re.compile(r"[ \t]*(\w+)(\()?(.*)$", re.DOTALL)
+INCLUDE = re.compile(r'''[ \t]*([<"])([^>"]+)[>"]''')
+NAME = re.compile(r"[A-Za-z_]\w*")
+
+# The value of a macro that may or may not be defined, or whose value can't be known, because it was defined or undefined where it can't be
+# told whether the code is compiled.
+UNKNOWN = "<unknown>"
+# The value of a function-like macro, which is defined but has no value of its own in a condition.
+FUNCTION = "<function>"
+
+# The macros lint defines itself, whatever the options.
+LINT_PREDEFINED = {"_lint": "1", "__STDC__": "1"}
+
+# A name reserved for the compiler, which it may define without it being in the .lnt files.
+RESERVED_NAME = re.compile(r"_[_A-Z]")
+
+# A condition expanding to more tokens than this is taken as unknown, so macros that expand to each other many times over can't take for ever.
+MAX_EXPANSION_TOKENS = 100000
+
+# Conditions with the -d options they are evaluated with, and the result expected (None for can't be told), for --check.
+CONDITION_CHECKS = [
+    (["-dALLONES=(~0U)"], "ALLONES > 0xFFFF", True),
+    ([], "-1 < 0U", False),
+    ([], "(1 ? -1 : 0U) > 0", True),
+    ([], "0xFFFFFFFFFFFFFFFF == -1", True),
+    ([], "1 << 63", None),
+    ([], "__STDC__", True),
+    ([], "defined(_lint) && _lint", True),
+    ([], "__STDC_VERSION__ >= 199901L", None),
+    ([], "_Reserved", None),
+    ([], "NOT_DEFINED", False),
+    (["-dX=(1)"], "X == 1", True),
+    (["-dF(a)=a"], "F(1)", None),
+    (["-dF(a)=a"], "defined(F)", True),
+    ([], "0 && (1 / 0)", False),
+    ([], "1 || NOT_DEFINED", True),
+    ([], "1 ? 2 : 1 / 0", True),
+    (["-dSELF=SELF+1"], "SELF == 1", True),
+    (["-dA=B", "-dB=0"], "A || !defined(A)", False),
+    (["-dA=B", "-dB=2"], "A * A == 4", True),
+]
+
+# The extensions of headers, whose code isn't part of the file including them.
+HEADER_EXTENSIONS = (".h", ".hpp")
+
+# Includes nested deeper than this are skipped, so a header including itself without a guard can't recurse for ever.
+MAX_INCLUDE_DEPTH = 200
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# Evaluates the conditional compilation of files for one set of defines.
+class ConditionalEvaluator:
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   defines     : The defines of the variant as a dict of name to value text, or to FUNCTION for function-like macros.
+    #   directories : The include directories, in search order.
+    #   sources     : A dict of file path to its lines, from read_source(). Evaluators for other variants may share one so each file is only read
+    #                 once.
+    # ***********************************************************************************************************************************************
+    def __init__(self, defines, directories, sources=None):
+        self.defines = defines
+        self.graph = include_graph.IncludeGraph(None)
+        self.graph.set_directories(directories)
+        self.sources = {} if sources is None else sources
+        # Header path to {the values of the macros it tests: ({macro: value after including it, or None if undefined}, whether it has code)}.
+        self.memo = {}
+        # Path to the names tested by it and by the files it may include.
+        self.tested = {}
+        # For each header being included, the macros it defined or undefined, outermost first.
+        self.touched = []
+        # Macro value text to its tokens, from c_expression.tokenize().
+        self.value_tokens = {}
+        # The number of headers included, and how many of those came from self.memo.
+        self.include_count = 0
+        self.memo_count = 0
+
+    # ***********************************************************************************************************************************************
+    # Returns True if any of a file's own code may be compiled, and False if it certainly isn't. A file that can't be read is taken to have code.
+    # ***********************************************************************************************************************************************
+    def has_code(self, path):
+        path = os.path.normpath(makeLintFileList.native_path(path))
+        if self.source(path) is None:
+            return True
+        return self.run(path, dict(self.defines), True, 0)
+
+    # ***********************************************************************************************************************************************
+    # Returns the lines of a file from read_source(), reading it the first time.
+    # ***********************************************************************************************************************************************
+    def source(self, path):
+        if path not in self.sources:
+            self.sources[path] = read_source(path)
+        return self.sources[path]
+
+    # ***********************************************************************************************************************************************
+    # Preprocesses a file, updating the macros as it goes.
+    #
+    # Parameters:
+    #   path    : The file.
+    #   macros  : The macros defined so far, as a dict of name to value text, FUNCTION or UNKNOWN.
+    #   certain : False if it can't be told whether the file is included at all.
+    #   depth   : The number of files including it.
+    #
+    # Returns:
+    #   True if any of the file's own code, or of the files it includes that aren't headers, may be compiled.
+    # ***********************************************************************************************************************************************
+    def run(self, path, macros, certain, depth):
+        lines = self.source(path) or []
+        found = False
+        # For each open #if: [whether the code around it is compiled, whether its current branch is, whether an earlier branch was]. Each is
+        # True, False or None for can't be told.
+        frames = []
+        for line in lines:
+            kind = line[0]
+            if kind in ("elif", "else", "endif"):
+                if not frames:
+                    continue
+                frame = frames[-1]
+                if kind == "endif":
+                    frames.pop()
+                elif frame[0] is not False:
+                    condition = True if kind == "else" else (False if frame[2] is True else self.condition(line[1], macros))
+                    frame[1] = and3(not3(frame[2]), condition)
+                    frame[2] = or3(frame[2], condition)
+                continue
+
+            compiled = and3(frames[-1][0], frames[-1][1]) if frames else (True if certain else None)
+            if kind == "if":
+                condition = False if compiled is False else self.condition(line[1], macros)
+                frames.append([compiled, condition, condition])
+            elif compiled is False:
+                continue
+            elif kind == "code":
+                found = True
+            elif kind == "define":
+                self.set_macro(macros, line[1], line[2] if compiled else UNKNOWN)
+            elif kind == "undef":
+                self.set_macro(macros, line[1], None if compiled else UNKNOWN)
+            elif (kind == "include") and (depth < MAX_INCLUDE_DEPTH):
+                include = self.graph.find(line[2], path if line[1] else None)
+                if (include is not None) and self.include(include, macros, bool(compiled), depth + 1):
+                    if not include.lower().endswith(HEADER_EXTENSIONS):
+                        found = True
+        return found
+
+    # ***********************************************************************************************************************************************
+    # Includes a header, from self.memo if it was included before with the same values of the macros it tests. Returns True if any of its code
+    # may be compiled, as for run().
+    # ***********************************************************************************************************************************************
+    def include(self, path, macros, certain, depth):
+        self.include_count += 1
+        key = None
+        if certain:
+            key = tuple((name, macros.get(name)) for name in sorted(self.dependencies(path, macros)))
+            memo = self.memo.get(path, {}).get(key)
+            if memo is not None:
+                self.memo_count += 1
+                effect, found = memo
+                for name, value in effect.items():
+                    self.set_macro(macros, name, value)
+                return found
+
+        self.touched.append(set())
+        found = self.run(path, macros, certain, depth)
+        touched = self.touched.pop()
+        if key is not None:
+            self.memo.setdefault(path, {})[key] = ({name: macros.get(name) for name in touched}, found)
+        return found
+
+    # ***********************************************************************************************************************************************
+    # Defines a macro, or undefines it if value is None, recording it for the headers being included.
+    # ***********************************************************************************************************************************************
+    def set_macro(self, macros, name, value):
+        if value is None:
+            macros.pop(name, None)
+        else:
+            macros[name] = value
+        for touched in self.touched:
+            touched.add(name)
+
+    # ***********************************************************************************************************************************************
+    # Returns the names what a header does depends on: those tested by it and the files it may include, and those the values of these macros
+    # refer to.
+    # ***********************************************************************************************************************************************
+    def dependencies(self, path, macros):
+        names = set(self.tested_names(path))
+        pending = list(names)
+        while pending:
+            value = macros.get(pending.pop())
+            if (value is None) or (value in (UNKNOWN, FUNCTION)):
+                continue
+            for name in NAME.findall(value):
+                if name not in names:
+                    names.add(name)
+                    pending.append(name)
+        return names
+
+    # ***********************************************************************************************************************************************
+    # Returns the names tested by the conditions of a file and of every file it may include.
+    # ***********************************************************************************************************************************************
+    def tested_names(self, path):
+        names = self.tested.get(path)
+        if names is not None:
+            return names
+
+        # A file including itself, directly or not, adds nothing to what is being worked out.
+        self.tested[path] = frozenset()
+        names = set()
+        for line in self.source(path) or []:
+            if line[0] in ("if", "elif"):
+                names.update(NAME.findall(line[1]))
+            elif line[0] == "include":
+                include = self.graph.find(line[2], path if line[1] else None)
+                if include is not None:
+                    names.update(self.tested_names(include))
+        names.discard("defined")
+        self.tested[path] = frozenset(names)
+        return self.tested[path]
+
+    # ***********************************************************************************************************************************************
+    # Returns True or False for the value of a condition, or None if it can't be told.
+    # ***********************************************************************************************************************************************
+    def condition(self, text, macros):
+        def defined(name):
+            if macros.get(name) == UNKNOWN:
+                raise ValueError("{} may or may not be defined".format(name))
+            return name in macros
+
+        # The names left once the macros are expanded are 0, including those of macros that refer to themselves, which aren't expanded again.
+        # Macros that weren't expanded because their values can't be known are only an error where they are evaluated, so "0 && NAME" is 0.
+        def value(name):
+            if macros.get(name) in (UNKNOWN, FUNCTION):
+                raise ValueError("{} has no value".format(name))
+            if (name not in macros) and RESERVED_NAME.match(name):
+                raise ValueError("{} may be defined by the compiler".format(name))
+            return 0
+
+        try:
+            expanded = []
+            self.expand(c_expression.tokenize(text), macros, frozenset(), expanded)
+            return bool(c_expression.evaluate(" ".join(expanded), value, defined, preprocessor=True))
+        except (ValueError, RecursionError):
+            return None
+
+    # ***********************************************************************************************************************************************
+    # Replaces the macros in a list of tokens with their values, as the preprocessor does in a condition, and adds the text of the tokens to
+    # expanded. The names in hidden are being expanded already, and are left as they are, as are macros whose values can't be known and
+    # function-like macros.
+    # ***********************************************************************************************************************************************
+    def expand(self, tokens, macros, hidden, expanded):
+        ix = 0
+        while ix < len(tokens):
+            kind, text = tokens[ix]
+            ix += 1
+            value = macros.get(text) if kind == "name" else None
+            if text == "defined":
+                # The operand of defined, with or without parentheses, isn't expanded.
+                expanded.append(text)
+                if (ix < len(tokens)) and (tokens[ix] == ("operator", "(")):
+                    expanded.append("(")
+                    ix += 1
+                if (ix < len(tokens)) and (tokens[ix][0] == "name"):
+                    expanded.append(tokens[ix][1])
+                    ix += 1
+            elif (value is None) or (value in (UNKNOWN, FUNCTION)) or (text in hidden):
+                expanded.append(text)
+            elif len(expanded) > MAX_EXPANSION_TOKENS:
+                raise ValueError("The condition is too long once expanded")
+            else:
+                if value not in self.value_tokens:
+                    self.value_tokens[value] = c_expression.tokenize(value)
+                self.expand(self.value_tokens[value], macros, hidden | {text}, expanded)
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# and3, or3, not3
+#   The logical operators for True, False and None, None being can't be told.
+# ***************************************************************************************************************************************************
+def and3(left, right):
+    if (left is False) or (right is False):
+        return False
+    return True if (left is True) and (right is True) else None
+
+
+def or3(left, right):
+    if (left is True) or (right is True):
+        return True
+    return False if (left is False) and (right is False) else None
+
+
+def not3(value):
+    return None if value is None else not value
+
+
+# ***************************************************************************************************************************************************
+# read_source
+#   Reads the lines of a C file that matter to conditional compilation.
+#
+#   Returns:
+#       A list of tuples, or None if the file can't be read:
+#         ("code",)                       : One or more lines of code.
+#         ("if", condition)               : #if, #ifdef and #ifndef, the last two as defined(NAME) and !defined(NAME).
+#         ("elif", condition), ("else",), ("endif",)
+#         ("define", name, value)         : value is FUNCTION for a function-like macro.
+#         ("undef", name)
+#         ("include", quoted, name)       : quoted is True for "name" and False for <name>.
+# ***************************************************************************************************************************************************
+def read_source(path):
+    try:
+        with open(path, "rb") as file:
+            text = file.read().decode("latin-1")
+    except OSError:
+        return None
+
+    def blank_comment(match):
+        comment = match.group()
+        if comment[0] in "\"'":
+            return comment
+        return "\n" * comment.count("\n") or " "
+
+    text = COMMENT_OR_LITERAL.sub(blank_comment, CONTINUATION.sub("", text))
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        directive = DIRECTIVE.match(line)
+        if directive is None:
+            if (not lines) or (lines[-1][0] != "code"):
+                lines.append(("code",))
+            continue
+
+        kind, rest = directive.group(1), directive.group(2).strip()
+        if kind in ("if", "elif"):
+            lines.append((kind, rest))
+        elif kind in ("ifdef", "ifndef"):
+            name = NAME.match(rest)
+            condition = "defined({})".format(name.group()) if name else "0"
+            lines.append(("if", condition if kind == "ifdef" else "!" + condition))
+        elif kind in ("else", "endif"):
+            lines.append((kind,))
+        elif kind == "define":
+            define = DEFINE.match(rest)
+            if define:
+                lines.append(("define", define.group(1), FUNCTION if define.group(2) else define.group(3).strip()))
+        elif kind == "undef":
+            name = NAME.match(rest)
+            if name:
+                lines.append(("undef", name.group()))
+        elif kind == "include":
+            include = INCLUDE.match(rest)
+            if include:
+                lines.append(("include", include.group(1) == '"', include.group(2).strip()))
+    return lines
+
+
+# ***************************************************************************************************************************************************
+# variant_evaluator
+#   Returns a ConditionalEvaluator for the defines and include directories of a variant's .lnt files, or exits with an error if they can't be
+#   read. The include directories are made absolute, so the evaluator can be used from another directory.
+#
+#   Parameters:
+#       lnt_files : The .lnt files lint is run with for the variant, in order.
+#       sources   : Passed on to ConditionalEvaluator.
+# ***************************************************************************************************************************************************
+def variant_evaluator(lnt_files, sources=None):
+    configuration = lnt_options.resolve(lnt_files)
+    for error in configuration.errors:
+        stderr_out("Python Error: {}".format(error))
+    if configuration.errors:
+        sys.exit(-1)
+
+    defines = evaluator_defines(configuration)
+    directories = [os.path.abspath(makeLintFileList.native_path(directory)) for directory in configuration.includes]
+    return ConditionalEvaluator(defines, directories, sources)
+
+
+# ***************************************************************************************************************************************************
+# evaluator_defines
+#   Returns the defines of a lnt_options.LintConfiguration as a ConditionalEvaluator takes them, along with the macros lint defines itself.
+# ***************************************************************************************************************************************************
+def evaluator_defines(configuration):
+    defines = dict(LINT_PREDEFINED)
+    for name, (value, _, parameters) in configuration.defines.items():
+        defines[name] = value if parameters is None else FUNCTION
+    return defines
+
+
+# ***************************************************************************************************************************************************
+# check_conditions
+#   Evaluates the conditions of CONDITION_CHECKS.
+#
+#   Returns:
+#       A list of strings describing the conditions that didn't give the expected result. Empty if they all did.
+# ***************************************************************************************************************************************************
+def check_conditions():
+    failures = []
+    for options, text, expected in CONDITION_CHECKS:
+        configuration = lnt_options.LintConfiguration()
+        for option in options:
+            configuration.add_option(option, "--check", 0)
+        evaluator = ConditionalEvaluator(evaluator_defines(configuration), [])
+        result = evaluator.condition(text, dict(evaluator.defines))
+        if result is not expected:
+            failures.append("#if {} with {}: {} instead of {}".format(text, " ".join(options) or "no options", result, expected))
+    return failures
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Lists the files of a lint file list that have no code for a variant.")
+    parser.add_argument("file_list", nargs="?", help="The file list written by makeLintFileList.py.")
+    parser.add_argument("--lnt", "-l", action="append", default=[],
+                        help="A .lnt file lint is run with for the variant. May be given more than once; the files are read in order, as lint "
+                             "reads them.")
+    parser.add_argument("--all", "-a", action="store_true", help="List every file, marked with whether it has code.")
+    parser.add_argument("--check", action="store_true", help="Check the conditions of CONDITION_CHECKS instead.")
+    args = parser.parse_args(args)
+
+    if args.check:
+        return args
+    if (args.file_list is None) or (not args.lnt):
+        parser.error("A file list and at least one --lnt file are needed")
+    for name in [args.file_list] + args.lnt:
+        if not os.path.isfile(name):
+            parser.error("Couldn't find {}".format(name))
+    return args
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    if args.check:
+        failures = check_conditions()
+        for failure in failures:
+            print(failure)
+        print("{} of {} conditions as expected".format(len(CONDITION_CHECKS) - len(failures), len(CONDITION_CHECKS)), file=sys.stderr)
+        sys.exit(-1 if failures else 0)
+
+    evaluator = variant_evaluator(args.lnt)
+    units = run_lint_shards.read_file_list(args.file_list)
+    empty = 0
+    for unit in units:
+        has_code = evaluator.has_code(unit)
+        empty += not has_code
+        if args.all:
+            print("{}  {}".format("code   " if has_code else "no code", unit))
+        elif not has_code:
+            print(unit)
+    print("{} of {} files have no code ({} headers included, {} from memory)".format(
+        empty, len(units), evaluator.include_count, evaluator.memo_count), file=sys.stderr)
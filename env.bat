@@ -38,17 +38,29 @@
 ::   - Explicitly use python 3 when calling the helper script.
 ::   2018-Nov-21 by Stuart Thain - Reviewed at my desk by Michael Kuusela
 ::   Fixed error in read routine (Python wasn't called on the helper script)
+::   2026-Oct-18 - Request user-010
+::   - All the variables are read or written by a single call to rw_variable.py, instead of one
+::     call per variable. Reads go through a temporary batch file of set commands.
+::   2026-Oct-18 - Request user-014
+::   - If RW_VARIABLE_PORT is set, calls go to rw_variable_server.py through rw_variable_client.py.
 ::*************************************************************************************************
 
 set ENV_VERSION_MAJOR=1
 set ENV_VERSION_MINOR=03
-set ENV_BUILD_NUMBER=4
+set ENV_BUILD_NUMBER=6
 
 set ENV_PRODUCT_NUMBER=983631
 
 ::*************************************************************************************************
 
 set helper_script="%~dp0rw_variable.py"
+set python_options=
+
+:: If the build has started rw_variable_server.py and set RW_VARIABLE_PORT to its port, send the
+:: calls to it instead. The client starts faster without the site module (-S), and runs
+:: rw_variable.py itself if the server isn't running.
+if defined RW_VARIABLE_PORT set helper_script="%~dp0rw_variable_client.py"
+if defined RW_VARIABLE_PORT set python_options=-S
 
 :: First argument should be the filename,
 :: Second argument should be --write or --read,
@@ -76,23 +88,23 @@ shift
 shift
 shift
 
+:: Collect all the ENV=VARIABLE pairs, so the file is read by a single call to the helper script.
+set pairs=
 :read_loop
-set var=%1
-set val=%2
-
-set temp_file="%var%_temporary.txt"
-
-:: When reading, we expect the python file to print the value that was read. This batch file will
-:: pipe it to a temporary file. Then, the environment variable can be set by piping the contents
-:: of the temporary file to the variable.
-call py -3 %helper_script% %filename% %option% %type% %string% %val%>%temp_file%
-if "%ERRORLEVEL%"=="-1" goto not_found
-set /p %var%=<%temp_file%
-del %temp_file%
-
+set pairs=%pairs% %1=%2
 shift
 shift
 if not "%~1"=="" goto read_loop
+
+set temp_file="env_read_temporary.bat"
+
+:: When reading, we expect the python file to print a "set ENV=value" line for each pair. This batch
+:: file will pipe them to a temporary batch file, and then call it to set all the environment
+:: variables at once.
+call py -3 %python_options% %helper_script% %filename% %option% %type% %string% %pairs%>%temp_file%
+if not "%ERRORLEVEL%"=="0" goto not_found
+call %temp_file%
+del %temp_file%
 goto done
 :: End reading from a file
 
@@ -104,17 +116,18 @@ shift
 shift
 shift
 
+:: Collect all the VARIABLE=value pairs, so the file is read and written by a single call to the
+:: helper script.
+set pairs=
 :write_loop
-set var=%1
-set val=%2
-
-call py -3 %helper_script% %filename% %option% %type% %string% %var%=%val%
-if not "%ERRORLEVEL%"=="0" goto not_found
-
+set pairs=%pairs% %1=%2
 shift
 shift
 if not "%~1"=="" goto write_loop
 
+call py -3 %python_options% %helper_script% %filename% %option% %type% %string% %pairs%
+if not "%ERRORLEVEL%"=="0" goto not_found
+
 goto done
 :: End writing to a file
 
@@ -172,7 +185,8 @@ echo         file for writing.
 goto done
 
 :not_found
-echo Env: Variable %val% wasn't found in %filename%.
-echo      Variable pairs after %val%=%var% or %var%=%val% were not read from or written to.
+if defined temp_file if exist %temp_file% del %temp_file%
+echo Env: One or more variables weren't found in %filename% (see the Python Error above).
+echo      None of the variables were read from or written to.
 
 :done
\ No newline at end of file
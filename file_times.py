@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   The resolution of file modification times, shared by the scripts that cache what they read from files and only read a file again when its
+#   modification time changes (rw_variable.py, makeLintFileList.py, include_graph.py, macro_index.py and lint_stats.py).
+#
+#   A file changed within MTIME_RESOLUTION_NS of when it was read may have been changed again since without its modification time changing, so
+#   what was read from it isn't trusted.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-008
+#     - Created, from the copies in rw_variable.py and makeLintFileList.py.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+
+# The coarsest resolution of file modification times, in nanoseconds (FAT keeps them to 2 seconds).
+MTIME_RESOLUTION_NS = 2000000000
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Picks out the files of a lint file list that need linting again: those that changed, or that include (directly or through other headers) a
+#   header that changed, since the list was last linted. For example:
+#
+#   Usage: python include_graph.py files.lnt -l project_specific.lnt -l GVI075.lnt -o changed_files.lnt
+#          lint-nt project_specific.lnt GVI075.lnt changed_files.lnt
+#          python include_graph.py files.lnt -l project_specific.lnt -l GVI075.lnt --accept
+#
+#   The first call writes the files that changed since the last --accept to changed_files.lnt, in the order of files.lnt. Once they have been
+#   linted, --accept records the files as they were when they were picked as linted, so a file edited while lint was running is picked again
+#   next time. --accept doesn't read any files, and fails if the files haven't been picked since the last --accept. Until the first --accept,
+#   and whenever the options from the .lnt files change, every file is picked.
+#
+#   The #include lines of each file are followed as the compiler does: "name" is looked for in the directory of the file including it and then
+#   in the -i directories of the .lnt files (see lnt_options.py), <name> only in the -i directories. Every #include line is followed, including
+#   those in comments or inside #if blocks that aren't compiled, so a file may be picked that didn't need to be but never the other way round.
+#   An #include of a macro can't be followed. Headers that can't be found, such as the compiler's own, are only checked for appearing later.
+#
+#   Files are read in parallel, and the SHA-1 and #include lines of each are kept in --cache. A file is only read again if its modification
+#   time or size changed, and its #include lines only found again if its contents did.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-022
+#     - Created.
+#   2026-Oct-18 - Request user-024
+#     - Added IncludeGraph.set_directories(), so conditional_compilation.py can find includes the same way.
+#   2026-Oct-18 - Request user-022
+#     - --accept records the digests worked out when the files were picked, rather than those of the files when --accept is run.
+#   2026-Oct-18 - Request user-008
+#     - Take the resolution of file modification times from file_times.py.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+import file_times
+import lnt_options
+import makeLintFileList
+import run_lint_shards
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+DEFAULT_CACHE_FILE = "include_graph.json"
+DEFAULT_OUTPUT_FILE = "changed_files.lnt"
+
+# Increase when the layout of the cache file changes, so older caches are discarded.
+CACHE_VERSION = 2
+
+# An #include line. The first group is the opening " or <, the second the name.
+INCLUDE_LINE = re.compile(rb'^[ \t]*#[ \t]*include[ \t]*([<"])([^>"\r\n]+)[>"]', re.MULTILINE)
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# The files of a lint file list and everything they include, with the SHA-1 of each.
+class IncludeGraph:
+
+    # ***********************************************************************************************************************************************
+    # Loads the cache, if there is a usable one.
+    #
+    # Parameters:
+    #   cache_file : The file the graph is kept in, or None to not keep it.
+    # ***********************************************************************************************************************************************
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self.saved_ns = 0
+        # File path to [modification time, size, SHA-1, [[quoted, name], ...]], as loaded from the cache.
+        self.cached = {}
+        # Variant key to {"configuration": digest of the .lnt options, "files": {path: SHA-1}, "units": {path: SHA-1}}, as recorded by accept().
+        self.baselines = {}
+        # Variant key to the baseline changed_units() worked out, for accept() to record once the files it picked have been linted.
+        self.pending = {}
+        # The same as cached, for the files reached by the last update().
+        self.files = {}
+        # File path to the paths of the files it includes.
+        self.includes = {}
+        # File path to the names it includes that couldn't be found.
+        self.missing = {}
+        # The include directories, in search order.
+        self.directories = []
+        # Directory to the normalised names in it, for finding includes without a stat per directory.
+        self.listings = {}
+        # The number of files update() had to read.
+        self.read_count = 0
+        self.changed = True
+
+        if cache_file is None:
+            return
+        try:
+            with open(cache_file) as file:
+                cache = json.load(file)
+            if cache.get("version") == CACHE_VERSION:
+                self.saved_ns = cache["saved"]
+                self.cached = cache["files"]
+                self.baselines = cache["baselines"]
+                self.pending = cache["pending"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            # A missing or damaged cache just means every file is read and picked.
+            pass
+
+    # ***********************************************************************************************************************************************
+    # Finds every file reached from a list of files through their #include lines.
+    #
+    # Parameters:
+    #   units       : The files to lint.
+    #   directories : The include directories, in the order they are searched.
+    #   jobs        : The maximum number of files to read at once.
+    # ***********************************************************************************************************************************************
+    def update(self, units, directories, jobs):
+        self.set_directories(directories)
+        self.files = {}
+        self.includes = {}
+        self.missing = {}
+        self.read_count = 0
+
+        pending = []
+        for unit in units:
+            path = os.path.normpath(makeLintFileList.native_path(unit))
+            if path not in self.files:
+                self.files[path] = None
+                pending.append(path)
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            while pending:
+                entries = list(pool.map(self.scan, pending))
+                found = []
+                for path, entry in zip(pending, entries):
+                    self.files[path] = entry
+                    if entry is not self.cached.get(path):
+                        self.read_count += 1
+                    self.includes[path] = []
+                    for quoted, name in entry[3]:
+                        include = self.find(name, path if quoted else None)
+                        if include is None:
+                            self.missing.setdefault(path, []).append(name)
+                            continue
+                        self.includes[path].append(include)
+                        if include not in self.files:
+                            self.files[include] = None
+                            found.append(include)
+                pending = found
+
+        self.changed = (self.read_count > 0) or (self.files.keys() != self.cached.keys())
+
+    # ***********************************************************************************************************************************************
+    # Sets the include directories find() searches, in search order.
+    # ***********************************************************************************************************************************************
+    def set_directories(self, directories):
+        self.directories = [os.path.normpath(makeLintFileList.native_path(directory)) for directory in directories]
+
+    # ***********************************************************************************************************************************************
+    # Returns the cache entry of a file, reading it if it isn't in the cache or may have changed since. A file that can't be read has no SHA-1
+    # and no #include lines.
+    # ***********************************************************************************************************************************************
+    def scan(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return [0, 0, None, []]
+        cached = self.cached.get(path)
+        # A file changed within the time stamp resolution of when the cache was saved may have changed again since without its time stamp
+        # changing, so it is read again.
+        if ((cached is not None) and (cached[0] == stat.st_mtime_ns) and (cached[1] == stat.st_size) and
+                (stat.st_mtime_ns < self.saved_ns - file_times.MTIME_RESOLUTION_NS)):
+            return cached
+
+        try:
+            with open(path, "rb") as file:
+                contents = file.read()
+        except OSError as error:
+            stderr_out("Couldn't read {}: {}".format(path, error))
+            return [0, 0, None, []]
+        digest = hashlib.sha1(contents).hexdigest()
+        if (cached is not None) and (cached[2] == digest):
+            return [stat.st_mtime_ns, stat.st_size, digest, cached[3]]
+        return [stat.st_mtime_ns, stat.st_size, digest, read_includes(contents)]
+
+    # ***********************************************************************************************************************************************
+    # Returns the path of an included file, or None if it can't be found.
+    #
+    # Parameters:
+    #   name      : The name in the #include line.
+    #   including : The path of the file including it for "name", or None for <name>.
+    # ***********************************************************************************************************************************************
+    def find(self, name, including):
+        name = makeLintFileList.native_path(name)
+        directories = self.directories
+        if including is not None:
+            directories = [os.path.dirname(including)] + directories
+        if os.path.isabs(name):
+            return os.path.normpath(name) if os.path.isfile(name) else None
+
+        for directory in directories:
+            path = os.path.normpath(os.path.join(directory, name))
+            if os.sep in name:
+                if os.path.isfile(path):
+                    return path
+            elif os.path.normcase(name) in self.listing(directory):
+                return path
+        return None
+
+    # ***********************************************************************************************************************************************
+    # Returns the set of normalised names in a directory, or an empty set if it can't be read.
+    # ***********************************************************************************************************************************************
+    def listing(self, directory):
+        names = self.listings.get(directory)
+        if names is None:
+            try:
+                names = {os.path.normcase(entry.name) for entry in os.scandir(directory or os.curdir) if entry.is_file()}
+            except OSError:
+                names = set()
+            self.listings[directory] = names
+        return names
+
+    # ***********************************************************************************************************************************************
+    # Returns a dict of each file's path to the SHA-1 of its contents and of everything it includes, directly or not. The digest changes when
+    # any of those files changes, or when an include that couldn't be found can now be found.
+    # ***********************************************************************************************************************************************
+    def unit_digests(self, units):
+        digests = {}
+        for unit in units:
+            path = os.path.normpath(makeLintFileList.native_path(unit))
+            digest = hashlib.sha1()
+            for reached in sorted(self.reachable(path)):
+                digest.update("{}\0{}\n".format(reached, self.files[reached][2]).encode("utf-8"))
+                for name in self.missing.get(reached, []):
+                    digest.update("{}\0\n".format(name).encode("utf-8"))
+            digests[path] = digest.hexdigest()
+        return digests
+
+    # ***********************************************************************************************************************************************
+    # Returns the set of a file and every file it includes, directly or not.
+    # ***********************************************************************************************************************************************
+    def reachable(self, path):
+        reached = {path}
+        stack = [path]
+        while stack:
+            for include in self.includes.get(stack.pop(), []):
+                if include not in reached:
+                    reached.add(include)
+                    stack.append(include)
+        return reached
+
+    # ***********************************************************************************************************************************************
+    # Returns the baseline of a list as found by the last update(): {"configuration": configuration, "files": {path: SHA-1}, "units":
+    # {path: SHA-1}}, where files holds every file reached and units the digest of each file to lint from unit_digests().
+    # ***********************************************************************************************************************************************
+    def baseline(self, units, configuration, digests=None):
+        if digests is None:
+            digests = self.unit_digests(units)
+        files = {}
+        for unit in digests:
+            for reached in self.reachable(unit):
+                files[reached] = self.files[reached][2]
+        return {"configuration": configuration, "files": files, "units": digests}
+
+    # ***********************************************************************************************************************************************
+    # Returns the files of a list that need linting again, in list order, and for each the files that changed since it was last accepted. The
+    # files as they are now are kept as pending, for accept() to record once the files picked have been linted.
+    #
+    # Parameters:
+    #   key           : The key of the variant, from variant_key().
+    #   units         : The files to lint, as given to update().
+    #   configuration : The digest of the options from the .lnt files.
+    #
+    # Returns:
+    #   A list of (file, [changed files]) tuples. The list of changed files is empty if the file was never accepted or the options changed.
+    # ***********************************************************************************************************************************************
+    def changed_units(self, key, units, configuration):
+        baseline = self.baselines.get(key)
+        digests = self.unit_digests(units)
+        picked = []
+        for unit in units:
+            path = os.path.normpath(makeLintFileList.native_path(unit))
+            if (baseline is None) or (baseline["configuration"] != configuration) or (path not in baseline["units"]):
+                picked.append((unit, []))
+            elif baseline["units"][path] != digests[path]:
+                changed = [reached for reached in sorted(self.reachable(path))
+                           if baseline["files"].get(reached) != self.files[reached][2]]
+                picked.append((unit, changed))
+        self.pending[key] = self.baseline(units, configuration, digests)
+        self.changed = True
+        return picked
+
+    # ***********************************************************************************************************************************************
+    # Records the files of a list as linted, as they were when changed_units() last picked them. Files changed since then, such as while lint was
+    # running, are picked again next time.
+    #
+    # Returns:
+    #   The number of files recorded, or None if changed_units() hasn't been called for the key since the last accept().
+    # ***********************************************************************************************************************************************
+    def accept(self, key):
+        pending = self.pending.pop(key, None)
+        if pending is None:
+            return None
+        self.baselines[key] = pending
+        self.changed = True
+        return len(pending["units"])
+
+    # ***********************************************************************************************************************************************
+    # Writes the graph to the cache file, unless it is the same as the one already there. The file is replaced atomically so an interrupted run
+    # can't leave a truncated cache behind.
+    # ***********************************************************************************************************************************************
+    def save(self):
+        if (self.cache_file is None) or (not self.changed):
+            return
+        # Files of other lists that this run didn't reach are kept, so lists sharing a cache don't read each other's files again.
+        files = dict(self.cached)
+        files.update(self.files)
+        cache = {"version": CACHE_VERSION,
+                 "saved": time.time_ns(),
+                 "files": files,
+                 "baselines": self.baselines,
+                 "pending": self.pending}
+        temp_name = self.cache_file + ".tmp"
+        try:
+            with open(temp_name, "w") as file:
+                json.dump(cache, file, separators=(",", ":"))
+            os.replace(temp_name, self.cache_file)
+        except OSError as error:
+            stderr_out("Couldn't save the include graph '{}': {}".format(self.cache_file, error))
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# read_includes
+#   Returns the #include lines of a file's contents as a list of [quoted, name], quoted being True for "name" and False for <name>.
+# ***************************************************************************************************************************************************
+def read_includes(contents):
+    return [[opening == b'"', name.strip().decode("latin-1")] for opening, name in INCLUDE_LINE.findall(contents)]
+
+
+# ***************************************************************************************************************************************************
+# variant_key
+#   Returns the key a file list is recorded under, so each list and .lnt file combination has its own baseline.
+# ***************************************************************************************************************************************************
+def variant_key(file_list, lnt_files):
+    return lnt_options.variant_key([file_list] + lnt_files)
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Lists the files of a lint file list whose contents or includes changed since they were linted.")
+    parser.add_argument("file_list", nargs="?", default=makeLintFileList.DEFAULT_OUTPUT_FILE,
+                        help="The file list written by makeLintFileList.py (Default = {}).".format(makeLintFileList.DEFAULT_OUTPUT_FILE))
+    parser.add_argument("--lnt", "-l", action="append", default=[],
+                        help="A .lnt file lint is run with, for its -i include directories and options. May be given more than once; the files "
+                             "are read in order, as lint reads them.")
+    parser.add_argument("--output", "-o", default=DEFAULT_OUTPUT_FILE,
+                        help="The file the changed files are written to (Default = {}).".format(DEFAULT_OUTPUT_FILE))
+    parser.add_argument("--accept", "-a", action="store_true",
+                        help="Record the files as they were when the changed files were last written as linted, instead of writing the "
+                             "changed files.")
+    parser.add_argument("--why", "-w", action="store_true", help="Print each changed file and the files that changed under it.")
+    parser.add_argument("--cache", "-c", default=DEFAULT_CACHE_FILE,
+                        help="The file the include graph and the linted state are kept in (Default = {}).".format(DEFAULT_CACHE_FILE))
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="The maximum number of files to read at once (Default = number of CPU cores).")
+    args = parser.parse_args(args)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    for name in [args.file_list] + args.lnt:
+        if not os.path.isfile(name):
+            parser.error("Couldn't find {}".format(name))
+    return args
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    configuration = lnt_options.resolve(args.lnt)
+    for error in configuration.errors:
+        stderr_out("Python Error: {}".format(error))
+    if configuration.errors:
+        sys.exit(-1)
+
+    units = run_lint_shards.read_file_list(args.file_list)
+    key = variant_key(args.file_list, args.lnt)
+
+    graph = IncludeGraph(args.cache)
+    if args.accept:
+        # The files were worked out when they were picked, so nothing is read.
+        accepted = graph.accept(key)
+        if accepted is None:
+            stderr_out("Python Error: No changed files have been written for {} since the last --accept".format(args.file_list), True)
+        print("Recorded {} files as linted".format(accepted))
+    else:
+        start = time.perf_counter()
+        graph.update(units, configuration.includes, args.jobs)
+        missing = sum(len(names) for names in graph.missing.values())
+        print("{} files to lint, {} files reached, {} read, {} includes not found ({:.2f} s)".format(
+            len(units), len(graph.files), graph.read_count, missing, time.perf_counter() - start))
+
+        picked = graph.changed_units(key, units, configuration.digest())
+        makeLintFileList.write_generated_file(args.output, [unit + "\n" for unit, _ in picked])
+        print("{} of {} files changed, written to {}".format(len(picked), len(units), args.output))
+        if args.why:
+            for unit, changed in picked:
+                print(unit)
+                for path in changed:
+                    print("  {}".format(path))
+
+    graph.save()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Compares a lint output with a baseline (for example, the lint_all_output.txt of the last release) and lists only the messages that are new
+#   ("+") or have gone away ("-"), in the format lint writes them.
+#
+#   Usage: python lint_baseline.py [--root C:\Work\Sprint_67\1090601_indy\code] baseline_output.txt lint_all_output.txt
+#
+#   Line numbers change whenever code is added above a message, so they aren't used to match messages. A message is matched on:
+#     - The file it refers to.
+#     - The message number.
+#     - The echoed source line, with runs of white space treated as one space. Messages with no source line (mostly the global wrap-up) are
+#       matched on their text instead, with any "line NNN" in it ignored.
+#     - The MISRA rule.
+#   A source line can hold the same message more than once, so matching messages are counted, and only the difference in the counts is listed.
+#
+#   The baseline is read into an index and the new output is streamed against it, so memory use depends only on the size of the baseline.
+#
+#   The exit code is 1 if --fail is given and there are new messages.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-007
+#     - Created.
+#   2026-Oct-18 - Request user-007
+#     - Each baseline message left unmatched is reported, rather than the first one of its key once for each.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+from collections import deque
+import ntpath
+import re
+import sys
+
+import lint_output
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+
+# A line number in the text of a message, for example "(line 77, file ...)".
+TEXT_LINE_NUMBER = re.compile(r"\bline \d+")
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# The messages of a baseline lint output, indexed by their match key.
+class LintBaseline:
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   roots : Path prefixes to remove before matching, so outputs from different working copies can be compared.
+    # ***********************************************************************************************************************************************
+    def __init__(self, roots=()):
+        # Root prefixes, longest first so nested roots are removed in full. Lint runs on Windows, so its paths are always compared the Windows way
+        # (ntpath.normcase doesn't change the length of the text, so positions found in the normalised text hold in the original).
+        self.roots = sorted((ntpath.normcase(root).rstrip("\\") for root in roots), key=len, reverse=True)
+        # Match key -> the baseline messages with that key left unmatched, in output order.
+        self.index = {}
+
+    # ***********************************************************************************************************************************************
+    # strip_roots
+    #   Returns text with every root prefix removed, ignoring case.
+    # ***********************************************************************************************************************************************
+    def strip_roots(self, text):
+        for root in self.roots:
+            start = ntpath.normcase(text).find(root)
+            while start >= 0:
+                text = text[:start] + text[start + len(root):]
+                start = ntpath.normcase(text).find(root)
+        return text
+
+    # ***********************************************************************************************************************************************
+    # key
+    #   Returns the match key of a message.
+    # ***********************************************************************************************************************************************
+    def key(self, message):
+        file = None
+        if message.file is not None:
+            file = ntpath.normcase(self.strip_roots(message.file))
+        if message.source is not None:
+            context = " ".join(message.source.split())
+        else:
+            context = TEXT_LINE_NUMBER.sub("line", self.strip_roots(message.text))
+        return (file, message.number, context, message.rule)
+
+    # ***********************************************************************************************************************************************
+    # add
+    #   Adds the messages of the baseline output.
+    # ***********************************************************************************************************************************************
+    def add(self, messages):
+        for message in messages:
+            self.index.setdefault(self.key(message), deque()).append(message)
+
+    # ***********************************************************************************************************************************************
+    # compare
+    #   Yields ("+", message) for each message in messages that isn't in the baseline, then ("-", message) for each baseline message that wasn't
+    #   found in messages. Matched messages are used up, so compare can only be called once.
+    # ***********************************************************************************************************************************************
+    def compare(self, messages):
+        for message in messages:
+            left = self.index.get(self.key(message))
+            if left:
+                left.popleft()
+            else:
+                yield "+", message
+
+        for left in self.index.values():
+            for message in left:
+                yield "-", message
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Lists the lint messages that are new or gone compared to a baseline lint output.")
+    parser.add_argument("baseline", help="The baseline lint output.")
+    parser.add_argument("output", help="The new lint output, for example lint_all_output.txt.")
+    parser.add_argument("--root", "-r", action="append", default=[],
+                        help="A path prefix to ignore when matching, for example the working copy directory. May be given more than once.")
+    parser.add_argument("--fail", "-f", action="store_true", help="Exit with 1 if there are new messages.")
+    return parser.parse_args(args)
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    baseline = LintBaseline(args.root)
+    added = 0
+    removed = 0
+    try:
+        baseline.add(lint_output.read_lint_output(args.baseline))
+        for change, message in baseline.compare(lint_output.read_lint_output(args.output)):
+            if change == "+":
+                added += 1
+            else:
+                removed += 1
+            print("{} {}".format(change, lint_output.format_message(message)))
+    except OSError as error:
+        stderr_out("Python Error: {}".format(error), True)
+
+    print("{} new, {} fixed".format(added, removed))
+    sys.exit(1 if (args.fail and added) else 0)
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Lints only the modules whose output isn't already known. The "--- Module:" section lint writes for each module is kept in a cache directory,
+#   under a key made from the module's path, the SHA-1 of the module and every header it includes (see include_graph.py), the options from the
+#   .lnt files (see lnt_options.py) and the lint command. Modules with a section in the cache aren't linted again. For example:
+#
+#   Usage: python lint_cache.py files.lnt -l project_specific.lnt -l GVI075.lnt -o lint_all_output.txt --lint lint-nt project_specific.lnt GVI075.lnt
+#
+#   Everything after --lint is the lint command; a file listing the modules to lint is appended to it. The output file holds the banner, every
+#   module's section in the order of the file list (pass by pass when lint is run with -passes), the "--- Global Wrap-up" messages, and a
+#   summary table counting the messages of both the linted and the cached modules. As with run_lint_shards.py, lint only sees the modules it
+#   is given, so the global wrap-up only covers those modules, and a module's later passes may differ from what a full run would give when the
+#   modules it uses change.
+#
+#   The global wrap-up of a run of every module is cached too, under a key made from the keys of all the modules and the options from the .lnt
+#   files. When every module is cached, the cached wrap-up of that set of modules is written with them; if there isn't one, every module is
+#   linted again to get it. The wrap-up of a run of only some of the modules isn't cached, as it isn't the wrap-up of the whole set, and is
+#   written under a note saying how many of the modules it covers.
+#
+#   The cache directory is kept under --max_size by deleting the sections used least recently.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-023
+#     - Created.
+#   2026-Oct-18 - Request user-025
+#     - Split count_messages() and LintResultCache.summary_rows() out for variant_plan.py.
+#   2026-Oct-18 - Request user-023
+#     - Cached the global wrap-up, and lint every module when it isn't cached rather than writing an output without one.
+#   2026-Oct-18 - Request user-023
+#     - Only cache the global wrap-up of a run of every module, and mark the wrap-up of a run of some of them as partial.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import include_graph
+import lint_output
+import lnt_options
+import makeLintFileList
+import run_lint_shards
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+DEFAULT_CACHE_DIRECTORY = "lint_cache"
+DEFAULT_MAX_SIZE_MB = 512
+DEFAULT_MODULES_FILE = "lint_cache_files.lnt"
+
+# Increase when the layout of the cached sections changes, so older sections are no longer used.
+CACHE_VERSION = 1
+
+# The file in the cache directory holding the banner and the summary text of each message.
+INDEX_FILE = "index.json"
+SECTION_EXTENSION = ".json"
+
+# Written at the start of the global wrap-up of a run of only some of the modules.
+PARTIAL_WRAP_UP_NOTE = "(Partial wrap-up: only covers the {} of {} modules linted in this run.)"
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# The lint output of modules that weren't linted, made from their cached sections. It has the attributes of a run_lint_shards.LintRunOutput so
+# both can be merged by run_lint_shards.merge_outputs().
+class CachedOutput:
+
+    def __init__(self, preamble, newline):
+        self.preamble = preamble
+        self.modules = []
+        self.global_lines = []
+        self.summary = []
+        self.newline = newline
+
+
+# A directory of module sections, keyed by everything the section depends on.
+class LintResultCache:
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   directory : The cache directory. It is created if it doesn't exist.
+    # ***********************************************************************************************************************************************
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        # The banner of the last lint run, used when every module comes from the cache.
+        self.preamble = []
+        # "kind number" to the text lint gives it in the summary table.
+        self.texts = {}
+        try:
+            with open(os.path.join(directory, INDEX_FILE), encoding=lint_output.LINT_OUTPUT_ENCODING) as file:
+                index = json.load(file)
+            if index.get("version") == CACHE_VERSION:
+                self.preamble = index["preamble"]
+                self.texts = index["texts"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SECTION_EXTENSION)
+
+    # ***********************************************************************************************************************************************
+    # Returns the cached entry of a key, {"sections": [lines of each pass], "counts": [[kind, number, count], ...]}, or None if there isn't one.
+    # The entry is marked as just used, so it is the last to be evicted.
+    # ***********************************************************************************************************************************************
+    def load(self, key):
+        path = self.path(key)
+        try:
+            with open(path, encoding=lint_output.LINT_OUTPUT_ENCODING) as file:
+                entry = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    # ***********************************************************************************************************************************************
+    # Caches the sections of a module, with the number of each message in them for the summary table.
+    #
+    # Parameters:
+    #   key      : The key from module_key().
+    #   sections : The lines of the module's section in each pass, each line ending with its new line.
+    # ***********************************************************************************************************************************************
+    def store(self, key, sections):
+        counts = count_messages(line for lines in sections for line in lines)
+        entry = {"sections": sections, "counts": [[kind, number, count] for (kind, number), count in sorted(counts.items())]}
+        write_json(self.path(key), entry)
+
+    # ***********************************************************************************************************************************************
+    # Returns the cached global wrap-up lines of a key from wrap_up_key(), or None if there aren't any. The entry is marked as just used.
+    # ***********************************************************************************************************************************************
+    def load_wrap_up(self, key):
+        entry = self.load(key)
+        if (entry is None) or ("wrap_up" not in entry):
+            return None
+        return entry["wrap_up"]
+
+    # ***********************************************************************************************************************************************
+    # Caches the global wrap-up lines of a run, each line ending with its new line, under a key from wrap_up_key().
+    # ***********************************************************************************************************************************************
+    def store_wrap_up(self, key, lines):
+        write_json(self.path(key), {"wrap_up": lines})
+
+    # ***********************************************************************************************************************************************
+    # Records the banner and summary texts of a lint run, for runs where every module comes from the cache.
+    # ***********************************************************************************************************************************************
+    def update_index(self, output):
+        if output.preamble:
+            self.preamble = output.preamble
+        for _, kind, number, text in output.summary:
+            self.texts["{} {}".format(kind, number)] = text
+        write_json(os.path.join(self.directory, INDEX_FILE), {"version": CACHE_VERSION, "preamble": self.preamble, "texts": self.texts})
+
+    # ***********************************************************************************************************************************************
+    # Returns the cached modules as a CachedOutput.
+    #
+    # Parameters:
+    #   entries : The cached entries, in file list order.
+    #   newline : The line ending of the summary rows.
+    #   wrap_up : The global wrap-up lines to include, from load_wrap_up(), or None.
+    # ***********************************************************************************************************************************************
+    def output(self, entries, newline, wrap_up=None):
+        output = CachedOutput(self.preamble, newline)
+        counts = {}
+        for entry in entries:
+            for lines in entry["sections"]:
+                output.modules.append([lint_output.MODULE_HEADER.match(lines[0].strip()).group(1), lines])
+            for kind, number, count in entry["counts"]:
+                counts[(kind, number)] = counts.get((kind, number), 0) + count
+        if wrap_up is not None:
+            output.global_lines = wrap_up
+            for message, count in count_messages(wrap_up).items():
+                counts[message] = counts.get(message, 0) + count
+        output.summary = self.summary_rows(counts)
+        return output
+
+    # ***********************************************************************************************************************************************
+    # Returns the rows of a summary table, [count, kind, number, text], for a dict of (kind, number) to count.
+    # ***********************************************************************************************************************************************
+    def summary_rows(self, counts):
+        return [[count, kind, number, self.texts.get("{} {}".format(kind, number), "")]
+                for (kind, number), count in sorted(counts.items(), key=lambda item: item[0][1])]
+
+    # ***********************************************************************************************************************************************
+    # Deletes the sections used least recently until the cached sections take no more than max_size bytes.
+    #
+    # Returns:
+    #   The number of sections deleted.
+    # ***********************************************************************************************************************************************
+    def evict(self, max_size):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SECTION_EXTENSION) and (entry.name != INDEX_FILE) and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        return evicted
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# count_messages
+#   Returns the number of each message in lines of lint output that lint counts in its summary table, as a dict of (kind, number) to count.
+# ***************************************************************************************************************************************************
+def count_messages(lines):
+    counts = {}
+    for message in lint_output.LintOutputParser().parse(lines):
+        if (message.kind, message.number) not in lint_output.UNSUMMARISED_MESSAGES:
+            counts[(message.kind, message.number)] = counts.get((message.kind, message.number), 0) + 1
+    return counts
+
+
+# ***************************************************************************************************************************************************
+# write_json
+#   Writes a JSON file, replacing it atomically so an interrupted run can't leave a truncated file behind.
+# ***************************************************************************************************************************************************
+def write_json(file_name, data):
+    temp_name = file_name + ".tmp"
+    with open(temp_name, "w", encoding=lint_output.LINT_OUTPUT_ENCODING) as file:
+        json.dump(data, file, separators=(",", ":"))
+    os.replace(temp_name, file_name)
+
+
+# ***************************************************************************************************************************************************
+# module_key
+#   Returns the key a module's section is cached under.
+#
+#   Parameters:
+#       path          : The module's path, made absolute, as lint writes it in its output.
+#       digest        : The SHA-1 of the module and everything it includes, from IncludeGraph.unit_digests().
+#       configuration : The digest of the options from the .lnt files.
+#       command       : The lint command.
+# ***************************************************************************************************************************************************
+def module_key(path, digest, configuration, command):
+    text = "\0".join([makeLintFileList.normalise_path(os.path.abspath(path)), digest, configuration] + command)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+# ***************************************************************************************************************************************************
+# wrap_up_key
+#   Returns the key the global wrap-up of a set of modules is cached under.
+#
+#   Parameters:
+#       keys          : The module_key() of every module in the run.
+#       configuration : The digest of the options from the .lnt files the run is made with.
+# ***************************************************************************************************************************************************
+def wrap_up_key(keys, configuration):
+    text = "\0".join(["wrap-up", configuration] + sorted(keys))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+# ***************************************************************************************************************************************************
+# partial_wrap_up
+#   Returns the global wrap-up lines of a run of only some of the modules, with PARTIAL_WRAP_UP_NOTE in front of them.
+#
+#   Parameters:
+#       lines   : The global wrap-up lines of the run.
+#       linted  : The number of modules linted in the run.
+#       total   : The number of modules in the output.
+#       newline : The new line the output is written with.
+# ***************************************************************************************************************************************************
+def partial_wrap_up(lines, linted, total, newline):
+    return [PARTIAL_WRAP_UP_NOTE.format(linted, total) + newline, newline] + list(lines)
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Lints the modules of a file list whose output isn't cached, and merges the results.")
+    parser.add_argument("file_list", help="The file list written by makeLintFileList.py.")
+    parser.add_argument("--lnt", "-l", action="append", default=[],
+                        help="A .lnt file lint is run with, for its -i include directories and options. May be given more than once; the files "
+                             "are read in order, as lint reads them.")
+    parser.add_argument("--output", "-o", default=run_lint_shards.DEFAULT_OUTPUT_FILE,
+                        help="The merged output file (Default = {}).".format(run_lint_shards.DEFAULT_OUTPUT_FILE))
+    parser.add_argument("--cache", "-c", default=DEFAULT_CACHE_DIRECTORY,
+                        help="The directory the module sections are cached in (Default = {}).".format(DEFAULT_CACHE_DIRECTORY))
+    parser.add_argument("--max_size", "-m", type=int, default=DEFAULT_MAX_SIZE_MB,
+                        help="The most the cached sections may take, in MB (Default = {}).".format(DEFAULT_MAX_SIZE_MB))
+    parser.add_argument("--graph", "-g", default=include_graph.DEFAULT_CACHE_FILE,
+                        help="The include graph cache of include_graph.py (Default = {}).".format(include_graph.DEFAULT_CACHE_FILE))
+    parser.add_argument("--modules", default=DEFAULT_MODULES_FILE,
+                        help="The file the modules to lint are written to (Default = {}).".format(DEFAULT_MODULES_FILE))
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="The maximum number of files to read at once (Default = number of CPU cores).")
+    parser.add_argument("--lint", nargs=argparse.REMAINDER, required=True,
+                        help="The lint command and its options. Must be the last option.")
+    args = parser.parse_args(args)
+
+    if not args.lint:
+        parser.error("--lint needs a command")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.max_size < 0:
+        parser.error("--max_size can't be negative")
+    for name in [args.file_list] + args.lnt:
+        if not os.path.isfile(name):
+            parser.error("Couldn't find {}".format(name))
+    return args
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    configuration = lnt_options.resolve(args.lnt)
+    for error in configuration.errors:
+        stderr_out("Python Error: {}".format(error))
+    if configuration.errors:
+        sys.exit(-1)
+
+    start = time.perf_counter()
+    units = run_lint_shards.read_file_list(args.file_list)
+    graph = include_graph.IncludeGraph(args.graph)
+    graph.update(units, configuration.includes, args.jobs)
+    graph.save()
+    digests = graph.unit_digests(units)
+
+    cache = LintResultCache(args.cache)
+    keys = {}
+    entries = {}
+    for unit in units:
+        path = os.path.normpath(makeLintFileList.native_path(unit))
+        keys[unit] = module_key(path, digests[path], configuration.digest(), args.lint)
+        entry = cache.load(keys[unit])
+        if entry is not None:
+            entries[unit] = entry
+    to_lint = [unit for unit in units if unit not in entries]
+    print("{} of {} modules cached ({:.2f} s)".format(len(entries), len(units), time.perf_counter() - start))
+
+    wrap_key = wrap_up_key(keys.values(), configuration.digest())
+    wrap_up = None
+    if not to_lint:
+        wrap_up = cache.load_wrap_up(wrap_key)
+        if wrap_up is None:
+            # Only a run of every module gives their global wrap-up.
+            print("The global wrap-up isn't cached, so every module is linted")
+            to_lint = units
+            entries = {}
+
+    outputs = []
+    if to_lint:
+        makeLintFileList.write_generated_file(args.modules, [unit + "\n" for unit in to_lint])
+        text, seconds = run_lint_shards.run_shard(args.lint, args.modules)
+        if text is None:
+            stderr_out("Python Error: Lint failed to run.", True)
+        print("Linted {} modules ({:.1f} s)".format(len(to_lint), seconds))
+
+        fresh = run_lint_shards.LintRunOutput(text)
+        sections = {}
+        for path, lines in fresh.modules:
+            sections.setdefault(makeLintFileList.normalise_path(path), []).append(lines)
+        for unit in to_lint:
+            linted = sections.get(makeLintFileList.normalise_path(os.path.abspath(makeLintFileList.native_path(unit))))
+            if linted is not None:
+                cache.store(keys[unit], linted)
+        if len(to_lint) == len(units):
+            cache.store_wrap_up(wrap_key, fresh.global_lines)
+        else:
+            fresh.global_lines = partial_wrap_up(fresh.global_lines, len(to_lint), len(units), fresh.newline)
+        cache.update_index(fresh)
+        outputs.append(fresh)
+
+    newline = outputs[0].newline if outputs else run_lint_shards.LintRunOutput("".join(cache.preamble)).newline
+    outputs.append(cache.output([entries[unit] for unit in units if unit in entries], newline, wrap_up))
+    # Lint writes the module paths made absolute.
+    merged = run_lint_shards.merge_outputs(outputs, [os.path.abspath(makeLintFileList.native_path(unit)) for unit in units])
+    with open(args.output, "w", encoding=run_lint_shards.OUTPUT_ENCODING, newline="") as file:
+        file.write(merged)
+
+    evicted = cache.evict(args.max_size * 1024 * 1024)
+    if evicted:
+        print("Evicted {} cached modules".format(evicted))
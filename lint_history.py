@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Keeps the lint messages of every build in a SQLite database, so they can be looked at after the lint output is deleted.
+#
+#   Usage:
+#     python lint_history.py ingest --build 1234 --variant GVI075 lint_all_output.txt
+#     python lint_history.py query --number 9036 --file control_initialisation.c --first
+#
+#   ingest adds the messages of a lint output under a build number and variant, replacing any messages already stored for them. The whole output
+#   goes in as a single transaction, so a failed ingest leaves the database as it was.
+#
+#   query lists the stored messages, filtered by any of --build, --variant, --file, --number, --kind and --rule. --file matches the file name
+#   (case insensitive), or the end of the path if it has a \ or / in it. Instead of listing the messages, --first lists the first build each
+#   message number was seen in for each file, and --count lists the number of messages in each build.
+#
+#   The database defaults to lint_history.db next to this script.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-009
+#     - Created.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import datetime
+import ntpath
+import os
+import sqlite3
+import sys
+
+import lint_output
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+DEFAULT_DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lint_history.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id       INTEGER PRIMARY KEY,
+    build    INTEGER NOT NULL,
+    variant  TEXT NOT NULL,
+    output   TEXT NOT NULL,
+    ingested TEXT NOT NULL,
+    UNIQUE (build, variant)
+);
+CREATE TABLE IF NOT EXISTS messages (
+    build_id    INTEGER NOT NULL REFERENCES builds (id),
+    module      TEXT,
+    pass_number INTEGER NOT NULL,
+    file        TEXT,
+    file_name   TEXT,
+    line        INTEGER,
+    kind        TEXT NOT NULL,
+    number      INTEGER NOT NULL,
+    rule        TEXT,
+    category    TEXT,
+    text        TEXT NOT NULL,
+    source      TEXT
+);
+CREATE INDEX IF NOT EXISTS messages_build ON messages (build_id);
+CREATE INDEX IF NOT EXISTS messages_file ON messages (file_name, number);
+CREATE INDEX IF NOT EXISTS messages_number ON messages (number);
+CREATE INDEX IF NOT EXISTS messages_rule ON messages (rule);
+"""
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# The lint message database.
+class LintHistory:
+
+    # ***********************************************************************************************************************************************
+    # Opens the database, creating it if it doesn't exist.
+    # ***********************************************************************************************************************************************
+    def __init__(self, file_name):
+        self.connection = sqlite3.connect(file_name)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    # ***********************************************************************************************************************************************
+    # ingest
+    #   Stores the messages of a lint output under a build and variant, replacing what was stored for them before.
+    #
+    #   Returns:
+    #       The number of messages stored.
+    # ***********************************************************************************************************************************************
+    def ingest(self, file_name, build, variant):
+        # Lint names every message with the same few paths, so the file names are only worked out once per path.
+        file_names = {None: None}
+
+        def rows(build_id):
+            for message in lint_output.read_lint_output(file_name):
+                if message.file not in file_names:
+                    file_names[message.file] = ntpath.normcase(ntpath.basename(message.file))
+                name = file_names[message.file]
+                yield (build_id, message.module, message.pass_number, message.file, name, message.line, message.kind, message.number,
+                       message.rule, message.category, message.text, message.source)
+
+        # The connection commits on success and rolls back on an exception.
+        with self.connection:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT id FROM builds WHERE build = ? AND variant = ?", (build, variant))
+            row = cursor.fetchone()
+            if row is not None:
+                cursor.execute("DELETE FROM messages WHERE build_id = ?", row)
+                cursor.execute("DELETE FROM builds WHERE id = ?", row)
+            cursor.execute("INSERT INTO builds (build, variant, output, ingested) VALUES (?, ?, ?, ?)",
+                           (build, variant, os.path.abspath(file_name), datetime.datetime.now().isoformat(timespec="seconds")))
+            cursor.executemany("INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows(cursor.lastrowid))
+            return cursor.rowcount
+
+    # ***********************************************************************************************************************************************
+    # query
+    #   Runs a query against the messages of the builds matching filters.
+    #
+    #   Parameters:
+    #       select   : The columns to select.
+    #       filters  : A dict of filter name (as the query command line options) to value. None values are ignored.
+    #       group_by : An optional GROUP BY clause.
+    #       order_by : The ORDER BY clause.
+    #
+    #   Returns:
+    #       A cursor over the rows.
+    # ***********************************************************************************************************************************************
+    def query(self, select, filters, group_by=None, order_by="b.build, b.variant, m.rowid"):
+        conditions = []
+        parameters = []
+        if filters.get("build") is not None:
+            conditions.append("b.build = ?")
+            parameters.append(filters["build"])
+        if filters.get("variant") is not None:
+            conditions.append("b.variant = ?")
+            parameters.append(filters["variant"])
+        if filters.get("file") is not None:
+            name = ntpath.normcase(filters["file"])
+            if "\\" in name:
+                # The file name still goes through the index, and the rest of the path is checked on the rows it finds.
+                conditions.append("m.file_name = ? AND lower(replace(m.file, '/', '\\')) LIKE ? ESCAPE '!'")
+                parameters.append(ntpath.basename(name))
+                parameters.append("%" + name.replace("!", "!!").replace("%", "!%").replace("_", "!_"))
+            else:
+                conditions.append("m.file_name = ?")
+                parameters.append(name)
+        if filters.get("number") is not None:
+            conditions.append("m.number = ?")
+            parameters.append(filters["number"])
+        if filters.get("kind") is not None:
+            conditions.append("m.kind = ?")
+            parameters.append(filters["kind"])
+        if filters.get("rule") is not None:
+            conditions.append("m.rule = ?")
+            parameters.append(filters["rule"])
+
+        sql = "SELECT {} FROM messages m JOIN builds b ON b.id = m.build_id".format(select)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if group_by is not None:
+            sql += " GROUP BY " + group_by
+        sql += " ORDER BY " + order_by
+        return self.connection.execute(sql, parameters)
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# rule_name
+#   Returns a MISRA rule as stored, accepting "10.4" as well as "Rule 10.4".
+# ***************************************************************************************************************************************************
+def rule_name(rule):
+    if rule[:1].isdigit():
+        return "Rule " + rule
+    return rule
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Stores lint messages by build and queries them.")
+    parser.add_argument("--database", "-d", default=DEFAULT_DATABASE, help="The database file (Default = {}).".format(DEFAULT_DATABASE))
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    ingest = commands.add_parser("ingest", help="Store the messages of a lint output.")
+    ingest.add_argument("output", help="The lint output, for example lint_all_output.txt.")
+    ingest.add_argument("--build", "-b", type=int, required=True, help="The build number.")
+    ingest.add_argument("--variant", "-v", default="", help="The variant linted, for example GVI075 (Default = none).")
+
+    query = commands.add_parser("query", help="List stored messages.")
+    query.add_argument("--build", "-b", type=int, default=None, help="Only this build.")
+    query.add_argument("--variant", "-v", default=None, help="Only this variant.")
+    query.add_argument("--file", "-f", default=None, help="Only this file name, or path ending if it has a \\ or /.")
+    query.add_argument("--number", "-n", type=int, default=None, help="Only this message number.")
+    query.add_argument("--kind", "-k", choices=lint_output.MESSAGE_KINDS, default=None, help="Only this kind of message.")
+    query.add_argument("--rule", "-r", type=rule_name, default=None, help="Only this MISRA rule, for example 10.4 or \"Directive 4.9\".")
+    summary = query.add_mutually_exclusive_group()
+    summary.add_argument("--first", action="store_true", help="List the first build each message number was seen in for each file.")
+    summary.add_argument("--count", action="store_true", help="List the number of messages in each build.")
+    return parser.parse_args(args)
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    try:
+        history = LintHistory(args.database)
+    except sqlite3.Error as error:
+        stderr_out("Python Error: Couldn't open {}: {}".format(args.database, error), True)
+
+    try:
+        if args.command == "ingest":
+            count = history.ingest(args.output, args.build, args.variant)
+            print("Stored {} messages for build {} {}".format(count, args.build, args.variant).rstrip())
+        elif args.first:
+            for row in history.query("m.file, m.kind, m.number, MIN(b.build), COUNT(DISTINCT b.build)", vars(args),
+                                     group_by="m.file, m.kind, m.number", order_by="m.file, m.number"):
+                print("{}  {} {}: first seen in build {}, in {} builds".format(*row))
+        elif args.count:
+            for row in history.query("b.build, b.variant, COUNT(*)", vars(args), group_by="b.id", order_by="b.build, b.variant"):
+                print("{}\t{}\t{}".format(*row))
+        else:
+            for row in history.query("b.build, b.variant, m.file, m.line, m.kind, m.number, m.text, m.rule, m.category", vars(args)):
+                build, variant, file, line, kind, number, text, rule, category = row
+                message = lint_output.LintMessage(None, None, file, line, None, kind, number, text, rule, category, None)
+                print("{}\t{}\t{}".format(build, variant, lint_output.format_message(message)))
+    except (OSError, sqlite3.Error) as error:
+        stderr_out("Python Error: {}".format(error), True)
+    finally:
+        history.close()
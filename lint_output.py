@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Parses the PC-lint output written by lint.bat (lint_all_output.txt). The output is read one line at a time and the messages are yielded as
+#   they are found, so memory use doesn't grow with the size of the output. File paths, message kinds and MISRA rules repeat on almost every
+#   message, so they are interned and every message with the same path shares one string.
+#
+#   The output is made up of:
+#     - A banner, ignored.
+#     - "--- Module:   <path> (C)" sections, one per module per pass. A message with a source location is normally preceded by the source line
+#       and a line with a "_" under the column, and looks like:
+#         <path>  <line>  <Kind> <number>: <text> [MISRA 2012 Rule x.y, <category>]
+#       Messages found at the end of a module follow a "--- Wrap-up for Module:" line and stay part of that module.
+#     - "--- Global Wrap-up" messages, which may have no source location ("<Kind> <number>: <text>").
+#     - A summary table of the number of each message, which doesn't include Info 830 ("Location cited in prior message").
+#
+#   Usage: python lint_output.py [--check] lint_all_output.txt
+#
+#   Without --check, the messages are written to stdout, one per line, separated by tabs. With --check, the messages are counted and compared with
+#   the summary table at the end of the output.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-006
+#     - Created.
+#   2026-Oct-18 - Request user-007
+#     - Added format_message.
+#   2026-Oct-18 - Request user-008
+#     - Split messages with split_message instead of a single pattern, which halves the parse time.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import re
+import sys
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+
+# Lint output is read as Latin-1, which maps every byte to a character, so a stray byte in an echoed source line can't stop the parse.
+LINT_OUTPUT_ENCODING = "latin-1"
+
+MESSAGE_KINDS = ("Error", "Warning", "Info", "Note")
+
+MODULE_HEADER = re.compile(r"--- Module:\s+(.*?)\s+\([^()]*\)\s*$")
+MODULE_WRAP_UP_HEADER = re.compile(r"\s*--- Wrap-up for Module:\s+(.*?)\s*$")
+GLOBAL_WRAP_UP_HEADER = "--- Global Wrap-up"
+SUMMARY_HEADER = re.compile(r"Count\s+Type\s+Number\s+Text\s*$")
+SUMMARY_ROW = re.compile(r"(\d+)\s+(\S+)\s+(\d+)\s+(.*?)\s*$")
+
+# The kind and number of a message. split_message() checks for the "<path>  <line>  " location in front of it separately, which is several times
+# faster than a single pattern for the whole line.
+MESSAGE_KIND = re.compile(r"(Error|Warning|Info|Note) (\d+): ")
+
+# The MISRA rule at the end of a message, for example "[MISRA 2012 Rule 10.4, required]".
+MISRA_RULE = re.compile(r"\s*\[MISRA \d+ (?P<rule>(?:Rule|Directive) [\d.]+), (?P<category>\w+)\]$")
+
+# The line under an echoed source line that marks the column with "_".
+CARET = re.compile(r"( *)_$")
+
+# Messages lint leaves out of the summary table.
+UNSUMMARISED_MESSAGES = {("Info", 830)}
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# A single lint message. Strings that repeat from message to message (paths, kinds, rules and categories) are interned.
+class LintMessage:
+    __slots__ = ("module", "pass_number", "file", "line", "column", "kind", "number", "text", "rule", "category", "source")
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   module      : The path of the module being linted, or None for global wrap-up messages.
+    #   pass_number : The lint pass (1 for the first time the module appears in the output, 2 for the second, ...).
+    #   file        : The file the message refers to, or None if it has no location.
+    #   line        : The line number in file, or None.
+    #   column      : The column marked under the echoed source line (0 based), or None if the source wasn't echoed.
+    #   kind        : "Error", "Warning", "Info" or "Note".
+    #   number      : The message number.
+    #   text        : The message text, without the MISRA rule.
+    #   rule        : The MISRA rule, for example "Rule 10.4" or "Directive 4.9", or None.
+    #   category    : The MISRA category ("required", "advisory", ...), or None.
+    #   source      : The echoed source line, or None.
+    # ***********************************************************************************************************************************************
+    def __init__(self, module, pass_number, file, line, column, kind, number, text, rule, category, source):
+        self.module = module
+        self.pass_number = pass_number
+        self.file = file
+        self.line = line
+        self.column = column
+        self.kind = kind
+        self.number = number
+        self.text = text
+        self.rule = rule
+        self.category = category
+        self.source = source
+
+    def __repr__(self):
+        return "LintMessage({!r}, {!r}, {} {}: {!r})".format(self.file, self.line, self.kind, self.number, self.text)
+
+
+# Parses lint output. The summary table isn't made of messages, so it is collected on the parser as it is passed.
+class LintOutputParser:
+
+    def __init__(self):
+        # The summary table as (count, kind, number, text) tuples, filled in once parse() gets to it.
+        self.summary = []
+        # The number of "--- Module:" sections seen.
+        self.module_count = 0
+        self._interned = {}
+
+    # ***********************************************************************************************************************************************
+    # Returns the one shared copy of text. A local dict is used rather than sys.intern so the strings are freed along with the parser.
+    # ***********************************************************************************************************************************************
+    def intern(self, text):
+        if text is None:
+            return None
+        return self._interned.setdefault(text, text)
+
+    # ***********************************************************************************************************************************************
+    # parse
+    #   Yields a LintMessage for each message in lines, in the order they appear.
+    #
+    #   Parameters:
+    #       lines : An iterable of lines, for example an open file. Line endings are ignored.
+    # ***********************************************************************************************************************************************
+    def parse(self, lines):
+        module = None
+        pass_number = 0
+        passes = {}
+        column = None
+        source = None
+        caret_seen = False
+        in_summary = False
+
+        for line in lines:
+            line = line.rstrip("\r\n")
+
+            if in_summary:
+                row = SUMMARY_ROW.match(line)
+                if row:
+                    self.summary.append((int(row.group(1)), self.intern(row.group(2)), int(row.group(3)), row.group(4)))
+                    continue
+                if not line.strip():
+                    continue
+                # The table has ended, for example where the outputs of several runs have been joined together.
+                in_summary = False
+
+            if caret_seen:
+                # The line after a caret line is always the echoed source, whatever it looks like.
+                source = line
+                caret_seen = False
+                continue
+
+            message = split_message(line)
+            if message:
+                file, line_number, kind, number, text = message
+                rule = None
+                category = None
+                misra = MISRA_RULE.search(text) if "[MISRA" in text else None
+                if misra:
+                    text = text[:misra.start()]
+                    rule = self.intern(misra.group("rule"))
+                    category = self.intern(misra.group("category"))
+                yield LintMessage(module, pass_number, self.intern(file), line_number, column if source is not None else None,
+                                  self.intern(kind), number, text, rule, category, source)
+                continue
+
+            # Anything that isn't a message ends the run of messages that belong to the last echoed source line.
+            source = None
+            column = None
+
+            caret = CARET.match(line)
+            if caret:
+                column = len(caret.group(1))
+                caret_seen = True
+                continue
+
+            header = MODULE_HEADER.match(line)
+            if header:
+                module = self.intern(header.group(1))
+                pass_number = passes.get(module, 0) + 1
+                passes[module] = pass_number
+                self.module_count += 1
+            elif line.strip() == GLOBAL_WRAP_UP_HEADER:
+                module = None
+            elif SUMMARY_HEADER.match(line):
+                in_summary = True
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# split_message
+#   Splits a line of lint output into the parts of a message.
+#
+#   Returns:
+#       A tuple of (file, line, kind, number, text), or None if the line isn't a message. file and line are None for messages with no location.
+# ***************************************************************************************************************************************************
+def split_message(line):
+    # Most lines aren't messages, and most of those don't have a ": " to search for.
+    if ": " not in line:
+        return None
+    match = MESSAGE_KIND.search(line)
+    if match is None:
+        return None
+
+    file = None
+    line_number = None
+    start = match.start()
+    if start:
+        if line[start - 2:start] != "  ":
+            return None
+        file, separator, line_number = line[:start - 2].rpartition("  ")
+        if (not separator) or (not file) or file[0].isspace() or not line_number.isdigit():
+            return None
+        line_number = int(line_number)
+    return file, line_number, match.group(1), int(match.group(2)), line[match.end():].rstrip()
+
+
+# ***************************************************************************************************************************************************
+# open_lint_output
+#   Opens a lint output file for reading with the encoding lint output is read with.
+# ***************************************************************************************************************************************************
+def open_lint_output(file_name):
+    return open(file_name, encoding=LINT_OUTPUT_ENCODING)
+
+
+# ***************************************************************************************************************************************************
+# read_lint_output
+#   Yields a LintMessage for each message in a lint output file. The file is closed once the generator is finished with.
+# ***************************************************************************************************************************************************
+def read_lint_output(file_name):
+    with open_lint_output(file_name) as file:
+        yield from LintOutputParser().parse(file)
+
+
+# ***************************************************************************************************************************************************
+# format_message
+#   Returns a message formatted the way lint writes it, without a line ending.
+# ***************************************************************************************************************************************************
+def format_message(message):
+    text = "{} {}: {}".format(message.kind, message.number, message.text)
+    if message.rule is not None:
+        text += " [MISRA 2012 {}, {}]".format(message.rule, message.category)
+    if message.file is not None:
+        text = "{}  {}  {}".format(message.file, message.line, text)
+    return text
+
+
+# ***************************************************************************************************************************************************
+# check_summary
+#   Counts the messages in a lint output file and compares the counts with its summary table.
+#
+#   Returns:
+#       A list of strings describing the differences. Empty if the counts match.
+# ***************************************************************************************************************************************************
+def check_summary(file_name):
+    parser = LintOutputParser()
+    counts = {}
+    with open_lint_output(file_name) as file:
+        for message in parser.parse(file):
+            key = (message.kind, message.number)
+            counts[key] = counts.get(key, 0) + 1
+
+    differences = []
+    summary = {(kind, number): count for count, kind, number, _ in parser.summary}
+    for key in sorted(set(counts) | set(summary), key=lambda key: key[1]):
+        if key in UNSUMMARISED_MESSAGES:
+            continue
+        if counts.get(key, 0) != summary.get(key, 0):
+            differences.append("{} {}: {} in the summary, {} found".format(key[0], key[1], summary.get(key, 0), counts.get(key, 0)))
+    return differences
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Parses PC-lint output.")
+    parser.add_argument("file", help="The lint output file, for example lint_all_output.txt.")
+    parser.add_argument("--check", "-c", action="store_true", help="Compare the messages found with the summary table instead of listing them.")
+    return parser.parse_args(args)
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    try:
+        if args.check:
+            differences = check_summary(args.file)
+            for difference in differences:
+                print(difference)
+            sys.exit(1 if differences else 0)
+
+        for message in read_lint_output(args.file):
+            print("\t".join("" if value is None else str(value) for value in (
+                message.file, message.line, message.kind, message.number, message.rule, message.category, message.text)))
+    except OSError as error:
+        stderr_out("Couldn't read '{}': {}".format(args.file, error), True)
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Counts the messages in one or more lint outputs by:
+#     - module    : The module being linted ("(global)" for the global wrap-up).
+#     - directory : The directory of the file the message refers to ("(none)" for messages with no location).
+#     - message   : The message, for example "Info 830".
+#     - severity  : Error, Warning, Info or Note.
+#     - rule      : The MISRA 2012 rule or directive.
+#     - category  : The MISRA category (required, advisory, ...).
+#     - heatmap   : The MISRA rule by directory.
+#
+#   Usage: python lint_stats.py [--format json] [--output stats.csv] [--total] archive\*\lint_all_output.txt
+#
+#   Wildcards are expanded by the script, so they work from cmd.exe. Each output is read by a process from a pool, so a year of nightly outputs
+#   is spread over all the cores. Reading an output of 1500 messages takes about 20 ms on one core, so the first run over 2000 outputs takes
+#   about 45 s on one core (divided by the number of cores). Archived outputs don't change, so the counts of each output are kept in a cache
+#   (lint_stats_cache.json by default) and later runs only read the outputs added since: on one core, 2000 cached outputs take about 3 s with
+#   --total, or about 8 s without, most of which is writing the 700,000 rows.
+#
+#   The CSV has one row per output, dimension and key (output,dimension,key,subkey,count; subkey is only used by the heatmap, for the directory),
+#   which suits trending. The JSON holds the same counts as {output: {dimension: {key: count}}}, with the heatmap as {rule: {directory: count}}.
+#   With --total, the outputs are added together and reported as a single "(total)" output.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-008
+#     - Created.
+#   2026-Oct-18 - Request user-008
+#     - Kept the counts of each output in a cache, so only new or changed outputs are read again.
+#   2026-Oct-18 - Request user-008
+#     - Take the resolution of file modification times from file_times.py.
+#   2026-Oct-18 - Request user-008
+#     - Renamed --no-cache to --no_cache, like the other options.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import glob
+import json
+import ntpath
+import os
+import sys
+import time
+
+import file_times
+import lint_output
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+DIMENSIONS = ("module", "directory", "message", "severity", "rule", "category", "heatmap")
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_FILE = "lint_stats_cache.json"
+
+GLOBAL_MODULE = "(global)"
+NO_DIRECTORY = "(none)"
+TOTAL_OUTPUT = "(total)"
+
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# The message groups of each lint output counted so far, kept from run to run.
+class GroupCache:
+
+    # ***********************************************************************************************************************************************
+    # Loads the cache, if there is a usable one.
+    #
+    # Parameters:
+    #   cache_file : The file the counts are kept in, or None to not keep them.
+    # ***********************************************************************************************************************************************
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self.saved_ns = 0
+        # Absolute path to [modification time, size, [[module, file, kind, number, rule, category, count], ...]]. The strings of a group are held
+        # as indexes into strings, as the same paths and rules turn up in every output.
+        self.outputs = {}
+        self.strings = []
+        self.string_ixs = {}
+        self.changed = False
+
+        if cache_file is None:
+            return
+        try:
+            with open(cache_file) as file:
+                cache = json.load(file)
+            if cache.get("version") == CACHE_VERSION:
+                self.saved_ns = cache["saved"]
+                self.outputs = cache["outputs"]
+                self.strings = cache["strings"]
+                self.string_ixs = {text: ix for ix, text in enumerate(self.strings)}
+        except (OSError, ValueError, KeyError, AttributeError):
+            # A missing or damaged cache just means every output is read.
+            pass
+
+    # ***********************************************************************************************************************************************
+    # Returns the groups of an output as a Counter, or None if the output isn't in the cache or has changed since it was counted.
+    #
+    # Parameters:
+    #   path : The absolute path of the output.
+    #   stat : The os.stat() of the output.
+    # ***********************************************************************************************************************************************
+    def lookup(self, path, stat):
+        cached = self.outputs.get(path)
+        # An output changed within the time stamp resolution of when the cache was saved may have changed again since without its time stamp
+        # changing, so it is read again.
+        if ((cached is None) or (cached[0] != stat.st_mtime_ns) or (cached[1] != stat.st_size) or
+                (stat.st_mtime_ns >= self.saved_ns - file_times.MTIME_RESOLUTION_NS)):
+            return None
+        strings = self.strings
+        return Counter({(strings[module], strings[file], strings[kind], number, strings[rule], strings[category]): count
+                        for module, file, kind, number, rule, category, count in cached[2]})
+
+    # ***********************************************************************************************************************************************
+    # Records the groups of an output.
+    #
+    # Parameters:
+    #   path   : The absolute path of the output.
+    #   stat   : The os.stat() of the output, taken before it was read.
+    #   groups : The Counter of groups from count_groups().
+    # ***********************************************************************************************************************************************
+    def store(self, path, stat, groups):
+        self.outputs[path] = [stat.st_mtime_ns, stat.st_size,
+                              [[self.string_ix(module), self.string_ix(file), self.string_ix(kind), number, self.string_ix(rule),
+                                self.string_ix(category), count]
+                               for (module, file, kind, number, rule, category), count in groups.items()]]
+        self.changed = True
+
+    # ***********************************************************************************************************************************************
+    # Returns the index of text in strings, adding it if it isn't there yet. text may be None (for messages with no file).
+    # ***********************************************************************************************************************************************
+    def string_ix(self, text):
+        ix = self.string_ixs.get(text)
+        if ix is None:
+            ix = len(self.strings)
+            self.strings.append(text)
+            self.string_ixs[text] = ix
+        return ix
+
+    # ***********************************************************************************************************************************************
+    # Writes the counts to the cache file if any were added. The file is replaced atomically so an interrupted run can't leave a truncated
+    # cache behind.
+    # ***********************************************************************************************************************************************
+    def save(self):
+        if (self.cache_file is None) or (not self.changed):
+            return
+        cache = {"version": CACHE_VERSION,
+                 "saved": time.time_ns(),
+                 "strings": self.strings,
+                 "outputs": self.outputs}
+        temp_name = self.cache_file + ".tmp"
+        try:
+            with open(temp_name, "w") as file:
+                json.dump(cache, file, separators=(",", ":"))
+            os.replace(temp_name, self.cache_file)
+        except OSError as error:
+            stderr_out("Couldn't save the counts cache '{}': {}".format(self.cache_file, error))
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# count_groups
+#   Counts the messages of a lint output by group, a group being every message with the same module, file, kind, number, rule and category.
+#   Counter does the counting in C in a single pass, and there are far fewer groups than messages, so the dimensions are worked out from the
+#   groups afterwards instead of message by message.
+#
+#   Returns:
+#       A tuple of the file name and a Counter of groups, or the file name and None if the file couldn't be read. Run in a worker process, so
+#       errors are returned rather than printed.
+# ***************************************************************************************************************************************************
+def count_groups(file_name):
+    try:
+        groups = Counter((message.module or GLOBAL_MODULE,
+                          message.file,
+                          message.kind,
+                          message.number,
+                          message.rule or "",
+                          message.category or "") for message in lint_output.read_lint_output(file_name))
+    except OSError:
+        groups = None
+    return file_name, groups
+
+
+# ***************************************************************************************************************************************************
+# dimension_counts
+#   Works out the count of every key of every dimension from a Counter of groups.
+#
+#   Parameters:
+#       groups      : The Counter of groups from count_groups().
+#       directories : A dict of file to directory, shared between calls so each file is only split once (Default = a new dict).
+#
+#   Returns:
+#       A dict of dimension name to Counter. The heatmap Counter is keyed by (rule, directory) tuples.
+# ***************************************************************************************************************************************************
+def dimension_counts(groups, directories=None):
+    counts = {dimension: Counter() for dimension in DIMENSIONS}
+    if directories is None:
+        directories = {}
+    directories.setdefault(None, NO_DIRECTORY)
+    modules = counts["module"]
+    directory_counts = counts["directory"]
+    messages = counts["message"]
+    severities = counts["severity"]
+    rules = counts["rule"]
+    categories = counts["category"]
+    heatmap = counts["heatmap"]
+    for (module, file, kind, number, rule, category), count in groups.items():
+        directory = directories.get(file)
+        if directory is None:
+            directory = directories[file] = ntpath.dirname(file)
+        modules[module] += count
+        directory_counts[directory] += count
+        messages[(kind, number)] += count
+        severities[kind] += count
+        if rule:
+            rules[rule] += count
+            categories[category] += count
+            heatmap[(rule, directory)] += count
+    # Messages are counted by (kind, number) first, so the text is only made once per message rather than once per group.
+    counts["message"] = Counter({"{} {}".format(kind, number): count for (kind, number), count in messages.items()})
+    return counts
+
+
+# ***************************************************************************************************************************************************
+# write_csv
+#   Writes the counts of each output as output,dimension,key,subkey,count rows, most frequent first.
+# ***************************************************************************************************************************************************
+def write_csv(file, results):
+    writer = csv.writer(file, lineterminator="\n")
+    writer.writerow(["output", "dimension", "key", "subkey", "count"])
+    for output, counts in results:
+        for dimension in DIMENSIONS:
+            for key, count in counts[dimension].most_common():
+                key, subkey = key if dimension == "heatmap" else (key, "")
+                writer.writerow([output, dimension, key, subkey, count])
+
+
+# ***************************************************************************************************************************************************
+# write_json
+#   Writes the counts of each output as JSON.
+# ***************************************************************************************************************************************************
+def write_json(file, results):
+    data = {}
+    for output, counts in results:
+        data[output] = {dimension: dict(counts[dimension].most_common()) for dimension in DIMENSIONS if dimension != "heatmap"}
+        heatmap = {}
+        for (rule, directory), count in counts["heatmap"].most_common():
+            heatmap.setdefault(rule, {})[directory] = count
+        data[output]["heatmap"] = heatmap
+    json.dump(data, file, indent=1)
+    file.write("\n")
+
+
+# ***************************************************************************************************************************************************
+# expand_inputs
+#   Expands wildcards in the input names, in sorted order. Names without wildcards are kept as they are.
+# ***************************************************************************************************************************************************
+def expand_inputs(names):
+    files = []
+    for name in names:
+        if glob.has_magic(name):
+            files += sorted(glob.glob(name, recursive=True))
+        else:
+            files.append(name)
+    return files
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Counts lint messages by module, directory, message, severity and MISRA rule.")
+    parser.add_argument("inputs", nargs="+", help="The lint outputs to count. Wildcards are allowed.")
+    parser.add_argument("--format", "-f", choices=("csv", "json"), default="csv", help="The output format (Default = csv).")
+    parser.add_argument("--output", "-o", default=None, help="The file to write the counts to (Default = stdout).")
+    parser.add_argument("--total", "-t", action="store_true", help="Add all the outputs together.")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="The number of processes reading outputs (Default = number of CPU cores).")
+    parser.add_argument("--cache", "-c", default=DEFAULT_CACHE_FILE,
+                        help="The file the counts of each output are kept in (Default = {}).".format(DEFAULT_CACHE_FILE))
+    parser.add_argument("--no_cache", action="store_true", help="Read every output, and don't save the counts.")
+    args = parser.parse_args(args)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    args.inputs = expand_inputs(args.inputs)
+    if not args.inputs:
+        parser.error("No lint outputs found")
+    return args
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+    cache = GroupCache(None if args.no_cache else args.cache)
+
+    # Only the outputs that aren't in the cache are read. The time stamps are taken before reading, so an output written to while it is read
+    # is read again next time.
+    counted = {}
+    stats = {}
+    for file_name in args.inputs:
+        try:
+            stats[file_name] = os.stat(file_name)
+        except OSError:
+            stderr_out("Python Error: Couldn't read {}".format(file_name), True)
+        groups = cache.lookup(os.path.abspath(file_name), stats[file_name])
+        if groups is not None:
+            counted[file_name] = groups
+    misses = [file_name for file_name in args.inputs if file_name not in counted]
+
+    # A pool isn't worth starting for a single output.
+    if args.jobs == 1 or len(misses) <= 1:
+        read = [count_groups(file_name) for file_name in misses]
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            read = list(pool.map(count_groups, misses, chunksize=max(1, len(misses) // (args.jobs * 4))))
+
+    for file_name, groups in read:
+        if groups is None:
+            stderr_out("Python Error: Couldn't read {}".format(file_name), True)
+        cache.store(os.path.abspath(file_name), stats[file_name], groups)
+        counted[file_name] = groups
+    cache.save()
+    grouped = [(file_name, counted[file_name]) for file_name in args.inputs]
+
+    if args.total:
+        total = Counter()
+        for _, groups in grouped:
+            total.update(groups)
+        results = [(TOTAL_OUTPUT, dimension_counts(total))]
+    else:
+        directories = {}
+        results = [(file_name, dimension_counts(groups, directories)) for file_name, groups in grouped]
+
+    if args.output is None:
+        file = sys.stdout
+    else:
+        file = open(args.output, "w", newline="")
+    with file:
+        if args.format == "json":
+            write_json(file, results)
+        else:
+            write_csv(file, results)
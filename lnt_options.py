@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Works out the options a lint run ends up with from its .lnt files, without running lint. A variant is linted with a list of .lnt files, such
+#   as project_specific.lnt and GVI075.lnt; each is read in turn, following the .lnt files it names (co-tricore.lnt, au-misra3.lnt, ...), into a
+#   single ordered list of options. From that come the effective include path (-i) and define set (-d, +d and -u) of the variant.
+#
+#   Usage: python lnt_options.py [--base project_specific.lnt] [--includes] [--defines] [--options] GVI075.lnt GVx250B.lnt ...
+#
+#   Each variant is the --base files followed by its own file, and is named after its file. For each variant a line says whether its
+#   configuration is new, changed or unchanged since the last run, followed by what was asked for. A changed variant also lists the include
+#   directories and defines added and removed.
+#
+#   Options are read as lint reads them: /* */ and // comments are skipped, quotes group text with spaces in it and are then dropped, and
+#   %NAME% is replaced by the environment variable NAME (--env NAME=value sets one for the run). A name that isn't an option and ends in .lnt
+#   is read as another .lnt file, looked for relative to the current directory, then to the file naming it, then in the include path so far.
+#   Other names are modules to lint.
+#
+#   The result for each variant is saved in --cache along with a hash of every file read (and of every place a missing .lnt file was looked
+#   for) and the environment variables used. The next run uses it as long as none of them has changed.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - PC-lint Plus Reference Manual, options and indirect files.
+#
+# History:
+#   2026-Oct-18 - Request user-021
+#     - Created.
+#   2026-Oct-18 - Request user-024
+#     - The parameters of a function-like define are kept apart from its value, so a value starting with "(" isn't taken for them.
+#   2026-Oct-18 - Request user-021
+#     - Renamed --no-cache to --no_cache, like the other options.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import hashlib
+import json
+import ntpath
+import os
+import re
+import sys
+
+import makeLintFileList
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+DEFAULT_BASE_FILE = "project_specific.lnt"
+DEFAULT_CACHE_FILE = "lnt_options.json"
+
+# Increase when the layout of the cache or of a LintConfiguration changes, so older caches are discarded.
+CACHE_VERSION = 2
+
+# .lnt files are read as bytes decoded as Latin-1, which maps every byte to a character.
+LNT_ENCODING = "latin-1"
+
+# One piece of a .lnt file: a comment, white space, or an option or file name. Quotes and parentheses group text with spaces in it, so
+# +d"__bit=unsigned char" and -efile(451, stdint.h, stdio.h) are single options.
+LNT_TOKEN = re.compile(r'''
+      (?P<comment>/\*.*?(?:\*/|\Z)|//[^\n]*)
+    | (?P<space>\s+)
+    | (?P<token>(?:"[^"\n]*"?|\((?:[^()\n]|\([^()\n]*\))*\)?|/(?![/*])|[^\s"(/])+)
+    ''', re.DOTALL | re.VERBOSE)
+
+ENVIRONMENT_VARIABLE = re.compile(r"%(\w+)%")
+
+# The options that set the include path and the defines.
+INCLUDE_OPTION = re.compile(r"-i(.+)$", re.DOTALL)
+DEFINE_OPTION = re.compile(r"([-+])d([^=(\s]+)(\([^)]*\))?(?:=(.*))?$", re.DOTALL)
+UNDEFINE_OPTION = re.compile(r"-u([^=\s]+)$")
+
+# The value of a define given without one, as lint and compilers do.
+DEFAULT_DEFINE_VALUE = "1"
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# The options of a variant, from all its .lnt files.
+class LintConfiguration:
+
+    def __init__(self):
+        # Each option as [text, file, line], in the order lint reads them.
+        self.options = []
+        # The include directories, in search order, each once.
+        self.includes = []
+        # Define name to [value, locked, parameters]. A define set with +d is locked, and a later -d or -u of it is ignored, as lint does.
+        # parameters is the parameter list of a function-like define, such as "(x,y)", or None for an object-like one.
+        self.defines = {}
+        # Module names found in the .lnt files.
+        self.modules = []
+        # Path of every file read, or looked for and not found, to the SHA-1 of its contents (None if it doesn't exist).
+        self.files = {}
+        # Environment variable name to the value it had (None if it wasn't set).
+        self.environment = {}
+        # Problems found, such as a .lnt file that can't be found.
+        self.errors = []
+
+    # ***********************************************************************************************************************************************
+    # Returns a digest of the effective configuration: the options in order. It doesn't change for edits that don't change the options, such
+    # as to comments.
+    # ***********************************************************************************************************************************************
+    def digest(self):
+        text = "\n".join(option[0] for option in self.options)
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    # ***********************************************************************************************************************************************
+    # Returns the define set as a list of "NAME=value" strings, sorted by name.
+    # ***********************************************************************************************************************************************
+    def define_list(self):
+        defines = []
+        for name in sorted(self.defines):
+            value, _, parameters = self.defines[name]
+            defines.append("{}{}={}".format(name, parameters or "", value))
+        return defines
+
+    def to_json(self):
+        return {"options": self.options, "includes": self.includes, "defines": self.defines, "modules": self.modules, "files": self.files,
+                "environment": self.environment, "errors": self.errors}
+
+    @staticmethod
+    def from_json(data):
+        configuration = LintConfiguration()
+        for name, value in data.items():
+            setattr(configuration, name, value)
+        return configuration
+
+    # ***********************************************************************************************************************************************
+    # Records an option, and applies it to the include path and define set.
+    # ***********************************************************************************************************************************************
+    def add_option(self, text, file_name, line):
+        self.options.append([text, file_name, line])
+
+        match = INCLUDE_OPTION.match(text)
+        if match:
+            directory = match.group(1)
+            if directory not in self.includes:
+                self.includes.append(directory)
+            return
+
+        match = DEFINE_OPTION.match(text)
+        if match:
+            sign, name, parameters, value = match.groups()
+            if value is None:
+                value = DEFAULT_DEFINE_VALUE
+            if not self.defines.get(name, ["", False, None])[1]:
+                self.defines[name] = [value, sign == "+", parameters]
+            return
+
+        match = UNDEFINE_OPTION.match(text)
+        if match and not self.defines.get(match.group(1), ["", False, None])[1]:
+            self.defines.pop(match.group(1), None)
+
+
+# Reads .lnt files into a LintConfiguration.
+class LntReader:
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   environment : A dict of environment variable name to value, used for %NAME%. Names are matched ignoring case, as Windows does.
+    # ***********************************************************************************************************************************************
+    def __init__(self, environment):
+        self.environment = {name.upper(): value for name, value in environment.items()}
+        self.configuration = LintConfiguration()
+        # The .lnt files being read, outermost first, to find files that include themselves.
+        self.reading = []
+
+    # ***********************************************************************************************************************************************
+    # Returns the configuration of a list of .lnt files, read in order.
+    # ***********************************************************************************************************************************************
+    def read(self, file_names):
+        for file_name in file_names:
+            self.read_file(file_name, None, None)
+        return self.configuration
+
+    # ***********************************************************************************************************************************************
+    # Replaces %NAME% with the value of environment variable NAME, recording the values used. An unset variable is replaced by nothing.
+    # ***********************************************************************************************************************************************
+    def expand(self, text):
+        def value(match):
+            name = match.group(1)
+            found = self.environment.get(name.upper())
+            self.configuration.environment[name] = found
+            return found if found is not None else ""
+
+        return ENVIRONMENT_VARIABLE.sub(value, text)
+
+    # ***********************************************************************************************************************************************
+    # Returns the path of a .lnt file named in another, or None if it can't be found. Every place looked is recorded, so the file appearing
+    # there later shows up as a change.
+    #
+    # Parameters:
+    #   name      : The file name, as written.
+    #   including : The path of the file naming it, or None for a file given on the command line.
+    # ***********************************************************************************************************************************************
+    def find_file(self, name, including):
+        name = makeLintFileList.native_path(name)
+        candidates = [name]
+        if (including is not None) and (not os.path.isabs(name)):
+            candidates.append(os.path.join(os.path.dirname(including), name))
+            candidates += [os.path.join(makeLintFileList.native_path(directory), name) for directory in self.configuration.includes]
+
+        for candidate in candidates:
+            candidate = os.path.normpath(candidate)
+            if os.path.isfile(candidate):
+                return candidate
+            self.configuration.files.setdefault(candidate, None)
+        return None
+
+    # ***********************************************************************************************************************************************
+    # Reads a .lnt file, and the .lnt files it names.
+    #
+    # Parameters:
+    #   name      : The file name, as written.
+    #   including : The path of the file naming it, or None for a file given on the command line.
+    #   line      : The line of including it is named on.
+    # ***********************************************************************************************************************************************
+    def read_file(self, name, including, line):
+        path = self.find_file(name, including)
+        where = "" if including is None else " ({} line {})".format(including, line)
+        if path is None:
+            self.configuration.errors.append("Couldn't find {}{}".format(name, where))
+            return
+
+        key = makeLintFileList.normalise_path(path)
+        if key in self.reading:
+            self.configuration.errors.append("{} includes itself{}".format(name, where))
+            return
+
+        try:
+            with open(path, "rb") as file:
+                contents = file.read()
+        except OSError as error:
+            self.configuration.errors.append("Couldn't read {}{}: {}".format(name, where, error))
+            return
+        self.configuration.files[path] = hashlib.sha1(contents).hexdigest()
+
+        self.reading.append(key)
+        text = contents.decode(LNT_ENCODING)
+        line_number = 1
+        for match in LNT_TOKEN.finditer(text):
+            token = match.group("token")
+            if token is not None:
+                self.read_token(token, path, line_number)
+            line_number += match.group().count("\n")
+        self.reading.pop()
+
+    # ***********************************************************************************************************************************************
+    # Handles one option or file name of a .lnt file.
+    # ***********************************************************************************************************************************************
+    def read_token(self, token, path, line):
+        text = self.expand(token).replace('"', "")
+        if not text:
+            return
+        if text[0] in "-+":
+            self.configuration.add_option(text, path, line)
+        elif text.lower().endswith(".lnt"):
+            self.read_file(text, path, line)
+        else:
+            self.configuration.modules.append(text)
+
+
+# The configurations of the variants resolved before, kept in a cache file between runs.
+class ConfigurationCache:
+
+    # ***********************************************************************************************************************************************
+    # Loads the cache, if there is a usable one.
+    #
+    # Parameters:
+    #   file_name : The cache file, or None to not keep one.
+    # ***********************************************************************************************************************************************
+    def __init__(self, file_name):
+        self.file_name = file_name
+        # Variant key to {"configuration": ..., "digest": ...}.
+        self.variants = {}
+        # The digests the variants had when the cache was loaded, to report changes against.
+        self.previous = {}
+        self.changed = False
+
+        if file_name is None:
+            return
+        try:
+            with open(file_name) as file:
+                cache = json.load(file)
+            if cache.get("version") == CACHE_VERSION:
+                self.variants = cache["variants"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            # A missing or damaged cache just means every variant is read.
+            pass
+        self.previous = {key: entry["digest"] for key, entry in self.variants.items()}
+
+    # ***********************************************************************************************************************************************
+    # Returns the configuration of a list of .lnt files, from the cache if none of the files or environment variables it was read from have
+    # changed, else read from the files.
+    #
+    # Parameters:
+    #   file_names  : The .lnt files, in the order lint is given them.
+    #   environment : A dict of environment variable name to value.
+    # ***********************************************************************************************************************************************
+    def resolve(self, file_names, environment):
+        key = variant_key(file_names)
+        entry = self.variants.get(key)
+        if entry is not None:
+            configuration = LintConfiguration.from_json(entry["configuration"])
+            if is_current(configuration, environment):
+                return configuration
+
+        configuration = LntReader(environment).read(file_names)
+        self.variants[key] = {"configuration": configuration.to_json(), "digest": configuration.digest()}
+        self.changed = True
+        return configuration
+
+    # ***********************************************************************************************************************************************
+    # Returns "new", "changed" or "unchanged" for a list of .lnt files resolved by this run, comparing its configuration with the one the cache
+    # had when it was loaded.
+    # ***********************************************************************************************************************************************
+    def status(self, file_names):
+        key = variant_key(file_names)
+        if key not in self.previous:
+            return "new"
+        return "unchanged" if self.previous[key] == self.variants[key]["digest"] else "changed"
+
+    # ***********************************************************************************************************************************************
+    # Writes the cache file, if any variant was read. The file is replaced atomically so an interrupted run can't leave a truncated cache behind.
+    # ***********************************************************************************************************************************************
+    def save(self):
+        if (self.file_name is None) or (not self.changed):
+            return
+        temp_name = self.file_name + ".tmp"
+        try:
+            with open(temp_name, "w") as file:
+                json.dump({"version": CACHE_VERSION, "variants": self.variants}, file, separators=(",", ":"))
+            os.replace(temp_name, self.file_name)
+        except OSError as error:
+            stderr_out("Couldn't save the cache '{}': {}".format(self.file_name, error))
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# variant_key
+#   Returns the key a list of .lnt files is cached under.
+# ***************************************************************************************************************************************************
+def variant_key(file_names):
+    return "\n".join(makeLintFileList.normalise_path(os.path.abspath(makeLintFileList.native_path(name))) for name in file_names)
+
+
+# ***************************************************************************************************************************************************
+# file_digest
+#   Returns the SHA-1 of a file's contents, or None if it can't be read.
+# ***************************************************************************************************************************************************
+def file_digest(path):
+    try:
+        with open(path, "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+# ***************************************************************************************************************************************************
+# is_current
+#   Returns True if none of the files or environment variables a configuration was read from have changed.
+# ***************************************************************************************************************************************************
+def is_current(configuration, environment):
+    upper = {name.upper(): value for name, value in environment.items()}
+    for name, value in configuration.environment.items():
+        if upper.get(name.upper()) != value:
+            return False
+    for path, digest in configuration.files.items():
+        if file_digest(path) != digest:
+            return False
+    return True
+
+
+# ***************************************************************************************************************************************************
+# resolve
+#   Returns the LintConfiguration of a list of .lnt files, read in order, without a cache.
+#
+#   Parameters:
+#       file_names  : The .lnt files, in the order lint is given them.
+#       environment : A dict of environment variable name to value (Default = the process environment).
+# ***************************************************************************************************************************************************
+def resolve(file_names, environment=None):
+    if environment is None:
+        environment = dict(os.environ)
+    return LntReader(environment).read(file_names)
+
+
+# ***************************************************************************************************************************************************
+# print_changes
+#   Prints the include directories and defines added to and removed from a configuration.
+# ***************************************************************************************************************************************************
+def print_changes(old, new):
+    for label, old_items, new_items in (("include", old.includes, new.includes), ("define", old.define_list(), new.define_list())):
+        for item in new_items:
+            if item not in old_items:
+                print("  + {} {}".format(label, item))
+        for item in old_items:
+            if item not in new_items:
+                print("  - {} {}".format(label, item))
+
+
+# ***************************************************************************************************************************************************
+# parse_environment
+#   Parses a NAME=value argument of --env into a (NAME, value) tuple.
+# ***************************************************************************************************************************************************
+def parse_environment(text):
+    name, equals, value = text.partition("=")
+    if (not equals) or (not name):
+        raise argparse.ArgumentTypeError("expected NAME=value, not {}".format(text))
+    return name, value
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Lists the effective lint options of each variant from its .lnt files.")
+    parser.add_argument("variants", nargs="*", help="The .lnt file of each variant, for example GVI075.lnt.")
+    parser.add_argument("--base", "-b", action="append", default=None,
+                        help="A .lnt file read before each variant's own file. May be given more than once (Default = {}).".format(
+                            DEFAULT_BASE_FILE))
+    parser.add_argument("--env", "-e", type=parse_environment, action="append", default=[], metavar="NAME=value",
+                        help="Set an environment variable for %%NAME%% in the .lnt files. May be given more than once.")
+    parser.add_argument("--includes", "-i", action="store_true", help="List the include path of each variant.")
+    parser.add_argument("--defines", "-d", action="store_true", help="List the defines of each variant.")
+    parser.add_argument("--options", "-o", action="store_true", help="List every option of each variant, with the file and line it is from.")
+    parser.add_argument("--cache", "-c", default=DEFAULT_CACHE_FILE,
+                        help="The file the configurations are kept in between runs (Default = {}).".format(DEFAULT_CACHE_FILE))
+    parser.add_argument("--no_cache", action="store_true", help="Read every .lnt file, and don't save the configurations.")
+    args = parser.parse_args(args)
+
+    if args.base is None:
+        args.base = [DEFAULT_BASE_FILE]
+    if not (args.base or args.variants):
+        parser.error("Give at least one .lnt file")
+    return args
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    environment = dict(os.environ)
+    environment.update(args.env)
+
+    variants = [(ntpath.splitext(ntpath.basename(variant))[0], args.base + [variant]) for variant in args.variants]
+    if not variants:
+        variants = [("base", args.base)]
+
+    cache = ConfigurationCache(None if args.no_cache else args.cache)
+    previous = {}
+    for _, file_names in variants:
+        entry = cache.variants.get(variant_key(file_names))
+        if entry is not None:
+            previous[variant_key(file_names)] = LintConfiguration.from_json(entry["configuration"])
+
+    failed = False
+    for name, file_names in variants:
+        configuration = cache.resolve(file_names, environment)
+        status = cache.status(file_names)
+        print("{}: {} ({} options, {} include directories, {} defines)".format(
+            name, status, len(configuration.options), len(configuration.includes), len(configuration.defines)))
+        if status == "changed":
+            print_changes(previous[variant_key(file_names)], configuration)
+        for error in configuration.errors:
+            stderr_out("Python Error: {}: {}".format(name, error))
+            failed = True
+
+        if args.includes:
+            for directory in configuration.includes:
+                print("  -i {}".format(directory))
+        if args.defines:
+            for define in configuration.define_list():
+                print("  -d {}".format(define))
+        if args.options:
+            for text, file_name, line in configuration.options:
+                print("  {}  ({} line {})".format(text, file_name, line))
+
+    cache.save()
+    if failed:
+        sys.exit(-1)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Indexes the #defines of every header in a set of include directories, such as the -i paths of the project's .lnt files, and evaluates macros
+#   whose values are constant integer expressions of other macros (see c_expression.py). For example:
+#
+#   Usage: python macro_index.py -l project_specific.lnt -l GVI075.lnt FAST_TASK_STACK_SIZE CAN_BUFFER_SIZE
+#
+#   prints FAST_TASK_STACK_SIZE=1024 and CAN_BUFFER_SIZE=64. With --text the text of each macro and the header defining it are printed instead.
+#   With no macros the index is only brought up to date.
+#
+#   Like lint, only the headers directly in each include directory are indexed, not those in its subdirectories. A macro defined in more than one
+#   header takes its value from the first, in include directory order.
+#
+#   The index is saved to --cache and used again by the next run. Only the headers whose modification time or size changed since are read again.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-016
+#     - Created.
+#   2026-Oct-18 - Request user-021
+#     - Read the -i options of the --lnt files with lnt_options.py, which follows the .lnt files they include and expands %NAME%.
+#   2026-Oct-18 - Request user-008
+#     - Take the resolution of file modification times from file_times.py.
+#   2026-Oct-18 - Request user-016
+#     - Renamed --no-cache to --no_cache, like the other options.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import sys
+import time
+
+import c_expression
+import file_times
+import lnt_options
+import rw_variable
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+DEFAULT_CACHE_FILE = "macro_index.json"
+
+# Increase when the layout of the cache file changes, so older caches are discarded.
+CACHE_VERSION = 1
+
+HEADER_EXTENSIONS = (".h", ".hpp")
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# The #defines of the headers in a list of include directories, kept in a cache file between runs.
+class MacroIndex:
+
+    # ***********************************************************************************************************************************************
+    # Loads the cache, if there is a usable one.
+    #
+    # Parameters:
+    #   cache_file : The file the index is kept in, or None to not keep it.
+    # ***********************************************************************************************************************************************
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self.saved_ns = 0
+        # Header path to [modification time, size, {macro name: value text}], as loaded from the cache.
+        self.cached = {}
+        # The same for the headers of the include directories given to update(), in include order.
+        self.headers = {}
+        # Macro name to (value text, header path), the first definition in include order.
+        self.definitions = {}
+        self.evaluator = None
+        # The number of headers update() had to read.
+        self.read_count = 0
+        # Whether the index differs from the one in the cache, so needs saving.
+        self.changed = True
+
+        if cache_file is None:
+            return
+        try:
+            with open(cache_file) as file:
+                cache = json.load(file)
+            if cache.get("version") == CACHE_VERSION:
+                self.saved_ns = cache["saved"]
+                self.cached = cache["headers"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            # A missing or damaged cache just means every header is read.
+            pass
+
+    # ***********************************************************************************************************************************************
+    # Brings the index up to date with the headers in a list of include directories.
+    #
+    # Parameters:
+    #   directories : The include directories, in the order they are searched.
+    #   jobs        : The maximum number of headers to read at once.
+    # ***********************************************************************************************************************************************
+    def update(self, directories, jobs):
+        headers = []
+        seen = set()
+        for directory in directories:
+            for path in list_headers(directory):
+                if path not in seen:
+                    seen.add(path)
+                    headers.append(path)
+
+        to_read = []
+        self.headers = {}
+        for path in headers:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            cached = self.cached.get(path)
+            # A header changed within the time stamp resolution of when the cache was saved may have changed again since without its time stamp
+            # changing, so it is read again.
+            if ((cached is not None) and (cached[0] == stat.st_mtime_ns) and (cached[1] == stat.st_size) and
+                    (stat.st_mtime_ns < self.saved_ns - file_times.MTIME_RESOLUTION_NS)):
+                self.headers[path] = cached
+            else:
+                self.headers[path] = None
+                to_read.append((path, stat))
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            indexes = list(pool.map(read_header, [path for path, _ in to_read]))
+        for (path, stat), macros in zip(to_read, indexes):
+            self.headers[path] = [stat.st_mtime_ns, stat.st_size, macros]
+        self.read_count = len(to_read)
+        self.changed = bool(to_read) or (self.headers.keys() != self.cached.keys())
+
+        self.definitions = {}
+        for path, entry in self.headers.items():
+            for name, value in entry[2].items():
+                self.definitions.setdefault(name, (value, path))
+        self.evaluator = c_expression.MacroEvaluator(self.text)
+
+    # ***********************************************************************************************************************************************
+    # Returns the text of a macro's value, or None if it isn't defined.
+    # ***********************************************************************************************************************************************
+    def text(self, name):
+        definition = self.definitions.get(name)
+        return None if definition is None else definition[0]
+
+    # ***********************************************************************************************************************************************
+    # Returns the value of a macro as an integer. Raises ValueError if it isn't defined or isn't a constant integer expression.
+    # ***********************************************************************************************************************************************
+    def value(self, name):
+        return self.evaluator.value(name)
+
+    # ***********************************************************************************************************************************************
+    # Writes the index of the headers from the last update() to the cache file, unless it is the same as the one already there. The file is
+    # replaced atomically so an interrupted run can't leave a truncated cache behind.
+    # ***********************************************************************************************************************************************
+    def save(self):
+        if (self.cache_file is None) or (not self.changed):
+            return
+        cache = {"version": CACHE_VERSION,
+                 "saved": time.time_ns(),
+                 "headers": self.headers}
+        temp_name = self.cache_file + ".tmp"
+        try:
+            with open(temp_name, "w") as file:
+                json.dump(cache, file, separators=(",", ":"))
+            os.replace(temp_name, self.cache_file)
+        except OSError as error:
+            stderr_out("Couldn't save the macro index '{}': {}".format(self.cache_file, error))
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# list_headers
+#   Returns the paths of the headers directly in a directory, sorted by name, or an empty list if the directory can't be read.
+# ***************************************************************************************************************************************************
+def list_headers(directory):
+    # Lint's .lnt files use Windows separators.
+    directory = directory.replace("\\", os.sep)
+    try:
+        names = sorted(entry.name for entry in os.scandir(directory)
+                       if entry.name.lower().endswith(HEADER_EXTENSIONS) and entry.is_file())
+    except OSError:
+        return []
+    return [os.path.normpath(os.path.join(directory, name)) for name in names]
+
+
+# ***************************************************************************************************************************************************
+# read_header
+#   Returns the #defines of a header as a dict of macro name to the text of its value. Function-like macros and macros without a value are left
+#   out. A header that can't be read is reported and has no macros.
+# ***************************************************************************************************************************************************
+def read_header(path):
+    try:
+        _, _, index = rw_variable.load_file(path, "--define")
+    except OSError as error:
+        stderr_out("Couldn't read {}: {}".format(path, error))
+        return {}
+    return {name: entry[0] for name, entry in index.items()}
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Evaluates #define macros across the headers of the include directories.")
+    parser.add_argument("macros", nargs="*", help="The macros to print. If none are given, the index is only brought up to date.")
+    parser.add_argument("--lnt", "-l", action="append", default=[],
+                        help="A .lnt file whose -i include directories are indexed. May be given more than once; the files are read in order, "
+                             "as lint reads them.")
+    parser.add_argument("--include", "-i", action="append", default=[],
+                        help="An include directory to index, searched after those of the .lnt files. May be given more than once.")
+    parser.add_argument("--cache", "-c", default=DEFAULT_CACHE_FILE,
+                        help="The file the index is kept in between runs (Default = {}).".format(DEFAULT_CACHE_FILE))
+    parser.add_argument("--no_cache", action="store_true", help="Read every header, and don't save the index.")
+    parser.add_argument("--text", "-t", action="store_true",
+                        help="Print the text of each macro and the header it is defined in, instead of its value.")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="The maximum number of headers to read at once (Default = number of CPU cores).")
+    args = parser.parse_args(args)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    for lnt in args.lnt:
+        if not os.path.isfile(lnt):
+            parser.error("Couldn't find {}".format(lnt))
+    if not (args.lnt or args.include):
+        parser.error("Give the include directories with --lnt or --include")
+    return args
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    directories = []
+    if args.lnt:
+        configuration = lnt_options.resolve(args.lnt)
+        for error in configuration.errors:
+            stderr_out("Python Error: {}".format(error))
+        if configuration.errors:
+            sys.exit(-1)
+        directories += configuration.includes
+    directories += args.include
+
+    index = MacroIndex(None if args.no_cache else args.cache)
+    index.update(directories, args.jobs)
+    index.save()
+
+    failed = False
+    for name in args.macros:
+        if args.text:
+            definition = index.definitions.get(name)
+            if definition is None:
+                stderr_out("Python Error: {} is not defined".format(name))
+                failed = True
+            else:
+                print("{}={}  ({})".format(name, " ".join(definition[0].split()), definition[1]))
+            continue
+
+        try:
+            print("{}={}".format(name, index.value(name)))
+        except ValueError as error:
+            stderr_out("Python Error: {}: {}".format(name, error))
+            failed = True
+
+    if failed:
+        sys.exit(-1)
@@ -32,6 +32,26 @@
 #   - Added command 'r' to provide capability to exclude a specified folder recursively.
 #   2022-Feb-17 by Sandesh Vadye - Case 76379, Review 12401
 #   - Given provision to display version number and program description.
+#   2026-Oct-18 - Request user-001
+#   - Replaced the "dir /s /b" subprocess used by the 'i' and 'r' commands with an in-process directory scanner. Every pattern is matched during
+#     a single walk of each directory tree, and the script now also runs on non-Windows build agents.
+#   2026-Oct-18 - Request user-002
+#   - Exclusions are compiled into a directory trie with hashed file name sets, and compared case-insensitively on Windows.
+#   2026-Oct-18 - Request user-003
+#   - Directory listings are cached in a manifest next to the output file, so only directories whose modification time changed are re-read.
+#   - The output file is only rewritten when the list of files changes.
+#   2026-Oct-18 - Request user-004
+#   - Added the --batch option to build several file lists with a single directory walk.
+#   2026-Oct-18 - Request user-005
+#   - Added the --shards option to also write the list split into shards of balanced lint effort, for run_lint_shards.py.
+#   2026-Oct-18 - Request user-024
+#   - Added the --variant option to leave out files that have no code once the variant's defines are applied (see conditional_compilation.py).
+#   2026-Oct-18 - Request user-005
+#   - Shards with equal effort now take the next file in turn, so files with no effort are spread over the shards instead of all going to the first.
+#   2026-Oct-18 - Request user-024
+#   - --variant can't be used with --batch, as the lists of a batch may be for different variants.
+#   2026-Oct-18 - Request user-008
+#   - Take the resolution of file modification times from file_times.py.
 # *****************************************************************************
 
 # *****************************************************************************
@@ -39,10 +59,17 @@
 # *****************************************************************************
 import argparse
 from datetime import datetime
+import hashlib
+import heapq
+import json
 import os
 from pathlib import Path
-import subprocess
+import re
+import stat
 import sys
+import time
+
+import file_times
 
 # *****************************************************************************
 #   GLOBAL VARIABLES
@@ -54,7 +81,9 @@ import sys
 
 DEFAULT_INPUT_FILE = "lintFileList.txt"
 DEFAULT_OUTPUT_FILE = "files.lnt"
-VERSION = "1.08 Build 9"
+DEFAULT_SHARD_TIMES_FILE = "lint_module_times.csv"
+MANIFEST_SUFFIX = ".manifest"
+VERSION = "1.08 Build 18"
 
 PROGRAM_DESCRIPTION = (
     # Note that this is all reformatted by limit_chars().
@@ -87,7 +116,24 @@ PROGRAM_DESCRIPTION = (
     "Note that the exclusions aren't used until after the script has processed the input file.\n"
 
     "The output file that is generated is then used with lint and will specify the fully qualified path to the files that need to be linted. It is "
-    "recommended that the output file is not under revision control, since it is generated each time it is needed."
+    "recommended that the output file is not under revision control, since it is generated each time it is needed.\n"
+
+    "The directory listings used to build the list are cached in a manifest file next to the output file (the output file name followed by "
+    + MANIFEST_SUFFIX + "). On the next run, only directories whose modification time has changed are read again, and the output file is left "
+    "untouched if the list of files is the same. The manifest is discarded whenever the input file changes.\n"
+
+    "Several file lists can be built in one run with --batch, which names a file with one pair of input and output file names per line (relative "
+    "to the batch file, '#' starts a comment and names containing spaces are quoted). Every list is resolved from the same walk of the directory "
+    "tree, and the manifest is kept next to the batch file.\n"
+
+    "With --shards, each output file is also split into shards that can be linted in parallel by run_lint_shards.py. The shards of files.lnt are "
+    "named files_0.lnt, files_1.lnt and so on. Files are assigned so every shard has about the same lint effort, estimated from the per-module "
+    "lint times in --shard_times when a module has a recorded time and from its file size otherwise.\n"
+
+    "With --variant, files that have no code for a variant are left out. It names the .lnt files lint is run with for the variant, separated by "
+    "commas (for example project_specific.lnt,GVI075.lnt), whose -d options and -i directories are used to evaluate the #if lines of each file. "
+    "A file is only left out when all of its own code is certainly compiled out. As the lists of a batch may be for different variants, "
+    "--variant can't be used with --batch."
     )
 
 # Command line options, sorted by name, abbreviation, default value, type, and
@@ -95,15 +141,337 @@ PROGRAM_DESCRIPTION = (
 OPTIONS = [["--input", "-i", DEFAULT_INPUT_FILE, str,
             ("Specifies the input file.\n")],
            ["--output", "-o", DEFAULT_OUTPUT_FILE, str,
-            ("Specifies the output file\n")]]
+            ("Specifies the output file\n")],
+           ["--batch", "-b", None, str,
+            ("Specifies a batch file of input/output pairs. If given,\n"
+             "--input and --output are ignored.\n")],
+           ["--shards", "-s", None, int,
+            ("Also writes each output file split into this many shards.\n"
+             "0 uses one shard per CPU core.\n")],
+           ["--shard_times", "-t", DEFAULT_SHARD_TIMES_FILE, str,
+            ("Specifies the per-module lint times, as written by\n"
+             "run_lint_shards.py, used to balance the shards.\n")],
+           ["--variant", "-v", None, str,
+            ("Specifies the .lnt files of a variant, separated by commas.\n"
+             "Files with no code for the variant are left out.\n"
+             "Can't be used with --batch.\n")],
+           ["--no_cache", "-n", False, None,
+            ("Re-reads every directory instead of using the manifest, and\n"
+             "always rewrites the output file.\n")]]
 
 CHAR_LIMIT = 80
 
+# Attributes that hide a file from "dir" when no /a switch is given. Only Windows reports file attributes, so nothing is hidden elsewhere.
+HIDDEN_ATTRIBUTES = (stat.FILE_ATTRIBUTE_HIDDEN | stat.FILE_ATTRIBUTE_SYSTEM) if os.name == "nt" else 0
+
+# Bump when the layout of the manifest file changes, so old manifests are discarded.
+MANIFEST_VERSION = 1
+
 # *****************************************************************************
 #   CLASSES
 # *****************************************************************************
 
 
+# Caches the directory listings read by a DirectoryScanner between runs. Each listing is stored with the modification time of its directory, and
+# is only reused while that time is unchanged. The whole manifest is discarded if the digest of the input file differs from the one it was saved
+# with.
+class DirectoryManifest:
+
+    # *************************************************************************
+    # Loads the manifest, if there is a usable one.
+    #
+    # Parameters:
+    #   file_name:    The manifest file to read and later save to.
+    #   input_digest: The digest of the input file the listings are for.
+    # *************************************************************************
+    def __init__(self, file_name, input_digest):
+        self.file_name = file_name
+        self.input_digest = input_digest
+        self.saved_ns = 0
+        self.cached = {}
+        self.listings = {}
+
+        try:
+            with open(file_name) as file:
+                manifest = json.load(file)
+            if (manifest.get("version") == MANIFEST_VERSION) and (manifest.get("input") == input_digest):
+                self.saved_ns = manifest["saved"]
+                self.cached = manifest["directories"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            # A missing or damaged manifest just means everything is read.
+            pass
+
+    # *************************************************************************
+    # Returns the cached listing of a directory, or None if there isn't one
+    # for its current modification time.
+    #
+    # Parameters:
+    #   directory: The directory to look up.
+    #   mtime_ns:  The directory's current modification time.
+    # *************************************************************************
+    def lookup(self, directory, mtime_ns):
+        entries = None
+        cached = self.cached.get(directory)
+        # A directory changed this close to when the manifest was saved may have changed again since without its modification time changing.
+        if (cached is not None) and (cached[0] == mtime_ns) and (mtime_ns < self.saved_ns - file_times.MTIME_RESOLUTION_NS):
+            entries = cached[1]
+            self.listings[directory] = cached
+        return entries
+
+    # *************************************************************************
+    # Records a listing that was read from disk.
+    #
+    # Parameters:
+    #   directory: The directory that was read.
+    #   mtime_ns:  The directory's modification time before it was read.
+    #   entries:   The listing, as returned by DirectoryScanner.list_directory().
+    # *************************************************************************
+    def store(self, directory, mtime_ns, entries):
+        self.listings[directory] = [mtime_ns, entries]
+
+    # *************************************************************************
+    # Writes the listings used by this run to the manifest file. Directories
+    # that weren't visited are dropped. The file is replaced atomically so an
+    # interrupted run can't leave a truncated manifest behind.
+    # *************************************************************************
+    def save(self):
+        manifest = {"version": MANIFEST_VERSION,
+                    "input": self.input_digest,
+                    "saved": time.time_ns(),
+                    "directories": self.listings}
+        temp_name = self.file_name + ".tmp"
+        try:
+            with open(temp_name, "w") as file:
+                json.dump(manifest, file, separators=(",", ":"))
+            os.replace(temp_name, self.file_name)
+        except OSError as error:
+            stderr_out("Couldn't save the manifest '%s': %s" % (self.file_name, error))
+
+
+# Finds the files matched by the wild card patterns of the 'i' and 'r' commands. All patterns are registered with add_pattern() before walk() is
+# called, so every directory is read with os.scandir() exactly once no matter how many patterns cover it. The matches for each pattern are kept
+# in the order "dir /s /b" lists them: the matching entries of a directory first, then the contents of each sub-directory in turn.
+class DirectoryScanner:
+
+    # *************************************************************************
+    # Creates an empty scanner.
+    #
+    # Parameters:
+    #   manifest: An optional DirectoryManifest to reuse listings from.
+    # *************************************************************************
+    def __init__(self, manifest=None):
+        # Each pattern is stored as [base directory, compiled name mask, matches]. The matches are None until walk() finds something.
+        self.patterns = []
+        self.patterns_by_dir = {}
+        self.handles = {}
+        self.manifest = manifest
+
+    # *************************************************************************
+    # Registers a "dir /s /b" style pattern, relative to the current working
+    # directory, and returns a handle for results().
+    #
+    # Parameters:
+    #   pattern: A path whose last component may use the * and ? wild cards.
+    #            If the path is a directory, everything below it matches.
+    # *************************************************************************
+    def add_pattern(self, pattern):
+        pattern = native_path(pattern)
+        if os.path.isdir(pattern):
+            base, mask = pattern, "*"
+        else:
+            base, mask = os.path.split(pattern)
+
+        base = os.path.abspath(base)
+
+        # The same pattern given more than once (e.g. by several lists in a
+        # batch) is only matched once.
+        key = (os.path.normcase(base), mask.lower())
+        handle = self.handles.get(key)
+        if handle is None:
+            handle = len(self.patterns)
+            self.handles[key] = handle
+            self.patterns.append([base, wild_card_to_regex(mask), None])
+            self.patterns_by_dir.setdefault(key[0], []).append(handle)
+        return handle
+
+    # *************************************************************************
+    # Returns the list of paths that matched the pattern with the given
+    # handle, or None if nothing matched (which is when "dir" would fail).
+    #
+    # Parameters:
+    #   handle: The value returned by add_pattern().
+    # *************************************************************************
+    def results(self, handle):
+        return self.patterns[handle][2]
+
+    # *************************************************************************
+    # Walks every directory tree that has a pattern registered against it.
+    # A base directory inside another base directory is not walked on its
+    # own; its patterns are activated when the outer walk reaches it.
+    # *************************************************************************
+    def walk(self):
+        roots = []
+        for key in sorted(self.patterns_by_dir):
+            if not any(key.startswith(os.path.join(root, "")) for root in roots):
+                roots.append(key)
+
+        for root in roots:
+            base = self.patterns[self.patterns_by_dir[root][0]][0]
+            self.walk_tree(base)
+
+    # *************************************************************************
+    # Walks a single directory tree depth first, matching the name of every
+    # entry against the patterns that are active in its directory.
+    #
+    # Parameters:
+    #   top: The directory to start from.
+    # *************************************************************************
+    def walk_tree(self, top):
+        # Each stack entry is a directory and the patterns inherited from its parent.
+        stack = [(top, [])]
+        while stack:
+            directory, active = stack.pop()
+            active = active + self.patterns_by_dir.get(os.path.normcase(directory), [])
+            entries = self.list_directory(directory)
+            if entries is None:
+                continue
+
+            sub_dirs = []
+            for name, is_dir, hidden in entries:
+                path = os.path.join(directory, name)
+                if is_dir:
+                    sub_dirs.append(path)
+
+                if not hidden:
+                    for handle in active:
+                        pattern = self.patterns[handle]
+                        if pattern[1].match(name):
+                            if pattern[2] is None:
+                                pattern[2] = []
+                            pattern[2].append(path)
+
+            # Push in reverse so the first sub-directory is processed next.
+            for sub_dir in reversed(sub_dirs):
+                stack.append((sub_dir, active))
+
+    # *************************************************************************
+    # Returns the entries of a directory as [name, is directory, hidden]
+    # lists, in the order "dir" would show them, or None if the directory
+    # can't be read. The manifest's listing is used if it is still current.
+    #
+    # Parameters:
+    #   directory: The directory to list.
+    # *************************************************************************
+    def list_directory(self, directory):
+        mtime_ns = None
+        if self.manifest is not None:
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                return None
+
+            entries = self.manifest.lookup(directory, mtime_ns)
+            if entries is not None:
+                return entries
+
+        entries = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        hidden = bool(HIDDEN_ATTRIBUTES and (entry.stat().st_file_attributes & HIDDEN_ATTRIBUTES))
+                        entries.append([entry.name, entry.is_dir(), hidden])
+                    except OSError:
+                        pass
+        except OSError:
+            return None
+
+        # Windows lists entries in the same order "dir" does, other platforms in no particular order.
+        if os.name != "nt":
+            entries.sort(key=lambda entry: entry[0].upper())
+
+        if self.manifest is not None:
+            self.manifest.store(directory, mtime_ns, entries)
+
+        return entries
+
+
+# One directory in an ExclusionFilter's path trie. Holds the sub-directories below it, the names of the excluded files directly inside it, and
+# whether every file directly inside it is excluded (the 'd' command).
+class ExclusionNode:
+    __slots__ = ("children", "files", "all_files")
+
+    def __init__(self):
+        self.children = {}
+        self.files = set()
+        self.all_files = False
+
+
+# Answers whether a file is excluded by the 'f', 'd' and 'r' commands. The exclusions are compiled into a trie of directory names whose nodes hold
+# hashed sets of file names, so a check walks at most one node per directory level of the file instead of scanning every exclusion. Paths are
+# normalised with os.path.normcase(), which makes the comparison case-insensitive on Windows.
+class ExclusionFilter:
+
+    # *************************************************************************
+    # Compiles the exclusion lists.
+    #
+    # Parameters:
+    #   exclude_files: Paths of individual files to exclude.
+    #   exclude_dirs:  Directories whose files are excluded (not recursive).
+    # *************************************************************************
+    def __init__(self, exclude_files, exclude_dirs):
+        self.root = ExclusionNode()
+        self.exclude_blank = False
+
+        for path in exclude_files:
+            if path == "":
+                # The empty entries in the file list are only removed if the
+                # exclusion list contains one too, as it did before.
+                self.exclude_blank = True
+            else:
+                directory, name = os.path.split(normalise_path(path))
+                self.node(directory).files.add(name)
+
+        for path in exclude_dirs:
+            self.node(normalise_path(path)).all_files = True
+
+    # *************************************************************************
+    # Returns the trie node for a normalised directory, creating it and any
+    # missing parents.
+    #
+    # Parameters:
+    #   directory: The normalised directory path.
+    # *************************************************************************
+    def node(self, directory):
+        node = self.root
+        for part in directory.split(os.sep):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = ExclusionNode()
+            node = child
+        return node
+
+    # *************************************************************************
+    # Returns True if the file is excluded, False otherwise.
+    #
+    # Parameters:
+    #   path: The path and file name to check.
+    # *************************************************************************
+    def is_excluded(self, path):
+        if path == "":
+            return self.exclude_blank
+
+        directory, name = os.path.split(normalise_path(path))
+        node = self.root
+        for part in directory.split(os.sep):
+            node = node.children.get(part)
+            if node is None:
+                # Nothing is excluded anywhere below this directory.
+                return False
+
+        return node.all_files or (name in node.files)
+
+
 # A simple class that loads a description file on initialization to build a list of files to lint. When write is called, it checks to see if each
 # file to be linted should be filtered out or included. If included, it is output to the specified file.
 class CreateLintFiles:
@@ -114,14 +482,26 @@ class CreateLintFiles:
     # method to have the file list output to file.
     #
     # Parameters:
-    #   file_name: The description file to open and read commands from.
+    #   file_name:     The description file to open and read commands from.
+    #   manifest_name: The manifest file to cache directory listings in,
+    #                  relative to the description file. None disables the
+    #                  cache.
+    #   scanner:       A DirectoryScanner shared with other lists. If given,
+    #                  the patterns are only registered with it; the caller
+    #                  walks the scanner and then calls add_search_results().
+    #                  manifest_name is ignored.
+    #   variant:       A conditional_compilation.ConditionalEvaluator. If
+    #                  given, files with no code for it are left out.
     # *************************************************************************
-    def __init__(self, file_name):
+    def __init__(self, file_name, manifest_name=None, scanner=None, variant=None):
         # Assume failure.
         self.valid = False
         self.file_list = []
         self.exclude_file_list = []
         self.exclude_dir_list = []
+        self.exclusions = None
+        self.variant = variant
+        self.searches = []
         self.isCommandValid = False
 
         if Path(file_name).exists():
@@ -129,6 +509,17 @@ class CreateLintFiles:
             # we write.
             self.file_path = os.path.dirname(os.path.abspath(file_name))
 
+            # The 'i' and 'r' patterns are collected first and resolved by a
+            # single scan once the whole file has been read.
+            shared = scanner is not None
+            manifest = None
+            if not shared:
+                if manifest_name is not None:
+                    input_digest = hashlib.sha1(Path(file_name).read_bytes()).hexdigest()
+                    manifest = DirectoryManifest(os.path.join(self.file_path, manifest_name), input_digest)
+                scanner = DirectoryScanner(manifest)
+            self.scanner = scanner
+
             with open(file_name) as file:
                 # Now that the file is open, change the working directory to
                 # match where the file was opened from.
@@ -153,51 +544,51 @@ class CreateLintFiles:
                         line = line.strip()
                         if command == 'i':
                             self.isCommandValid = True
-                            try:
-                                # Run the directory command.
-                                dir_output = subprocess.check_output(
-                                    ["dir", "/s", "/b", line],
-                                    shell=True).decode('utf-8')
-
-                                # Split on \r\n so we can get rid of both
-                                # characters. This saves a split and allows
-                                # direct comparisons when handling exclusions.
-                                self.file_list += dir_output.split('\r\n')
-                            except subprocess.CalledProcessError:
-                                stderr_out("Couldn't find '%s'" % (line, ))
+                            self.searches.append((self.file_list, line, scanner.add_pattern(line)))
                         elif command == 'f':
                             # This is a file exclude. Expand to full path on
                             # this device.
                             self.isCommandValid = True
                             self.exclude_file_list.append(
-                                os.path.abspath(line))
+                                os.path.abspath(native_path(line)))
                         elif command == 'd':
                             # This is a file exclude. Expand to full path on
                             # this device.
                             self.isCommandValid = True
-                            self.exclude_dir_list.append(os.path.abspath(line))
+                            self.exclude_dir_list.append(os.path.abspath(native_path(line)))
                         elif command == 'r':
                             # This is a recursive file exclude command. Expand to full path on
                             # this device.
                             self.isCommandValid = True
-                            try:
-                                # Run the directory command.
-                                dir_output = subprocess.check_output(
-                                    ["dir", "/s", "/b", line],
-                                    shell=True).decode('utf-8')
-
-                                # Split on \r\n so we can get rid of both
-                                # characters. This saves a split and allows
-                                # direct comparisons when handling exclusions.
-                                self.exclude_file_list += dir_output.split('\r\n')
-                            except subprocess.CalledProcessError:
-                                stderr_out("Couldn't find '%s'" % (line, ))
+                            self.searches.append((self.exclude_file_list, line, scanner.add_pattern(line)))
                         else:
                             # We have a command we don't understand
                             stderr_out("Warning line %i: ignoring non-empty line '%s'" % (line_number, original_line))
                 if not self.isCommandValid:
                     self.valid = False
 
+            if not shared:
+                scanner.walk()
+                if manifest is not None:
+                    manifest.save()
+                self.add_search_results()
+
+    # *************************************************************************
+    # Adds the files found by the scanner for the 'i' and 'r' commands to the
+    # include and exclusion lists.
+    # *************************************************************************
+    def add_search_results(self):
+        for target, line, handle in self.searches:
+            found = self.scanner.results(handle)
+            if found is None:
+                stderr_out("Couldn't find '%s'" % (line, ))
+            else:
+                # The "dir" output this replaces ended with a line break,
+                # which left an empty entry after each command's files.
+                # It is kept so the generated file does not change.
+                target += found
+                target.append("")
+
     # *************************************************************************
     # Changes to the directory where the input file is so relative paths work.
     # *************************************************************************
@@ -206,42 +597,130 @@ class CreateLintFiles:
 
     # *************************************************************************
     # Determines whether the file specified in line is not excluded by checking
-    # against the excluded lists. Returns True if the file is not excluded and
-    # False otherwise.
+    # against the excluded lists, and that it has code for the variant if
+    # one was given. Returns True if the file is not excluded and False
+    # otherwise. The lists are compiled into an ExclusionFilter the first
+    # time this is called.
     #
     # Parameters:
     #   line: The path and file name to see if it should be excluded.
-    #   criteria: The expression to check.
     # *************************************************************************
     def not_excluded(self, line):
-        # Determine the path to the file listed in line.
-        path = os.path.dirname(line)
-
-        excluded = (line in self.exclude_file_list) or \
-            (path in self.exclude_dir_list)
+        if self.exclusions is None:
+            self.exclusions = ExclusionFilter(self.exclude_file_list, self.exclude_dir_list)
 
-        return not excluded
+        if self.exclusions.is_excluded(line):
+            return False
+        # The empty entries kept after each command's files aren't files.
+        return (self.variant is None) or (line == "") or self.variant.has_code(line)
 
     # *************************************************************************
     # Writes the list of files to Lint to the specified file, provided the
     # is not excluded.
     #
     # Parameters:
-    #   file_name: The name of the file to write to.
+    #   file_name:       The name of the file to write to.
+    #   only_if_changed: If asserted, the file is left untouched (including
+    #                    its "Generated on" time) when it already lists the
+    #                    same files.
+    #
+    # Returns:
+    #   True if the file was written, False if it was left untouched.
     # *************************************************************************
-    def write(self, file_name):
+    def write(self, file_name, only_if_changed=False):
         self.cd_to_input_file_path()
-        with open(file_name, "w") as file:
-            file.write(datetime.now().strftime(
-                "// Generated on %Y-%m-%d at %H:%M:%S\n"))
-            if self.valid:
-                for line in self.file_list:
-                    if self.not_excluded(line):
-                        file.write(line + '\n')
-            else:
-                string_list = PROGRAM_DESCRIPTION.split("\n")
-                for string in string_list:
-                    file.write("// %s\n" % string)
+        lines = []
+        if self.valid:
+            for line in self.file_list:
+                if self.not_excluded(line):
+                    lines.append(line + '\n')
+        else:
+            string_list = PROGRAM_DESCRIPTION.split("\n")
+            for string in string_list:
+                lines.append("// %s\n" % string)
+
+        return write_generated_file(file_name, lines, only_if_changed)
+
+    # *************************************************************************
+    # Writes the files to lint split into shards, named after file_name with
+    # the shard number appended (files.lnt gives files_0.lnt, files_1.lnt,
+    # ...). Shards left over from a previous run with more shards are
+    # deleted. Nothing is written if the input file wasn't valid.
+    #
+    # Parameters:
+    #   file_name:       The name of the unsharded output file.
+    #   shard_count:     The number of shards to write.
+    #   module_times:    Per-module lint times from read_module_times().
+    #   only_if_changed: Passed on to write_generated_file().
+    # *************************************************************************
+    def write_shards(self, file_name, shard_count, module_times=None, only_if_changed=False):
+        self.cd_to_input_file_path()
+        if not self.valid:
+            return
+
+        files = [line for line in self.file_list if (line != "") and self.not_excluded(line)]
+        shards = balance_shards(estimate_lint_effort(files, module_times or {}), shard_count)
+
+        for shard_ix, shard in enumerate(shards):
+            write_generated_file(shard_name(file_name, shard_ix), [files[ix] + '\n' for ix in shard], only_if_changed)
+
+        shard_ix = len(shards)
+        while os.path.exists(shard_name(file_name, shard_ix)):
+            os.remove(shard_name(file_name, shard_ix))
+            shard_ix += 1
+
+
+# Builds several file lists in one run. The patterns of every list are registered with one DirectoryScanner, so directories shared by the lists
+# are only walked once, and identical patterns are only matched once.
+class LintFileBatch:
+
+    # *************************************************************************
+    # Reads every input file and resolves all of their patterns.
+    #
+    # Parameters:
+    #   pairs:         A list of (input file, output file) tuples. Relative
+    #                  output file names are relative to their input file.
+    #   manifest_name: The manifest file to cache directory listings in.
+    #                  None disables the cache.
+    #   variant:       Passed on to CreateLintFiles.
+    # *************************************************************************
+    def __init__(self, pairs, manifest_name=None, variant=None):
+        manifest = None
+        if manifest_name is not None:
+            # The manifest is specific to the whole set of input files.
+            digest = hashlib.sha1()
+            for input_name, _ in pairs:
+                digest.update(os.path.abspath(input_name).encode("utf-8"))
+                if os.path.isfile(input_name):
+                    digest.update(Path(input_name).read_bytes())
+            manifest = DirectoryManifest(os.path.abspath(manifest_name), digest.hexdigest())
+
+        self.scanner = DirectoryScanner(manifest)
+        self.lists = []
+        for input_name, output_name in pairs:
+            self.lists.append((CreateLintFiles(input_name, scanner=self.scanner, variant=variant), output_name))
+
+        self.scanner.walk()
+        if manifest is not None:
+            manifest.save()
+
+        for lint_files, _ in self.lists:
+            lint_files.add_search_results()
+
+    # *************************************************************************
+    # Writes every file list.
+    #
+    # Parameters:
+    #   only_if_changed: Passed on to CreateLintFiles.write().
+    #   shard_count:     If not None, each list is also written as this many
+    #                    shards.
+    #   module_times:    Passed on to CreateLintFiles.write_shards().
+    # *************************************************************************
+    def write(self, only_if_changed=False, shard_count=None, module_times=None):
+        for lint_files, output_name in self.lists:
+            lint_files.write(output_name, only_if_changed)
+            if shard_count is not None:
+                lint_files.write_shards(output_name, shard_count, module_times, only_if_changed)
 
 
 # *****************************************************************************
@@ -265,6 +744,258 @@ def stderr_out(message, exit=False):
     return None
 
 
+# *****************************************************************************
+# native_path
+#   Converts the Windows path separators used in the input file to the ones
+#   used by the running platform.
+#
+#   Parameters:
+#       path : The path to convert.
+#
+#   Returns:
+#       The converted path.
+# *****************************************************************************
+def native_path(path):
+    if os.sep != '\\':
+        path = path.replace('\\', os.sep)
+    return path
+
+
+# *****************************************************************************
+# read_batch_file
+#   Reads a batch file of input/output pairs for LintFileBatch.
+#
+#   Parameters:
+#       file_name : The batch file to read.
+#
+#   Returns:
+#       A list of (input file, output file) tuples, with the names made
+#       absolute relative to the batch file.
+# *****************************************************************************
+def read_batch_file(file_name):
+    pairs = []
+    base = os.path.dirname(os.path.abspath(file_name))
+    with open(file_name) as file:
+        line_number = 0
+        for line in file:
+            line_number += 1
+            comment_ix = line.find('#')
+            if comment_ix >= 0:
+                line = line[0:comment_ix]
+
+            names = [quoted or plain for quoted, plain in re.findall(r'"([^"]*)"|(\S+)', line)]
+            if len(names) == 2:
+                pairs.append(tuple(os.path.join(base, native_path(name)) for name in names))
+            elif len(names) > 0:
+                stderr_out("Warning line %i: expected an input and an output file in '%s'" % (line_number, line.strip()))
+    return pairs
+
+
+# *****************************************************************************
+# read_generated_lines
+#   Reads a file previously written by CreateLintFiles.write().
+#
+#   Parameters:
+#       file_name : The file to read.
+#
+#   Returns:
+#       The lines following the "Generated on" line, or None if the file
+#       doesn't exist or wasn't generated by this script.
+# *****************************************************************************
+def read_generated_lines(file_name):
+    lines = None
+    try:
+        with open(file_name) as file:
+            lines = file.readlines()
+    except OSError:
+        pass
+
+    if lines and lines[0].startswith("// Generated on "):
+        lines = lines[1:]
+    else:
+        lines = None
+    return lines
+
+
+# *****************************************************************************
+# write_generated_file
+#   Writes lines to a file, preceded by a "Generated on" line.
+#
+#   Parameters:
+#       file_name       : The file to write.
+#       lines           : The lines to write, each ending with a new line.
+#       only_if_changed : If asserted, the file is left untouched when it
+#                         already holds the same lines.
+#
+#   Returns:
+#       True if the file was written, False if it was left untouched.
+# *****************************************************************************
+def write_generated_file(file_name, lines, only_if_changed=False):
+    if only_if_changed and (read_generated_lines(file_name) == lines):
+        return False
+
+    with open(file_name, "w") as file:
+        file.write(datetime.now().strftime(
+            "// Generated on %Y-%m-%d at %H:%M:%S\n"))
+        file.writelines(lines)
+    return True
+
+
+# *****************************************************************************
+# shard_name
+#   Returns the name of a shard of an output file, e.g. files_2.lnt for shard
+#   2 of files.lnt.
+#
+#   Parameters:
+#       file_name : The name of the unsharded output file.
+#       shard_ix  : The shard number.
+# *****************************************************************************
+def shard_name(file_name, shard_ix):
+    root, extension = os.path.splitext(file_name)
+    return "{}_{}{}".format(root, shard_ix, extension)
+
+
+# *****************************************************************************
+# read_module_times
+#   Reads the per-module lint times written by run_lint_shards.py. Each line
+#   holds a module path and its lint time in seconds, separated by a comma.
+#
+#   Parameters:
+#       file_name : The file to read.
+#
+#   Returns:
+#       A dictionary of lint times keyed by the normalised module path. It is
+#       empty if the file doesn't exist.
+# *****************************************************************************
+def read_module_times(file_name):
+    module_times = {}
+    try:
+        with open(file_name) as file:
+            for line in file:
+                path, _, seconds = line.rstrip("\n").rpartition(",")
+                try:
+                    module_times[normalise_path(path)] = float(seconds)
+                except ValueError:
+                    pass
+    except OSError:
+        pass
+    return module_times
+
+
+# *****************************************************************************
+# estimate_lint_effort
+#   Estimates how long each file takes to lint. Files with a recorded time use
+#   it. The others use their size, converted to seconds with the average rate
+#   of the files that have a recorded time (or left in bytes if none do).
+#
+#   Parameters:
+#       files        : The paths of the files to lint.
+#       module_times : Per-module lint times from read_module_times().
+#
+#   Returns:
+#       A list with the estimated effort of each file.
+# *****************************************************************************
+def estimate_lint_effort(files, module_times):
+    sizes = []
+    for path in files:
+        try:
+            sizes.append(os.stat(path).st_size)
+        except OSError:
+            sizes.append(0)
+
+    timed_bytes = 0
+    timed_seconds = 0.0
+    for path, size in zip(files, sizes):
+        seconds = module_times.get(normalise_path(path))
+        if seconds is not None:
+            timed_bytes += size
+            timed_seconds += seconds
+
+    rate = (timed_seconds / timed_bytes) if (timed_bytes > 0) else 1.0
+
+    efforts = []
+    for path, size in zip(files, sizes):
+        seconds = module_times.get(normalise_path(path))
+        efforts.append(seconds if (seconds is not None) else (size * rate))
+    return efforts
+
+
+# *****************************************************************************
+# balance_shards
+#   Splits items into shards of about equal total effort. Items are handed
+#   out largest first, each to the shard with the least effort so far (the
+#   longest processing time rule), or to the one with the fewest items when
+#   efforts are equal. Within a shard, items keep their original order.
+#
+#   Parameters:
+#       efforts     : The effort of each item.
+#       shard_count : The number of shards. Fewer are returned if there are
+#                     fewer items, but always at least one.
+#
+#   Returns:
+#       A list of shards, each a sorted list of item indexes.
+# *****************************************************************************
+def balance_shards(efforts, shard_count):
+    shard_count = max(1, min(shard_count, len(efforts)))
+    shards = [[] for _ in range(shard_count)]
+
+    # The heap holds (effort so far, item count, shard number), so ties go to the shard with the fewest items and then the lowest shard number.
+    # Without the item count, items with no effort (empty or unreadable files) would all go to the first shard.
+    heap = [(0, 0, shard_ix) for shard_ix in range(shard_count)]
+    for ix in sorted(range(len(efforts)), key=lambda ix: (-efforts[ix], ix)):
+        total, count, shard_ix = heapq.heappop(heap)
+        shards[shard_ix].append(ix)
+        heapq.heappush(heap, (total + efforts[ix], count + 1, shard_ix))
+
+    for shard in shards:
+        shard.sort()
+    return shards
+
+
+# *****************************************************************************
+# normalise_path
+#   Puts a path in the form used to compare paths: redundant separators and
+#   up-level references are collapsed and, on Windows, the case is folded and
+#   forward slashes become backslashes.
+#
+#   Parameters:
+#       path : The path to normalise.
+#
+#   Returns:
+#       The normalised path.
+# *****************************************************************************
+def normalise_path(path):
+    return os.path.normcase(os.path.normpath(path))
+
+
+# *****************************************************************************
+# wild_card_to_regex
+#   Converts a command line wild card mask into a compiled regular expression.
+#   Like "dir", '*' matches any run of characters, '?' matches any single
+#   character, "*.*" matches every name and the match ignores case.
+#
+#   Parameters:
+#       mask : The wild card mask to convert.
+#
+#   Returns:
+#       The compiled regular expression.
+# *****************************************************************************
+def wild_card_to_regex(mask):
+    if mask == "*.*":
+        mask = "*"
+
+    expression = ""
+    for char in mask:
+        if char == '*':
+            expression += ".*"
+        elif char == '?':
+            expression += "."
+        else:
+            expression += re.escape(char)
+
+    return re.compile(expression + r"\Z", re.IGNORECASE | re.DOTALL)
+
+
 # ***************************************************************************************************************************************************
 # limit_chars
 #   Limits the input string to CHAR_LIMIT characters per line. It first separates the string based of "\n" to determine the paragraphs. Each
@@ -366,7 +1097,17 @@ def parse_args(args, prefix="", allow_unversioned=False):
     rc = args
 
     # Validate the args:
-    if not os.path.exists(args.input):
+    if (args.shards is not None) and (args.shards < 0):
+        parser.error("{}The number of shards can't be negative".format(prefix))
+        rc = None
+    elif (args.batch is not None) and (args.variant is not None):
+        parser.error("{}--variant can't be used with --batch".format(prefix))
+        rc = None
+    elif args.batch is not None:
+        if not os.path.exists(args.batch):
+            parser.error("{}Couldn't find {}".format(prefix, args.batch))
+            rc = None
+    elif not os.path.exists(args.input):
         parser.error("{}Couldn't find {}".format(prefix, args.input))
         rc = None
 
@@ -379,5 +1120,32 @@ def parse_args(args, prefix="", allow_unversioned=False):
 if (__name__ == '__main__'):
     args = parse_args(sys.argv[1:])
 
-    lintFiles = CreateLintFiles(args.input)
-    lintFiles.write(args.output)
+    shard_count = args.shards
+    module_times = None
+    if shard_count is not None:
+        if shard_count == 0:
+            shard_count = os.cpu_count() or 1
+        module_times = read_module_times(os.path.abspath(args.shard_times))
+
+    variant = None
+    if args.variant is not None:
+        # Imported here as it imports this script, and is only needed with --variant.
+        import conditional_compilation
+        variant = conditional_compilation.variant_evaluator(args.variant.split(","))
+
+    if args.batch is not None:
+        manifest_name = None
+        if not args.no_cache:
+            manifest_name = args.batch + MANIFEST_SUFFIX
+
+        batch = LintFileBatch(read_batch_file(args.batch), manifest_name, variant)
+        batch.write(not args.no_cache, shard_count, module_times)
+    else:
+        manifest_name = None
+        if not args.no_cache:
+            manifest_name = args.output + MANIFEST_SUFFIX
+
+        lintFiles = CreateLintFiles(args.input, manifest_name, variant=variant)
+        lintFiles.write(args.output, only_if_changed=not args.no_cache)
+        if shard_count is not None:
+            lintFiles.write_shards(args.output, shard_count, module_times, only_if_changed=not args.no_cache)
@@ -21,6 +21,18 @@
 #   chronological order is maintained.
 #   Usage: python move_version_info.py from_file to_file
 #
+#   With --store, the version entries are kept in a SQLite database instead, one row per version with its build number and date, and to_file is
+#   regenerated from it, so the previous history page doesn't need to be kept or read:
+#
+#   Usage: python move_version_info.py --store version_history.db --build 1234 [--version 1.2] [--date 2026/10/18] [from_file] to_file
+#
+#   The entry in to_file is stored as --version (default the build number), replacing any entry already stored for that version, and the entries
+#   of the versions stored before it are inserted after it, newest first. A version stored again keeps its place, so rebuilding an older version
+#   gives the page it had, without the entries of the later versions. The first time, when the database is empty, the history in from_file is stored
+#   as the oldest entry, so an existing history page carries on. The entry of any stored version can be printed with:
+#
+#   Usage: python move_version_info.py --store version_history.db --show 1.2
+#
 # Input Documents:
 #   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
 #   impact on this document.
@@ -29,13 +41,26 @@
 # History:
 #   2018 November 20 by Stuart Thain - Case 52219, Review 8966
 #     - Created.
+#   2026-Oct-18 - Request user-017
+#     - The files are streamed line by line into a temporary file that then replaces to_file, instead of being built up as strings in memory.
+#   2026-Oct-18 - Request user-018
+#     - Added --store, to keep the version entries in a database and regenerate to_file from it.
+#   2026-Oct-18 - Request user-018
+#     - A version stored again only gets the entries stored before it, so the history stays in order.
 #
 # ***************************************************************************************************************************************************
 
 # ***************************************************************************************************************************************************
 #   IMPORTS
 # ***************************************************************************************************************************************************
+import argparse
+import datetime
+import io
+import os
+import shutil
+import sqlite3
 import sys
+import tempfile
 
 # ***************************************************************************************************************************************************
 #   CONSTANTS
@@ -43,45 +68,228 @@ import sys
 CONTENTS_DIV_OPEN = "<div class=\"contents\">"
 CONTENTS_DIV_CLOSE = "</div><!-- contents -->"
 
+# The same format as add_build_and_date.py uses for $DATE.
+DATE_FORMAT = "%Y/%m/%d"
+
+# The version the history imported from an existing page is stored as.
+IMPORTED_VERSION = "(imported)"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    id      INTEGER PRIMARY KEY,
+    version TEXT NOT NULL UNIQUE,
+    build   INTEGER,
+    date    TEXT NOT NULL,
+    entry   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS versions_build ON versions (build);
+"""
+
 # ***************************************************************************************************************************************************
-#   FUNCTIONS
+#   CLASSES
 # ***************************************************************************************************************************************************
 
 
-def move_version_info():
-    exit_status = -1
-    if len(sys.argv) == 3:
-        from_file_name = sys.argv[1]
-        to_file_name = sys.argv[2]
+# The version entry database. Entries are kept in the order they were added.
+class VersionStore:
+
+    # ***********************************************************************************************************************************************
+    # Opens the database, creating it if it doesn't exist.
+    # ***********************************************************************************************************************************************
+    def __init__(self, file_name):
+        self.connection = sqlite3.connect(file_name)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    # ***********************************************************************************************************************************************
+    # Returns True if there are no entries.
+    # ***********************************************************************************************************************************************
+    def is_empty(self):
+        return self.connection.execute("SELECT 1 FROM versions LIMIT 1").fetchone() is None
+
+    # ***********************************************************************************************************************************************
+    # Stores the entry of a version, as the newest. An entry already stored for the version is replaced where it is, so a build that is run again
+    # doesn't add its entry twice.
+    # ***********************************************************************************************************************************************
+    def add(self, version, build, date, entry):
+        # The connection commits on success and rolls back on an exception.
+        with self.connection:
+            cursor = self.connection.execute("UPDATE versions SET build = ?, date = ?, entry = ? WHERE version = ?", (build, date, entry, version))
+            if cursor.rowcount == 0:
+                self.connection.execute("INSERT INTO versions (version, build, date, entry) VALUES (?, ?, ?, ?)", (version, build, date, entry))
 
-        # Read old version history.
-        from_file = open(from_file_name, "r")
+    # ***********************************************************************************************************************************************
+    # Returns the (version, build, date, entry) of a version, looked up by version or else by build number, or None if it isn't stored.
+    # ***********************************************************************************************************************************************
+    def find(self, version):
+        row = self.connection.execute("SELECT version, build, date, entry FROM versions WHERE version = ?", (version,)).fetchone()
+        if (row is None) and version.isdigit():
+            row = self.connection.execute("SELECT version, build, date, entry FROM versions WHERE build = ? ORDER BY id DESC",
+                                          (int(version),)).fetchone()
+        return row
+
+    # ***********************************************************************************************************************************************
+    # Writes the entries of the versions stored before a version to output, newest first. The entries are read from the database as they are
+    # written. An older build that is run again keeps its place, so its page only gets the entries that came before it, as it did the first time.
+    # ***********************************************************************************************************************************************
+    def write_entries(self, output, version):
+        for (entry,) in self.connection.execute("SELECT entry FROM versions WHERE id < (SELECT id FROM versions WHERE version = ?) ORDER BY id DESC",
+                                                (version,)):
+            output.write(entry)
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+
+# ***************************************************************************************************************************************************
+# copy_version_info
+#   Copies the lines between CONTENTS_DIV_OPEN and CONTENTS_DIV_CLOSE in from_file_name to output, a line at a time.
+# ***************************************************************************************************************************************************
+def copy_version_info(from_file_name, output):
+    with open(from_file_name, "r") as from_file:
         read_lines = False
-        old_version_info = ""
-        # This loop adds content between CONTENTS_DIV_OPEN and CONTENTS_DIV_CLOSE to old_version_info.
         for line in from_file:
             if (line.find(CONTENTS_DIV_CLOSE) > -1):
                 read_lines = False
             if (read_lines):
-                old_version_info += line
+                output.write(line)
             if (line.find(CONTENTS_DIV_OPEN) > -1):
                 read_lines = True
-        from_file.close()
 
-        # Read new version history entry, and insert old version history after it.
-        to_file = open(to_file_name, "r")
-        new_version_info = ""
-        for line in to_file:
-            if (line.find(CONTENTS_DIV_CLOSE) > -1):
-                # Insert old history just before the closing div tag.
-                new_version_info += old_version_info
-            new_version_info += line
-        to_file.close()
-
-        # Write everything back to to_file
-        to_file = open(to_file_name, "w")
-        to_file.write(new_version_info)
-        to_file.close()
+
+# ***************************************************************************************************************************************************
+# read_version_info
+#   Returns the lines between CONTENTS_DIV_OPEN and CONTENTS_DIV_CLOSE in file_name as a string.
+# ***************************************************************************************************************************************************
+def read_version_info(file_name):
+    text = io.StringIO()
+    copy_version_info(file_name, text)
+    return text.getvalue()
+
+
+# ***************************************************************************************************************************************************
+# insert_version_info
+#   Calls insert(output) just before the closing div tag of to_file_name, to add the older history. The result is written to a temporary file in
+#   the same directory, which then replaces to_file_name, so to_file_name is never left half written. Only a line of to_file_name is held in
+#   memory at a time.
+# ***************************************************************************************************************************************************
+def insert_version_info(to_file_name, insert):
+    # Replace the file a link points to, not the link.
+    path = os.path.realpath(to_file_name)
+    handle, temp_name = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(handle, "w") as output:
+            with open(to_file_name, "r") as to_file:
+                for line in to_file:
+                    if (line.find(CONTENTS_DIV_CLOSE) > -1):
+                        # Insert old history just before the closing div tag.
+                        insert(output)
+                    output.write(line)
+            output.flush()
+            os.fsync(output.fileno())
+        shutil.copymode(path, temp_name)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.remove(temp_name)
+        raise
+
+
+# ***************************************************************************************************************************************************
+# merge_version_info
+#   Inserts the version history of from_file_name just before the closing div tag of to_file_name.
+# ***************************************************************************************************************************************************
+def merge_version_info(from_file_name, to_file_name):
+    insert_version_info(to_file_name, lambda output: copy_version_info(from_file_name, output))
+
+
+# ***************************************************************************************************************************************************
+# store_version_info
+#   Stores the version entry of to_file_name, and inserts the entries of the earlier versions just before its closing div tag.
+#
+#   Parameters:
+#       store          : The VersionStore.
+#       to_file_name   : The page holding the new version entry.
+#       version        : The version to store the entry as.
+#       build          : The build number, or None.
+#       date           : The date of the build.
+#       from_file_name : A history page to store as the oldest entry if the store is empty, or None.
+# ***************************************************************************************************************************************************
+def store_version_info(store, to_file_name, version, build, date, from_file_name=None):
+    if (from_file_name is not None) and store.is_empty():
+        store.add(IMPORTED_VERSION, None, "", read_version_info(from_file_name))
+    store.add(version, build, date, read_version_info(to_file_name))
+    insert_version_info(to_file_name, lambda output: store.write_entries(output, version))
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments for --store.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Adds the version entry of a doxygen page to the version history.")
+    parser.add_argument("files", nargs="*", help="[from_file] to_file, as described above.")
+    parser.add_argument("--store", "-s", required=True, help="The version entry database.")
+    parser.add_argument("--build", "-b", type=int, default=None, help="The build number.")
+    parser.add_argument("--version", "-v", default=None, help="The version of the entry in to_file (Default = the build number).")
+    parser.add_argument("--date", "-d", default=datetime.date.today().strftime(DATE_FORMAT),
+                        help="The date of the build (Default = today, as {}).".format(DATE_FORMAT.replace("%", "%%")))
+    parser.add_argument("--show", default=None, help="Print the entry of this version, or build number, instead.")
+    args = parser.parse_args(args)
+
+    if args.show is None:
+        if len(args.files) not in (1, 2):
+            parser.error("Expected [from_file] to_file")
+        if (args.version is None) and (args.build is None):
+            parser.error("--version or --build is needed")
+        if args.version is None:
+            args.version = str(args.build)
+    return args
+
+
+# ***************************************************************************************************************************************************
+# run_store
+#   Carries out a --store command line, and returns the exit status.
+# ***************************************************************************************************************************************************
+def run_store(args):
+    exit_status = -1
+    try:
+        store = VersionStore(args.store)
+    except sqlite3.Error as error:
+        print("Error: Couldn't open {}: {}".format(args.store, error))
+        return exit_status
+
+    try:
+        if args.show is not None:
+            row = store.find(args.show)
+            if row is None:
+                print("Error: {} isn't stored".format(args.show))
+            else:
+                sys.stdout.write(row[3])
+                exit_status = 0
+        else:
+            from_file_name = args.files[0] if len(args.files) == 2 else None
+            store_version_info(store, args.files[-1], args.version, args.build, args.date, from_file_name)
+            exit_status = 0
+    except (OSError, sqlite3.Error) as error:
+        print("Error: {}".format(error))
+    finally:
+        store.close()
+    return exit_status
+
+
+def move_version_info():
+    exit_status = -1
+    if any(arg in ("--store", "-s") or arg.startswith("--store=") for arg in sys.argv[1:]):
+        exit_status = run_store(parse_args(sys.argv[1:]))
+    elif len(sys.argv) == 3:
+        from_file_name = sys.argv[1]
+        to_file_name = sys.argv[2]
+
+        merge_version_info(from_file_name, to_file_name)
         exit_status = 0
     else:
         print("Error: Expected 2 arguments, got " + str(len(sys.argv) - 1))
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Lints the shards written by makeLintFileList.py --shards concurrently, one lint process per shard with at most --jobs running at once, and
+#   merges their output into a single file. Everything after --lint is the lint command; the shard file is appended to it. For example:
+#
+#   Usage: python run_lint_shards.py -l files.lnt -o lint_all_output.txt files_0.lnt files_1.lnt --lint lint-nt project_specific.lnt -passes(2)
+#
+#   The merged output holds the banner of the first shard, every "--- Module:" section in the order of the unsharded list given with --list
+#   (pass by pass when lint is run with -passes),
+#   the "--- Global Wrap-up" messages of each shard in shard order, and a single summary table with the counts of all the shards added up.
+#   Note that lint only sees the modules of its own shard, so the global wrap-up of each shard only covers those modules.
+#
+#   The time each shard took is shared among its modules by file size and saved to --times, which makeLintFileList.py --shard_times reads to
+#   balance the next run.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-005
+#     - Created.
+#   2026-Oct-18 - Request user-006
+#     - Use the lint output patterns from lint_output.py.
+#   2026-Oct-18 - Request user-005
+#     - read_file_list() also reads lists without the "Generated on" line, and exits when the list can't be read.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+import subprocess
+import sys
+import time
+
+import lint_output
+import makeLintFileList
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+DEFAULT_OUTPUT_FILE = "lint_all_output.txt"
+
+# Lint output is written back exactly as it was read. Latin-1 maps every byte to a character, so no byte is lost or changed.
+OUTPUT_ENCODING = lint_output.LINT_OUTPUT_ENCODING
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# The output of one lint run, split into the sections that are merged separately.
+class LintRunOutput:
+
+    # ***********************************************************************************************************************************************
+    # Splits the output into sections.
+    #
+    # Parameters:
+    #   text: The output of the lint run.
+    # ***********************************************************************************************************************************************
+    def __init__(self, text):
+        # Lines before the first module.
+        self.preamble = []
+        # A list of [module path, lines], the lines starting with the "--- Module:" line.
+        self.modules = []
+        # The global wrap-up messages, not including the header or the summary table.
+        self.global_lines = []
+        # The summary rows as [count, type, number, text] lists.
+        self.summary = []
+        self.newline = "\r\n" if "\r\n" in text else "\n"
+
+        section = self.preamble
+        for line in text.splitlines(keepends=True):
+            stripped = line.strip()
+            match = lint_output.MODULE_HEADER.match(stripped)
+            if match:
+                section = [line]
+                self.modules.append([match.group(1), section])
+            elif stripped == lint_output.GLOBAL_WRAP_UP_HEADER:
+                section = self.global_lines
+            elif lint_output.SUMMARY_HEADER.match(stripped):
+                section = None
+            elif section is None:
+                row = lint_output.SUMMARY_ROW.match(stripped)
+                if row:
+                    self.summary.append([int(row.group(1)), row.group(2), int(row.group(3)), row.group(4)])
+            else:
+                section.append(line)
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# read_file_list
+#   Returns the files listed in a file list, one per line, such as those written by makeLintFileList.py. Blank lines and "//" comments, such as
+#   the "Generated on" line, are skipped. Exits if the file can't be read.
+# ***************************************************************************************************************************************************
+def read_file_list(file_name):
+    try:
+        with open(file_name) as file:
+            lines = file.readlines()
+    except OSError as error:
+        stderr_out("Python Error: Couldn't read {}: {}".format(file_name, error.strerror), True)
+    return [line.rstrip("\n") for line in lines if line.strip() and not line.startswith("//")]
+
+
+# ***************************************************************************************************************************************************
+# run_shard
+#   Lints one shard.
+#
+#   Parameters:
+#       command : The lint command, without the shard file.
+#       shard   : The shard file to lint.
+#
+#   Returns:
+#       A tuple of the output text (None if lint couldn't be started) and the elapsed time in seconds.
+# ***************************************************************************************************************************************************
+def run_shard(command, shard):
+    start = time.perf_counter()
+    try:
+        # Lint's return code is the number of messages, so it isn't treated as a failure (lint.bat doesn't either).
+        result = subprocess.run(command + [shard], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        output = result.stdout.decode(OUTPUT_ENCODING)
+    except OSError as error:
+        stderr_out("Couldn't run lint on '{}': {}".format(shard, error))
+        output = None
+    return output, time.perf_counter() - start
+
+
+# ***************************************************************************************************************************************************
+# merge_outputs
+#   Merges the outputs of the shards into a single output.
+#
+#   Parameters:
+#       outputs      : A list of LintRunOutput, in shard order.
+#       module_order : The module paths in the order they should appear. Modules not in it follow, in shard order.
+#
+#   Returns:
+#       The merged output text.
+# ***************************************************************************************************************************************************
+def merge_outputs(outputs, module_order):
+    order = {}
+    for ix, path in enumerate(module_order):
+        order.setdefault(makeLintFileList.normalise_path(path), ix)
+
+    # With -passes(n) lint goes through every module of its shard n times, so the sections are keyed by pass first and then by list order.
+    # sorted() is stable, so unlisted modules keep their shard order.
+    modules = []
+    for output in outputs:
+        passes = {}
+        for module in output.modules:
+            path = makeLintFileList.normalise_path(module[0])
+            passes[path] = passes.get(path, -1) + 1
+            modules.append(((passes[path], order.get(path, len(order))), module))
+    modules = [module for _, module in sorted(modules, key=lambda keyed: keyed[0])]
+
+    newline = outputs[0].newline if outputs else "\n"
+    merged = list(outputs[0].preamble) if outputs else []
+    for _, lines in modules:
+        merged += lines
+
+    # Each shard's messages are separated from the headers around them by blank lines, which are only kept once.
+    global_lines = []
+    for output in outputs:
+        lines = output.global_lines
+        while lines and not lines[0].strip():
+            lines = lines[1:]
+        while lines and not lines[-1].strip():
+            lines = lines[:-1]
+        global_lines += lines
+    if global_lines:
+        merged += [lint_output.GLOBAL_WRAP_UP_HEADER + newline, newline]
+        merged += global_lines
+        merged.append(newline)
+
+    counts = {}
+    for output in outputs:
+        for count, kind, number, text in output.summary:
+            if (kind, number) in counts:
+                counts[(kind, number)][0] += count
+            else:
+                counts[(kind, number)] = [count, text]
+    if counts:
+        if merged and merged[-1].strip():
+            merged.append(newline)
+        merged.append("Count   Type    Number  Text" + newline + newline)
+        for kind, number in sorted(counts, key=lambda key: key[1]):
+            count, text = counts[(kind, number)]
+            merged.append("{:<8}{:<8}{:<8}{}{}".format(count, kind, number, text, newline))
+
+    return "".join(merged)
+
+
+# ***************************************************************************************************************************************************
+# update_module_times
+#   Shares the time each shard took among its modules, in proportion to their file sizes, and saves the result along with the times of modules
+#   that weren't linted in this run.
+#
+#   Parameters:
+#       file_name : The times file to update.
+#       shards    : The shard files.
+#       elapsed   : The time each shard took, in seconds.
+# ***************************************************************************************************************************************************
+def update_module_times(file_name, shards, elapsed):
+    times = {}
+    try:
+        with open(file_name) as file:
+            for line in file:
+                path, _, seconds = line.rstrip("\n").rpartition(",")
+                if path:
+                    times[makeLintFileList.normalise_path(path)] = (path, seconds)
+    except OSError:
+        pass
+
+    for shard, seconds in zip(shards, elapsed):
+        files = read_file_list(shard)
+        sizes = []
+        for path in files:
+            try:
+                sizes.append(os.stat(path).st_size)
+            except OSError:
+                sizes.append(0)
+        total = sum(sizes)
+        for path, size in zip(files, sizes):
+            share = (size / total) if total else (1 / len(files))
+            times[makeLintFileList.normalise_path(path)] = (path, "{:.3f}".format(seconds * share))
+
+    with open(file_name, "w") as file:
+        for key in sorted(times):
+            file.write("{},{}\n".format(*times[key]))
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Lints shards of a file list in parallel and merges the results.")
+    parser.add_argument("shards", nargs="+", help="The shard files written by makeLintFileList.py --shards.")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="The maximum number of lint processes to run at once (Default = number of CPU cores).")
+    parser.add_argument("--output", "-o", default=DEFAULT_OUTPUT_FILE,
+                        help="The merged output file (Default = {}).".format(DEFAULT_OUTPUT_FILE))
+    parser.add_argument("--list", "-l", default=None,
+                        help="The unsharded file list, which sets the order of the modules in the merged output. If not given, modules are "
+                             "ordered by shard.")
+    parser.add_argument("--times", "-t", default=makeLintFileList.DEFAULT_SHARD_TIMES_FILE,
+                        help="The per-module lint times to update (Default = {}).".format(makeLintFileList.DEFAULT_SHARD_TIMES_FILE))
+    parser.add_argument("--lint", nargs=argparse.REMAINDER, required=True,
+                        help="The lint command and its options. Must be the last option.")
+    args = parser.parse_args(args)
+
+    if not args.lint:
+        parser.error("--lint needs a command")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    for shard in args.shards:
+        if not os.path.exists(shard):
+            parser.error("Couldn't find {}".format(shard))
+    return args
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(lambda shard: run_shard(args.lint, shard), args.shards))
+
+    if any(output is None for output, _ in results):
+        stderr_out("Python Error: Lint failed to run.", True)
+
+    module_order = []
+    if args.list is not None:
+        module_order = read_file_list(args.list)
+
+    merged = merge_outputs([LintRunOutput(output) for output, _ in results], module_order)
+    with open(args.output, "w", encoding=OUTPUT_ENCODING, newline="") as file:
+        file.write(merged)
+
+    update_module_times(args.times, args.shards, [seconds for _, seconds in results])
@@ -36,15 +36,46 @@
 #   2017-Dec-19 by Tamkin Rahman - Case 43246, Review 7285
 #   - Updated to allow the --string option to indicate the value written during
 #     a write operation is a string (i.e. add quotes).
+#   2026-Oct-18 - Request user-010
+#   - Any number of variables can be read and written in one call, with the
+#     file read and written once. A read of ENV=VARIABLE prints a set command
+#     for env.bat.
+#   2026-Oct-18 - Request user-011
+#   - Parse each line once with precompiled patterns into an index of the
+#     variables in the file, instead of compiling patterns for every variable
+#     on every line.
+#   2026-Oct-18 - Request user-012
+#   - C and H files are scanned as a whole by scan_defines, which follows
+#     comments, literals and line continuations across lines. Writes put the
+#     new value in place at the byte offsets of the old one.
+#   2026-Oct-18 - Request user-013
+#   - Files are written to a temporary file that then replaces the original,
+#     so an interrupted write never leaves a truncated file. write_variable
+#     replaces the value at its position in the line.
+#   2026-Oct-18 - Request user-014
+#   - The command line is carried out by main(), which rw_variable_server.py
+#     also calls. It can be given a cache of the files already indexed.
+#   2026-Oct-18 - Request user-016
+#   - Numbers that are constant expressions, such as (1U << 4), are
+#     evaluated by c_expression.py.
+#   2026-Oct-18 - Request user-008
+#   - The resolution of file modification times is taken from file_times.py.
 # *****************************************************************************
 
 # *****************************************************************************
 #   IMPORTS
 # *****************************************************************************
 
+import itertools
 import os
 import re
+import shutil
 import sys
+import tempfile
+import time
+
+import c_expression
+import file_times
 
 # *****************************************************************************
 #   CONSTANTS
@@ -71,6 +102,86 @@ ignore_for_numbers = ['(', ')', 'u', 'U', 'L', 'l']
 # *****************************************************************************
 type_options = ["--define", "--doxygen"]
 
+
+# *****************************************************************************
+# Patterns used to scan C files. They are compiled once, and don't include the
+# variable name, so the file is scanned the same way whatever is looked up.
+#
+#   c_skip_pattern    : The parts of a file a directive can't start in:
+#                         - A streamed comment (/*COMMENT */, which may span
+#                           lines or run to the end of the file).
+#                         - A single-line comment (//COMMENT, continued by a
+#                           \ at the end of the line).
+#                         - A string or character literal, so // or /*
+#                           inside quotes isn't taken as a comment.
+#                         - A \ at the end of a line, which continues the
+#                           line.
+#                       There are no groups, so the engine can skip straight
+#                       to the next / " ' or \. The first byte of a match
+#                       tells which it is.
+#   directive_pattern : The rest of a directive after its #, up to the end of
+#                       the line. Comments and splices may carry it on over
+#                       several lines.
+#   define_pattern    : A #define directive, from the start of its line (which
+#                       may have streamed comments before the #). The usual
+#                       '#define name value' with only a comment after it is
+#                       split up by the groups:
+#                         1: The name.
+#                         2: The ( of a function-like macro.
+#                         3: The value.
+#                       Anything else (comments in the value, continued
+#                       lines, etc.) is left to parse_define_directive, with
+#                       group 4 holding the directive after its #.
+#   define_line_pattern: c_skip_pattern or a #define directive after the
+#                        newline that starts its line, so the #define
+#                        directives are found in the same scan as the parts
+#                        they can't be in. Only the first line of a file
+#                        isn't after a newline; define_pattern is matched
+#                        against it separately.
+#   directive_define_pattern: 'define name' after the # of a directive, with
+#                             comments and splices blanked out.
+# *****************************************************************************
+c_skip_pattern = re.compile(rb'''
+      /\*[^*]*\*+(?:[^/*][^*]*\*+)*/
+    | /\*.*
+    | //[^\n\\]*(?:\\(?:\r\n|.)[^\n\\]*)*
+    | "[^"\\\n]*(?:\\(?:\r\n|.)[^"\\\n]*)*"?
+    | '[^'\\\n]*(?:\\(?:\r\n|.)[^'\\\n]*)*'?
+    | \\\r?\n
+    ''', re.DOTALL | re.VERBOSE)
+directive_pattern = re.compile(
+    rb'(?:[^\n"\'/\\]+|' + c_skip_pattern.pattern + rb'|[/\\])*',
+    re.DOTALL | re.VERBOSE)
+define_pattern = re.compile(rb'''
+    [ \t]*(?:/\*[^*\n]*\*+(?:[^/*\n][^*\n]*\*+)*/[ \t]*)*\#
+    (?: [ \t]*define[ \t]+(\w+)(?:(?=(\())|(?=\s|\Z))[ \t]*
+        ((?: [^\s"'/\\]+(?![^\s"'/\\])
+           | "[^"\\\n]*(?:\\[^\r\n][^"\\\n]*)*"
+           | '[^'\\\n]*(?:\\[^\r\n][^'\\\n]*)*'
+           | [ \t]+(?=[^\s/\\])
+        )*)
+        [ \t]*(?:/\*[^*\n]*\*+(?:[^/*\n][^*\n]*\*+)*/[ \t]*)*
+        (?://[^\n\\]*)?\r?(?=\n|\Z)
+      | ([ \t]*define\b''' + directive_pattern.pattern + rb''')
+    )
+    ''', re.DOTALL | re.VERBOSE)
+define_line_pattern = re.compile(
+    c_skip_pattern.pattern + rb'|\n' + define_pattern.pattern,
+    re.DOTALL | re.VERBOSE)
+directive_define_pattern = re.compile(rb'\s*define\s+(\w+)')
+
+
+# *****************************************************************************
+# The pattern used to parse lines of Doxygen files:
+# '[ \t]*name[ \t]*=[ \t]*value'.
+# *****************************************************************************
+doxygen_pattern = re.compile(r'[ \t]*(\w+)[ \t]*=[ \t]*(.+)', re.DOTALL)
+
+# *****************************************************************************
+# The byte order mark some editors put at the start of UTF-8 files.
+# *****************************************************************************
+utf8_bom = b'\xef\xbb\xbf'
+
 # *****************************************************************************
 #   FUNCTIONS
 # *****************************************************************************
@@ -135,17 +246,9 @@ def read_variable(variable, line, number=False, type="--define"):
 def read_variable_doxygen(variable, line):
     result = None
 
-    # Remove anything after the first #
-    ix = line.find('#')
-    if (ix >= 0):
-        line = line[0:ix]
-
-    r_xp = re.compile("[ \t]*" + variable + "[ \t]*=[ \t]*" +
-                      "(.+)$", re.DOTALL)
-    match = re.match(r_xp, line)
-    if (match):
-        result = match.group(1)
-        result = result.strip()
+    parsed = parse_doxygen(line)
+    if (parsed and (parsed[0] == variable)):
+        result = parsed[1]
 
     return result
 
@@ -159,85 +262,414 @@ def read_variable_doxygen(variable, line):
 #                integer.
 #   Returns:
 #       If the variable is found:
-#           If 'number' is asserted:
-#              - Then the 'ignore_for_numbers' characters will be
-#                ignored. Also, the leading 0 will be replaced with 0o
-#                for octal.
-#            - The returned value will be an int.
+#           If 'number' is asserted, the value converted by convert_number.
 #           Else, the string following #define, with whitespace removed
 #           at the ends, is returned.
 #       Else, None is returned.
 #
+#   Description:
+#       See parse_pound_define.
+# *****************************************************************************
+def read_variable_pound_define(variable, line, number=False):
+    result = None
+
+    parsed = parse_pound_define(line)
+    if (parsed and (parsed[0] == variable)):
+        result = parsed[1]
+        if (number):
+            result = convert_number(result)
+
+    return result
+
+
+# *****************************************************************************
+# blank_skipped
+#   Returns the text of a c_skip_pattern match with comments and splices
+#   replaced by spaces of the same length, so nothing around them moves.
+#   Literals are kept.
+# *****************************************************************************
+def blank_skipped(match):
+    text = match.group()
+    if (text[:1] in b"\"'"):
+        return text
+    return b" " * len(text)
+
+
+# *****************************************************************************
+# join_skipped
+#   Returns the text of a c_skip_pattern match as the preprocessor sees it:
+#   a comment is a single space, a splice is nothing, and literals are kept.
+# *****************************************************************************
+def join_skipped(match):
+    text = match.group()
+    if (text[:1] == b"/"):
+        return b" "
+    elif (text[:1] == b"\\"):
+        return b""
+    return text
+
+
+# *****************************************************************************
+# scan_defines
+#   Parameters:
+#       buffer: The contents of a C or H file, as bytes.
+#
+#   Returns:
+#       A generator of a tuple for each #define directive in the buffer, in
+#       order:
+#           - The name of the #define (str).
+#           - The value (bytes). Comments in it are replaced by a space, line
+#             continuations are removed, and whitespace at the ends is
+#             removed. Empty if the #define has no value.
+#           - The (start, end) byte offsets of the value in the buffer.
+#           - True for a function-like macro (a '(' straight after the name).
+#
+#   Description:
+#       Keeps track of comments, literals and line continuations:
+#           - A comment or literal can't hold a directive, and nothing in
+#             them ends one, so "/* #define A 1 */" is not a #define and a
+#             // inside a string literal is not a comment.
+#           - A streamed comment counts as a space, so it can come before the
+#             # of a directive, and a directive continues after a comment
+#             that spans lines.
+#           - A \ at the end of a line continues the line, so the directive
+#             carries on, and a # on the next line doesn't start one.
+#
+#       A single regular expression scan finds the comments, literals and
+#       splices along with the #define directives, so the engine steps over
+#       everything a directive can't start in. The usual '#define name value'
+#       is split up by the scan too; only other directives are parsed here.
+# *****************************************************************************
+def scan_defines(buffer):
+    first_line = define_pattern.match(buffer)
+    matches = define_line_pattern.finditer(buffer)
+    if (first_line):
+        matches = itertools.chain(
+            [first_line],
+            define_line_pattern.finditer(buffer, first_line.end()))
+
+    for match in matches:
+        # Comments, literals and splices have no groups.
+        group = match.lastindex
+        if (group == 3):
+            name, paren, value = match.group(1, 2, 3)
+            yield (name.decode("ascii"), value, match.span(3),
+                   paren is not None)
+        elif (group == 4):
+            define = parse_define_directive(buffer, match.start(4),
+                                            match.end(4))
+            if (define):
+                yield define
+
+
+# *****************************************************************************
+# parse_define_directive
+#   Parameters:
+#       buffer     : The contents of the file, as bytes.
+#       start      : The offset just after the # of the directive.
+#       end        : The offset of the end of the directive (its newline).
+#
+#   Returns:
+#       A tuple as described by scan_defines if the directive is a #define,
+#       else None.
+# *****************************************************************************
+def parse_define_directive(buffer, start, end):
+    directive = buffer[start:end]
+    blanked = directive
+    if ((b"/" in directive) or (b"\\" in directive) or
+            (b'"' in directive) or (b"'" in directive)):
+        blanked = c_skip_pattern.sub(blank_skipped, directive)
+
+    match = directive_define_pattern.match(blanked)
+    if (not match):
+        return None
+
+    # The name is followed by whitespace, the ( of a function-like macro, or
+    # nothing.
+    name_end = match.end()
+    function_like = blanked[name_end:name_end + 1] == b"("
+    if (blanked[name_end:name_end + 1] not in (b"", b"(", b" ", b"\t",
+                                                 b"\r", b"\n")):
+        return None
+    value_start = name_end + len(blanked[name_end:]) - \
+        len(blanked[name_end:].lstrip())
+    value_end = len(blanked.rstrip())
+    if (value_end < value_start):
+        value_end = value_start
+
+    value = directive[value_start:value_end]
+    if ((b"/" in value) or (b"\\" in value)):
+        value = c_skip_pattern.sub(join_skipped, value).strip()
+
+    return (match.group(1).decode("ascii"), value,
+            (start + value_start, start + value_end), function_like)
+
+
+# *****************************************************************************
+# scan_doxygen
+#   Parameters:
+#       buffer  : The contents of a Doxygen file, as bytes.
+#       encoding: The encoding of the file.
+#
+#   Returns:
+#       A generator of a tuple for each FOO = BAR style variable, laid out
+#       like those of scan_defines (function-like is always False).
+# *****************************************************************************
+def scan_doxygen(buffer, encoding):
+    offset = 0
+    if (buffer.startswith(utf8_bom)):
+        offset = len(utf8_bom)
+
+    for line in buffer[offset:].splitlines(True):
+        text = line.decode(encoding)
+        parsed = parse_doxygen(text)
+        if (parsed):
+            start = offset + len(text[:parsed[2][0]].encode(encoding))
+            end = start + len(text[parsed[2][0]:parsed[2][1]].encode(encoding))
+            yield (parsed[0], buffer[start:end], (start, end), False)
+        offset += len(line)
+
+
+# *****************************************************************************
+# parse_pound_define
+#   Parameters:
+#      line: The line to parse.
+#
+#   Returns:
+#       If the line is a #define with a value, a tuple of:
+#           - The name of the #define.
+#           - The value, as a string with whitespace removed at the ends.
+#           - The (start, end) span of the value in the line.
+#       Else, None is returned.
+#
+#   Description:
+#       Parses the line with scan_defines, so a single line is read the same
+#       way as a whole file. Function-like macros are ignored.
+# *****************************************************************************
+def parse_pound_define(line):
+    # Almost every line of a header can be rejected without scanning it.
+    if ('#' not in line):
+        return None
+
+    encoded = line.encode("utf-8")
+    for name, value, span, function_like in scan_defines(encoded):
+        if (value and (not function_like)):
+            start = len(encoded[:span[0]].decode("utf-8"))
+            end = start + len(encoded[span[0]:span[1]].decode("utf-8"))
+            return name, value.decode("utf-8"), (start, end)
+    return None
+
+
+# *****************************************************************************
+# parse_doxygen
+#   Parameters:
+#      line: The line to parse.
+#
+#   Returns:
+#       If the line is a FOO = BAR style variable with a value, a tuple of the
+#       name, the value (whitespace removed at the ends), and the (start, end)
+#       span of the value in the line.
+#       Else, None is returned.
+#
+#   Description:
+#       Anything after the first # is a comment and is ignored.
+# *****************************************************************************
+def parse_doxygen(line):
+    ix = line.find('#')
+    if (ix >= 0):
+        line = line[0:ix]
+
+    match = doxygen_pattern.match(line)
+    if (not match):
+        return None
+
+    start = match.start(2)
+    start = len(line) - len(line[start:].lstrip())
+    end = start + len(line[start:].rstrip())
+    if (end == start):
+        return None
+
+    return match.group(1), line[start:end], (start, end)
+
+
+# *****************************************************************************
+# convert_number
+#   Parameters:
+#      value: The value of a #define, as a string.
+#
+#   Returns:
+#       The 'ignore_for_numbers' characters are removed, a leading 0 is
+#       replaced with 0o for octal, and the value is returned as an int.
+#       A value that isn't a plain number, such as "(1U << 4)", is
+#       evaluated as a constant C expression, with the integer types of the
+#       target (see c_expression.py).
+#
 #   Raises:
 #       On ValueError, the string of the number is given, and the error is
 #       printed to the screen.
+# *****************************************************************************
+def convert_number(line):
+    value = line
+    for char in ignore_for_numbers:
+        line = line.replace(char, "")
+
+    line = line.strip()
+
+    if (len(line) > 0):
+        start = line[0]
+
+        if (start == '-'):
+            line = line[1:]
+        else:
+            start = ""
+
+        # If octal, insert the 'o' character so Python 3 can recognize
+        # it.
+        if (len(line) >= 2 and line[0] == '0' and line[1] != 'x'):
+            line = line[0] + 'o' + line[1:]
+
+        line = start + line
+        try:
+            line = int(line.strip(), 0)
+        # If value error, try it as an expression, else just use the string.
+        except ValueError:
+            if (len(line) >= 3 and line[1] == 'o'):
+                line = line[0] + line[2:]
+            try:
+                line = c_expression.evaluate(value)
+            except ValueError:
+                stderr_out("Python Error: Value error occurred.\n", False)
+
+    if (line == ""):
+        line = None
+
+    return line
+
+
+# *****************************************************************************
+# detect_encoding
+#   Parameters:
+#       buffer: The contents of a file, as bytes.
+#
+#   Returns:
+#       "utf-8" if the contents are valid UTF-8 (which includes plain ASCII),
+#       else "latin-1", which can decode any byte.
+# *****************************************************************************
+def detect_encoding(buffer):
+    try:
+        buffer.decode("utf-8")
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8"
+
+
+# *****************************************************************************
+# read_buffer
+#   Parameters:
+#       filename: The file to read.
+#
+#   Returns:
+#       A tuple of the contents of the file as bytes, and its encoding.
+# *****************************************************************************
+def read_buffer(filename):
+    with open(filename, 'rb') as f:
+        buffer = f.read()
+    return buffer, detect_encoding(buffer)
+
+
+# *****************************************************************************
+# index_buffer
+#   Parameters:
+#       buffer  : The contents of the file, as bytes.
+#       type    : Type of file.
+#       encoding: The encoding of the file.
+#
+#   Returns:
+#       A dict of variable name to a tuple of:
+#           - The value, as a string.
+#           - The (start, end) byte offsets of the value in the buffer.
 #
 #   Description:
-#       Strips the line of comments, and leading and trailing whitespace. Then
-#       searches the line for the pattern '#define[ \t]+variable'. Then value
-#       after the variable is read, stripped of leading and trailing
-#       whitespace. If "number" is asserted, then the characters in
-#       ignore_for_numbers will be removed from the value, then cast to an int.
+#       Scans the file once, so each variable can then be looked up without
+#       searching the file again. Function-like macros and variables without
+#       a value are left out.
 # *****************************************************************************
-def read_variable_pound_define(variable, line, number=False):
-    result = None
+def index_buffer(buffer, type="--define", encoding="utf-8"):
+    if (type == "--define"):
+        variables = scan_defines(buffer)
+    else:
+        variables = scan_doxygen(buffer, encoding)
 
-    # Remove all singleline streamed comments (/*COMMENT */) from string.
-    # https://stackoverflow.com/questions/2319019/using-regex-to-remove-comments-from-source-files
-    line = re.sub(re.compile(r'/\*.*?\*/', re.DOTALL), " ", line)
+    index = {}
+    for name, value, span, function_like in variables:
+        if (value and (not function_like) and (name not in index)):
+            index[name] = (value.decode(encoding), span)
 
-    r_xp = r'[ \t]*#define[ \t]+' + variable + r'[ \t]+.+'
+    return index
 
-    # Regex is used to match a valid line.
-    # Order:
-    #   [ \t]*      Match 0 or more characters of whitespace.
-    #   #define     Match the string "#define" exactly.
-    #   [ \t]+      Match 1 or more characters of whitespace.
-    #   variable    Match the string "variable" exactly.
-    #   [ \t]+      Match 1 or more characters of whitespace.
-    #   .+          Matches 1 or more characters.
 
-    if (re.match(r_xp, line)):
-        # Remove all occurrences of the start of streamed comments (/*COMMENT)
-        # or single-line comments (//COMMENT).
-        line = re.sub(re.compile(r'/[\*/].*', re.DOTALL), " ", line)
-        line = re.sub(re.compile(r'#define[ \t]+' + variable), "", line)
+# *****************************************************************************
+# load_file
+#   Parameters:
+#       filename: The file to load.
+#       type    : Type of file.
+#       cache   : A dict of the files loaded before, or None.
+#
+#   Returns:
+#       A tuple of the contents of the file as bytes, its encoding, and its
+#       index (see index_buffer).
+#
+#   Description:
+#       Without a cache, the file is read and indexed. With one, the index of
+#       a file loaded before is used again if the file's modification time and
+#       size haven't changed. A file modified less than
+#       file_times.MTIME_RESOLUTION_NS before it was read is read again
+#       anyway, and its index only used again if the contents are the same.
+# *****************************************************************************
+def load_file(filename, type="--define", cache=None):
+    if (cache is None):
+        buffer, encoding = read_buffer(filename)
+        return buffer, encoding, index_buffer(buffer, type, encoding)
+
+    key = (os.path.realpath(filename), type)
+    # Stat before reading, so a change made while reading shows up as a
+    # change next time.
+    stat = os.stat(filename)
+    state = (stat.st_mtime_ns, stat.st_size)
+    read_ns = time.time_ns() if hasattr(time, "time_ns") \
+        else int(time.time() * 1e9)
+
+    entry = cache.get(key)
+    if (entry and (entry[0] == state) and
+            ((entry[1] - state[0]) >= file_times.MTIME_RESOLUTION_NS)):
+        return entry[2], entry[3], entry[4]
+
+    buffer, encoding = read_buffer(filename)
+    if (entry and (entry[2] == buffer)):
+        index = entry[4]
+    else:
+        index = index_buffer(buffer, type, encoding)
+    cache[key] = (state, read_ns, buffer, encoding, index)
+    return buffer, encoding, index
 
-        line = line.strip()
-        if (number):
-            for char in ignore_for_numbers:
-                line = line.replace(char, "")
-
-            line = line.strip()
-
-            if (len(line) > 0):
-                start = line[0]
-
-                if (start == '-'):
-                    line = line[1:]
-                else:
-                    start = ""
-
-                # If octal, insert the 'o' character so Python 3 can recognize
-                # it.
-                if (len(line) >= 2 and line[0] == '0' and line[1] != 'x'):
-                    line = line[0] + 'o' + line[1:]
-
-                line = start + line
-                try:
-                    line = int(line.strip(), 0)
-                # If value error, just use the string.
-                except ValueError:
-                    if (len(line) >= 3 and line[1] == 'o'):
-                        line = line[0] + line[2:]
-                    stderr_out("Python Error: Value error occurred.\n", False)
-
-        if (line == ""):
-            result = None
-        else:
-            result = line
 
-    return result
+# *****************************************************************************
+# indexed_value
+#   Parameters:
+#       entry : An entry from index_buffer, or None.
+#       number: A boolean asserting whether the value should be read as an
+#               integer (C or H files only).
+#       type  : Type of file.
+#
+#   Returns:
+#       The value of the entry, or None if there is no entry.
+# *****************************************************************************
+def indexed_value(entry, number=False, type="--define"):
+    if (entry is None):
+        return None
+    if (number and (type == "--define")):
+        return convert_number(entry[0])
+    return entry[0]
 
 
 # *****************************************************************************
@@ -254,24 +686,12 @@ def read_variable_pound_define(variable, line, number=False):
 #       On failure, None is returned.
 #
 #   Description:
-#       Runs read_variable on all lines in the given file. On the first
-#       occurrence of the given #define variable, the value is returned.
+#       Returns the value of the first occurrence of the given variable.
 # *****************************************************************************
 def read_variable_from_file(variable, filename, number=False, type="--define"):
-    with open(filename) as f:
-        content = f.readlines()
-    f.close()
-
-    value_read = None
-    first_occurrence = False
-    ix = 0
-    while ((not first_occurrence) and (ix < len(content))):
-        value = read_variable(variable, content[ix], number, type)
-        if (value is not None):
-            first_occurrence = True
-            value_read = value
-        ix += 1
-    return value_read
+    buffer, encoding = read_buffer(filename)
+    return indexed_value(index_buffer(buffer, type, encoding).get(variable),
+                         number, type)
 
 
 # *****************************************************************************
@@ -287,15 +707,20 @@ def read_variable_from_file(variable, filename, number=False, type="--define"):
 #       success.
 #
 #   Description:
-#       For the given line, check whether the variable is in the line with
-#       read_variable(). If it is, replace it with the new value.
+#       For the given line, check whether the variable is in the line. If it
+#       is, replace its value with the new value, at the position of the value
+#       (so text elsewhere in the line that matches the value is left alone).
 # *****************************************************************************
 def write_variable(variable, new_value, line, type="--define"):
-    value = read_variable(variable, line, False, type)
+    if (type == "--define"):
+        parsed = parse_pound_define(line)
+    else:
+        parsed = parse_doxygen(line)
 
     new_line = None
-    if (value):
-        new_line = line.replace(" " + value, " " + new_value)
+    if (parsed and (parsed[0] == variable)):
+        start, end = parsed[2]
+        new_line = line[:start] + new_value + line[end:]
 
     return new_line
 
@@ -313,33 +738,12 @@ def write_variable(variable, new_value, line, type="--define"):
 #       False, if the variable was not found.
 #
 #   Description:
-#       Runs write_variable on all lines in the given file. On the first
-#       occurrence of the given #define variable, the value is replaced.
+#       Replaces the value of the first occurrence of the given variable.
 # *****************************************************************************
 def write_variable_to_file(variable, new_value, filename, type="--define"):
-    if (not find_variable_in_file(variable, filename, type)):
-        return False
-
-    with open(filename) as f:
-        content = f.readlines()
-    f.close()
-
-    new_content = ""
-    first_occurrence = True
-    for line in content:
-        new_line = write_variable(variable, new_value, line, type)
-
-        if (first_occurrence and new_line):
-            new_content += new_line
-            first_occurrence = False
-        else:
-            new_content += line
-
-    with open(filename, 'w') as f:
-        f.write(new_content)
-    f.close()
-
-    return (not first_occurrence)
+    values, missing = apply_operations([("--write", variable, new_value)],
+                                       filename, False, type)
+    return (not missing)
 
 
 # *****************************************************************************
@@ -350,25 +754,122 @@ def write_variable_to_file(variable, new_value, filename, type="--define"):
 #       type    :  Type of file to check.
 #
 #   Description:
-#       Runs read_variable on all lines in the given file. On the first
-#       occurrence found of the #define variable, True is returned. Else,
-#       False is returned.
+#       Returns True if the variable occurs in the file. Else, False is
+#       returned.
 # *****************************************************************************
 def find_variable_in_file(variable, filename, type="--define"):
-    with open(filename) as f:
-        content = f.readlines()
+    buffer, encoding = read_buffer(filename)
+    return (variable in index_buffer(buffer, type, encoding))
+
+
+# *****************************************************************************
+# apply_operations
+#   Parameters:
+#       operations: The operations to apply, in order. Each is either
+#                   ("--read", variable) or ("--write", variable, new_value).
+#       filename  : The filename where the variables reside.
+#       number    : A boolean asserting whether values read should be read as
+#                   integers.
+#       type      : Type of file.
+#       cache     : A dict of the files loaded before (see load_file), or
+#                   None.
+#
+#   Returns:
+#       A tuple of:
+#           - A list of the value read by each read operation (None for a
+#             variable that was not found).
+#           - A list of the variables of write operations that were not
+#             found.
+#
+#   Description:
+#       Reads and indexes the file once, and applies every operation to the
+#       index. A read returns the value written by any write before it. The
+#       new values are then put in place of the old ones at their byte
+#       offsets, and the file is replaced once. The file is left as it is if
+#       any write fails.
+# *****************************************************************************
+def apply_operations(operations, filename, number=False, type="--define",
+                     cache=None):
+    buffer, encoding, index = load_file(filename, type, cache)
+
+    values = []
+    missing = []
+    # The new value of each value span written, by span.
+    new_values = {}
+    # The entries of the variables written, which a cached index mustn't see.
+    written = {}
+    for operation in operations:
+        entry = written.get(operation[1]) or index.get(operation[1])
+        if (operation[0] == "--read"):
+            values.append(indexed_value(entry, number, type))
+        elif (entry is None):
+            missing.append(operation[1])
+        else:
+            new_values[entry[1]] = operation[2].encode(encoding)
+            written[operation[1]] = (operation[2].strip(), entry[1])
+
+    if (new_values and (not missing)):
+        if (cache is not None):
+            cache.pop((os.path.realpath(filename), type), None)
+        replace_file(filename, splice_buffer(buffer, new_values))
 
-    found = False
-    ix = 0
+    return values, missing
 
-    while ((ix < len(content)) and (not found)):
-        line = content[ix]
-        ix += 1
-        if (read_variable(variable, line, False, type)):
-            found = True
 
-    f.close()
-    return found
+# *****************************************************************************
+# splice_buffer
+#   Parameters:
+#       buffer    : The contents of the file, as bytes.
+#       new_values: A dict of (start, end) byte offsets in the buffer to the
+#                   bytes that replace them. The spans must not overlap.
+#
+#   Returns:
+#       A list of the pieces of the new contents, in order. The parts of the
+#       buffer that are kept are views of it, so they aren't copied.
+# *****************************************************************************
+def splice_buffer(buffer, new_values):
+    view = memoryview(buffer)
+    pieces = []
+    offset = 0
+    for (start, end) in sorted(new_values):
+        pieces.append(view[offset:start])
+        pieces.append(new_values[(start, end)])
+        offset = end
+    pieces.append(view[offset:])
+    return pieces
+
+
+# *****************************************************************************
+# replace_file
+#   Parameters:
+#       filename: The file to replace.
+#       pieces  : The new contents of the file, as a list of bytes-like
+#                 objects.
+#
+#   Description:
+#       Writes the new contents to a temporary file in the same directory,
+#       then renames it over the file. A rename within a directory is atomic,
+#       so if the write is interrupted (a build that is killed, a full disk)
+#       the file is left as it was rather than truncated. The temporary file
+#       gets the permissions of the file it replaces. A link is followed, so
+#       the file it points to is replaced rather than the link.
+# *****************************************************************************
+def replace_file(filename, pieces):
+    filename = os.path.realpath(filename)
+    handle, temp_filename = tempfile.mkstemp(
+        prefix=os.path.basename(filename) + ".", suffix=".tmp",
+        dir=os.path.dirname(filename))
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            f.writelines(pieces)
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(filename, temp_filename)
+        os.replace(temp_filename, filename)
+    except BaseException:
+        if (os.path.exists(temp_filename)):
+            os.remove(temp_filename)
+        raise
 
 
 # *****************************************************************************
@@ -395,36 +896,28 @@ def read_operation(param, filename, number, type):
 
 
 # *****************************************************************************
-#   ENTRY POINT
-# *****************************************************************************
-
-# *****************************************************************************
-# To be used with env.bat.
+# main
+#   Parameters:
+#       argv : The command line, laid out as described under ENTRY POINT
+#              below (argv[0] is the script).
+#       cache: A dict kept between calls, to hold the files already indexed
+#              (see load_file), or None to read every file afresh.
 #
-# Assumptions:
-#    - The first argument is the filename.
-#    - The second argument is '--read' or '--write'.
-#    - The third argument is the type. It must match one of the types in
-#      the type_options list.
-#    - The fourth argument is '--string' or '--not_string'.
-#    - The fifth argument is:
-#           if "--read" asserted:
-#               Then it is the variable to read from the file.
-#           if "--write" asserted:
-#               Then it is the pair FOO=BAR, where FOO is the variable in the
-#               file, and BAR is the value to write to the variable.
+#   Description:
+#       Carries out the command line. Values read are printed, and errors
+#       exit through stderr_out (or sys.exit) with error level -1.
 # *****************************************************************************
-if (__name__ == '__main__'):
+def main(argv, cache=None):
     TOTAL_ARGS = 6
 
-    if (len(sys.argv) >= TOTAL_ARGS):
+    if (len(argv) >= TOTAL_ARGS):
 
         r_w = False  # The read/write flag; True = read, False = write.
         number = False
 
-        filename = sys.argv[1]
-        read_write = sys.argv[2]
-        type = sys.argv[3]
+        filename = argv[1]
+        read_write = argv[2]
+        type = argv[3]
 
         # Check second argument for read/write.
         if (read_write == "--read"):
@@ -441,32 +934,38 @@ if (__name__ == '__main__'):
             stderr_out(message)
 
         # Check fourth argument for "--string" or "--not_string".
-        if ('--string' == sys.argv[4]):
+        if ('--string' == argv[4]):
             number = False
-        elif ('--not_string' == sys.argv[4]):
+        elif ('--not_string' == argv[4]):
             number = True
         else:
             message = "Python Error: --[not_]string not specified"
-            message += "in arg 4: {}.".format(sys.argv[4])
+            message += "in arg 4: {}.".format(argv[4])
             stderr_out(message)
 
-        # Fifth argument is the variable to read, or variable=value to write.
-        param = sys.argv[5]
-
-        # ********************************************************************
-        # Read operation.
-        if (r_w):
-            if (read_operation(param, filename, number, type)):
-                sys.exit(0)  # Exit successfully.
-            else:
-                message = "Python Error: Variable {} not found in {}."
-                stderr_out(message.format(param, filename))
-
-        # ********************************************************************
-        # Write operation.
-        if (not r_w):
-            if ('=' in param):
-                pair = param.split('=')
+        # The fifth argument onwards are the variables to read, or the
+        # variable=value pairs to write.
+        operations = []
+        env_names = []
+        for param in argv[5:]:
+            if (param == "--read"):
+                r_w = True
+            elif (param == "--write"):
+                r_w = False
+
+            # ****************************************************************
+            # Read operation.
+            elif (r_w):
+                env_name = None
+                if ('=' in param):
+                    env_name, param = param.split('=', 1)
+                operations.append(("--read", param))
+                env_names.append(env_name)
+
+            # ****************************************************************
+            # Write operation.
+            elif ('=' in param):
+                pair = param.split('=', 1)
                 value = pair[1]
 
                 # According to doxygen documentation, "Values that contain
@@ -478,13 +977,69 @@ if (__name__ == '__main__'):
                    (value[0] != r'"') and (value[-1] != r'"')):
 
                     pair[1] = "\"{}\"".format(pair[1])
+                operations.append(("--write", pair[0], pair[1]))
             else:
                 message = "Python Error: Invalid argument: {}."
                 stderr_out(message.format(str(param)))
 
-            if (not write_variable_to_file(pair[0], pair[1], filename, type)):
-                message = "Python Error: Variable\"{}\" not found in {}."
-                stderr_out(message.format(pair[0], filename))
+        values, missing = apply_operations(operations, filename, number, type,
+                                           cache)
+
+        failed = False
+        for variable in missing:
+            message = "Python Error: Variable\"{}\" not found in {}."
+            stderr_out(message.format(variable, filename), False)
+            failed = True
+
+        reads = [op for op in operations if op[0] == "--read"]
+        for operation, value in zip(reads, values):
+            if ((value is None) or (value == "")):
+                message = "Python Error: Variable {} not found in {}."
+                stderr_out(message.format(operation[1], filename), False)
+                failed = True
+
+        if (failed):
+            sys.exit(-1)
+
+        for env_name, value in zip(env_names, values):
+            if (env_name is None):
+                print(value)
+            else:
+                print("set \"{}={}\"".format(env_name, value))
     else:
         message = "Python error: Expected {} arguments, got {}."
-        stderr_out(message.format(TOTAL_ARGS, str(len(sys.argv))))
+        stderr_out(message.format(TOTAL_ARGS, str(len(argv))))
+
+
+# *****************************************************************************
+#   ENTRY POINT
+# *****************************************************************************
+
+# *****************************************************************************
+# To be used with env.bat.
+#
+# Assumptions:
+#    - The first argument is the filename.
+#    - The second argument is '--read' or '--write'.
+#    - The third argument is the type. It must match one of the types in
+#      the type_options list.
+#    - The fourth argument is '--string' or '--not_string'.
+#    - The fifth and following arguments are:
+#           if "--read" asserted:
+#               Then it is the variable to read from the file, and its value
+#               is printed. If it is ENV=VARIABLE, then "set "ENV=value"" is
+#               printed instead, so the output can be run as a batch file to
+#               set all the variables read at once.
+#           if "--write" asserted:
+#               Then it is the pair FOO=BAR, where FOO is the variable in the
+#               file, and BAR is the value to write to the variable.
+#      A '--read' or '--write' among them switches the operation for the
+#      arguments that follow, for example:
+#           version.h --read --define --not_string MAJOR=VERSION_MAJOR
+#               --write VERSION_BUILD=12 --read BUILD=VERSION_BUILD
+#
+# The file is read and written once, however many variables there are. If
+# any variable to write is not found, the file is not written.
+# *****************************************************************************
+if (__name__ == '__main__'):
+    main(sys.argv)
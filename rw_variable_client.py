@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   A small client for rw_variable_server.py. It takes the same command line as rw_variable.py, sends it to the server and prints what the server
+#   sends back, so a value read from a file that the server has already indexed costs a connection instead of an interpreter starting up and
+#   scanning the file. Only the standard library modules it needs are imported, so it can be run with "py -3 -S" to start faster still.
+#
+#   The server is found on the local port given by the RW_VARIABLE_PORT environment variable (or DEFAULT_PORT). If no server answers, the
+#   command line is carried out by rw_variable.py in this process instead, so the result is the same either way.
+#
+#   Usage: python rw_variable_client.py filename {--read|--write} type {--string|--not_string} FOO1=BAR1 ...
+#          python rw_variable_client.py --stop
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-014
+#     - Created.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import json
+import os
+import socket
+import sys
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+# The server only listens on the loopback interface.
+HOST = "127.0.0.1"
+DEFAULT_PORT = 47631
+PORT_VARIABLE = "RW_VARIABLE_PORT"
+
+# Requests and responses are a single line of JSON each, in this encoding.
+ENCODING = "utf-8"
+
+# Seconds to wait for the server to accept a connection, and then to answer.
+CONNECT_TIMEOUT = 1.0
+RESPONSE_TIMEOUT = 60.0
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+
+# ***************************************************************************************************************************************************
+# get_port
+#   Returns the port the server listens on, from the RW_VARIABLE_PORT environment variable if it is set.
+# ***************************************************************************************************************************************************
+def get_port():
+    port = os.environ.get(PORT_VARIABLE, "").strip()
+    return int(port) if port else DEFAULT_PORT
+
+
+# ***************************************************************************************************************************************************
+# connect
+#   Returns a socket connected to the server, or None if no server answers.
+# ***************************************************************************************************************************************************
+def connect(port=None):
+    try:
+        connection = socket.create_connection((HOST, get_port() if port is None else port), CONNECT_TIMEOUT)
+    except OSError:
+        return None
+    connection.settimeout(RESPONSE_TIMEOUT)
+    return connection
+
+
+# ***************************************************************************************************************************************************
+# send_request
+#   Sends a request to the server over a connection, and returns its response.
+#
+#   Parameters:
+#       connection : A socket returned by connect(). It is closed when the response has been read.
+#       request    : A dict with either:
+#                      - "cwd" (the directory relative file names are from) and "args" (the rw_variable.py command line, without the script), or
+#                      - "stop", to stop the server.
+#
+#   Returns:
+#       A dict of "status" (the error level), "stdout" and "stderr".
+# ***************************************************************************************************************************************************
+def send_request(connection, request):
+    with connection:
+        connection.sendall((json.dumps(request) + "\n").encode(ENCODING))
+        with connection.makefile("rb") as response:
+            return json.loads(response.readline().decode(ENCODING))
+
+
+# ***************************************************************************************************************************************************
+# run_locally
+#   Carries out an rw_variable.py command line in this process, for when there is no server.
+# ***************************************************************************************************************************************************
+def run_locally(args):
+    import rw_variable
+    rw_variable.main([rw_variable.__file__] + args)
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = sys.argv[1:]
+    connection = connect()
+
+    if (args == ["--stop"]):
+        if (connection is not None):
+            send_request(connection, {"stop": True})
+        sys.exit(0)
+
+    if (connection is None):
+        run_locally(args)
+        sys.exit(0)
+
+    response = send_request(connection, {"cwd": os.getcwd(), "args": args})
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["status"])
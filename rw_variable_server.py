@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Keeps rw_variable.py loaded between calls, so a build that reads and writes version numbers many times (env.bat is called by
+#   update_versions.bat, update_versions_helper.bat, tag_build.bat, ...) only pays for starting Python once. rw_variable_client.py sends each
+#   command line to it over a local socket. The server keeps the index of every file it has read, and uses it again until the file's
+#   modification time or size changes (see rw_variable.load_file).
+#
+#   Requests are handled one at a time, so two writes to the same file can't interleave. Only files under --root can be read or written, as any
+#   local process can connect to the port.
+#
+#   For example, at the start of a build:
+#       start "" /b py -3 rw_variable_server.py --root %WORKSPACE%
+#       set RW_VARIABLE_PORT=47631
+#   env.bat then uses rw_variable_client.py, and at the end of the build:
+#       py -3 rw_variable_client.py --stop
+#
+#   Usage: python rw_variable_server.py [--port N] [--root DIRECTORY]
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-014
+#     - Created.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+import contextlib
+import io
+import json
+import os
+import socketserver
+import sys
+import threading
+import traceback
+
+import rw_variable
+import rw_variable_client
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# Handles one request from rw_variable_client.py.
+class RequestHandler(socketserver.StreamRequestHandler):
+
+    # ***********************************************************************************************************************************************
+    # Reads the request line, and writes the response line.
+    # ***********************************************************************************************************************************************
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode(rw_variable_client.ENCODING))
+        except ValueError:
+            request = None
+
+        if not isinstance(request, dict):
+            response = {"status": -1, "stdout": "", "stderr": "Python Error: Invalid request.\n"}
+        elif request.get("stop"):
+            response = {"status": 0, "stdout": "", "stderr": ""}
+            # shutdown() waits for serve_forever() to return, which it can't do until this request is handled.
+            threading.Thread(target=self.server.shutdown).start()
+        else:
+            response = run_request(request.get("args", []), request.get("cwd", ""), self.server.root, self.server.cache)
+
+        self.wfile.write((json.dumps(response) + "\n").encode(rw_variable_client.ENCODING))
+
+
+# A TCP server on the loopback interface that handles rw_variable.py command lines.
+class RwVariableServer(socketserver.TCPServer):
+    # Lets a restarted server listen on the port while the last one's connections are closing. On Windows the option would let another process
+    # listen on the same port too, and isn't needed there.
+    allow_reuse_address = (os.name != "nt")
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   port : The port to listen on (0 for any free port; see server_address).
+    #   root : The directory the files read and written must be in.
+    # ***********************************************************************************************************************************************
+    def __init__(self, port, root):
+        super().__init__((rw_variable_client.HOST, port), RequestHandler)
+        self.root = os.path.realpath(root)
+        # The files indexed so far, kept by rw_variable.load_file.
+        self.cache = {}
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# is_under
+#   Returns True if path is the directory root or in it.
+# ***************************************************************************************************************************************************
+def is_under(path, root):
+    path = os.path.normcase(os.path.realpath(path))
+    root = os.path.normcase(root)
+    try:
+        return os.path.commonpath([path, root]) == root
+    except ValueError:
+        # Paths on different drives.
+        return False
+
+
+# ***************************************************************************************************************************************************
+# exit_status
+#   Returns the error level of a SystemExit code, as sys.exit() would set it.
+# ***************************************************************************************************************************************************
+def exit_status(code):
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write("{}\n".format(code))
+    return 1
+
+
+# ***************************************************************************************************************************************************
+# run_request
+#   Carries out an rw_variable.py command line.
+#
+#   Parameters:
+#       args  : The command line, without the script.
+#       cwd   : The directory of the client, which the command line is run in.
+#       root  : The directory the file must be in.
+#       cache : The files already indexed.
+#
+#   Returns:
+#       A response dict of "status" (the error level), "stdout" and "stderr", as rw_variable.py would have exited with and printed.
+# ***************************************************************************************************************************************************
+def run_request(args, cwd, root, cache):
+    argv = [rw_variable.__file__] + [str(arg) for arg in args]
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    status = 0
+
+    # Requests are handled one at a time, so the server can run each in the client's directory. File names and messages are then just as
+    # rw_variable.py would have them.
+    server_cwd = os.getcwd()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            os.chdir(cwd or server_cwd)
+            if (len(argv) > 1) and not is_under(argv[1], root):
+                sys.stderr.write("Python Error: {} is not under {}.\n".format(argv[1], root))
+                status = -1
+            else:
+                rw_variable.main(argv, cache)
+        except SystemExit as error:
+            status = exit_status(error.code)
+        except Exception:
+            traceback.print_exc()
+            status = 1
+        finally:
+            os.chdir(server_cwd)
+
+    return {"status": status, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Serves rw_variable.py command lines sent by rw_variable_client.py.")
+    parser.add_argument("--port", "-p", type=int, default=rw_variable_client.get_port(),
+                        help="The local port to listen on (Default = %%{}%% or {}).".format(rw_variable_client.PORT_VARIABLE,
+                                                                                           rw_variable_client.DEFAULT_PORT))
+    parser.add_argument("--root", "-r", default=os.getcwd(),
+                        help="Only files in this directory can be read or written (Default = the current directory).")
+    return parser.parse_args(args)
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    server = RwVariableServer(args.port, args.root)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
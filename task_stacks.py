@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Prints the stack budget of the RTOS tasks listed in task_names.csv. Each row of the CSV names a task, the macro that sets its stack size and the
+#   source file that defines the macro:
+#
+#     fast_task,FAST_TASK_STACK_SIZE,MainTc1.c
+#
+#   The source files are found by name under the --source directories. Each file is read and its #defines indexed once, however many tasks it
+#   holds, and the files are read in parallel. Stack sizes that are expressions of other macros, such as (BASE_STACK_SIZE * 2U), are evaluated;
+#   a macro is looked up in the task's own file first, then in the other task files and then in the --header files.
+#
+#   Usage: python task_stacks.py [task_names.csv] [-s source_dir ...] [-H header.h ...] [-o stacks.csv] [-b budget]
+#
+#   Exits with error level -1 if a file can't be found or read, a stack size can't be evaluated, or the total is over --budget.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-015
+#     - Created.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import os
+import sys
+
+import c_expression
+import rw_variable
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+DEFAULT_TASK_FILE = "task_names.csv"
+
+TABLE_HEADINGS = ["Task", "Macro", "File", "Stack size", "Expression"]
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# One row of the task file, and the stack size found for it.
+class Task:
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   name      : The name of the task.
+    #   macro     : The macro that sets its stack size.
+    #   file_name : The name of the file that defines the macro.
+    # ***********************************************************************************************************************************************
+    def __init__(self, name, macro, file_name):
+        self.name = name
+        self.macro = macro
+        self.file_name = file_name
+        # The text of the macro's value, as it is in the file.
+        self.expression = None
+        # The stack size, or None if it couldn't be evaluated.
+        self.size = None
+        # Why the stack size couldn't be evaluated.
+        self.error = None
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# read_tasks
+#   Returns the tasks in a task file as a list of Task. Blank rows are skipped.
+# ***************************************************************************************************************************************************
+def read_tasks(file_name):
+    tasks = []
+    with open(file_name, newline="") as file:
+        for row in csv.reader(file):
+            row = [field.strip() for field in row]
+            if not any(row):
+                continue
+            if len(row) < 3:
+                stderr_out("Python Error: Expected task,macro,file in {}: {}".format(file_name, ",".join(row)), True)
+            tasks.append(Task(row[0], row[1], row[2]))
+    return tasks
+
+
+# ***************************************************************************************************************************************************
+# find_files
+#   Finds files by name under a list of directories.
+#
+#   Parameters:
+#       names       : The file names to find. A name that is already a path to a file is used as it is.
+#       directories : The directories to search, including their subdirectories.
+#
+#   Returns:
+#       A dict of file name to its path. Names that weren't found are left out. If a name is found more than once, the first one found is used and
+#       the others are reported.
+# ***************************************************************************************************************************************************
+def find_files(names, directories):
+    paths = {}
+    wanted = set()
+    for name in names:
+        if os.path.isfile(name):
+            paths[name] = name
+        else:
+            wanted.add(os.path.basename(name))
+
+    found = {}
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for file in sorted(wanted.intersection(files)):
+                path = os.path.join(root, file)
+                if file in found:
+                    stderr_out("Warning: Found {} more than once, using {} and not {}".format(file, found[file], path))
+                else:
+                    found[file] = path
+
+    for name in names:
+        if (name not in paths) and (os.path.basename(name) in found):
+            paths[name] = found[os.path.basename(name)]
+    return paths
+
+
+# ***************************************************************************************************************************************************
+# index_files
+#   Reads and indexes the #defines of each file, in parallel.
+#
+#   Parameters:
+#       paths : The files to index.
+#       jobs  : The maximum number of files to read at once.
+#
+#   Returns:
+#       A dict of path to its index (see rw_variable.index_buffer). Files that couldn't be read are reported and left out.
+# ***************************************************************************************************************************************************
+def index_files(paths, jobs):
+    def index_file(path):
+        try:
+            return rw_variable.load_file(path, "--define")[2]
+        except OSError as error:
+            stderr_out("Python Error: Couldn't read {}: {}".format(path, error))
+            return None
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        indexes = dict(zip(paths, pool.map(index_file, paths)))
+    return {path: index for path, index in indexes.items() if index is not None}
+
+
+# ***************************************************************************************************************************************************
+# make_evaluator
+#   Returns a c_expression.MacroEvaluator that looks a macro up in each of a list of indexes in turn, and uses the first definition found.
+# ***************************************************************************************************************************************************
+def make_evaluator(indexes):
+    def lookup_text(name):
+        for index in indexes:
+            if name in index:
+                return index[name][0]
+        return None
+
+    return c_expression.MacroEvaluator(lookup_text)
+
+
+# ***************************************************************************************************************************************************
+# resolve_tasks
+#   Sets the expression and stack size of each task, or its error.
+#
+#   Parameters:
+#       tasks         : A list of Task.
+#       paths         : A dict of task file name to its path.
+#       indexes       : A dict of path to its index.
+#       header_paths  : The paths of the --header files, in the order they are searched.
+# ***************************************************************************************************************************************************
+def resolve_tasks(tasks, paths, indexes, header_paths):
+    task_paths = sorted(set(path for path in paths.values() if path in indexes))
+    header_indexes = [indexes[path] for path in header_paths if path in indexes]
+
+    # One evaluator per file, so the values worked out for one task are used again by the other tasks in the same file.
+    evaluators = {}
+    for task in tasks:
+        path = paths.get(task.file_name)
+        if path is None:
+            task.error = "Couldn't find {}".format(task.file_name)
+            continue
+        if path not in indexes:
+            task.error = "Couldn't read {}".format(path)
+            continue
+
+        entry = indexes[path].get(task.macro)
+        if entry is None:
+            task.error = "{} is not defined in {}".format(task.macro, path)
+            continue
+        # Continued lines are shown on one line.
+        task.expression = " ".join(entry[0].split())
+
+        if path not in evaluators:
+            search = [indexes[path]] + [indexes[other] for other in task_paths if other != path] + header_indexes
+            evaluators[path] = make_evaluator(search)
+        try:
+            task.size = evaluators[path].value(task.macro)
+        except ValueError as error:
+            task.error = str(error)
+
+
+# ***************************************************************************************************************************************************
+# table_rows
+#   Returns the rows of the stack budget table, not including the headings, ending with the total.
+# ***************************************************************************************************************************************************
+def table_rows(tasks):
+    rows = []
+    for task in tasks:
+        size = "?" if task.size is None else str(task.size)
+        rows.append([task.name, task.macro, task.file_name, size, task.expression or ""])
+    total = sum(task.size for task in tasks if task.size is not None)
+    rows.append(["Total", "", "", str(total), ""])
+    return rows
+
+
+# ***************************************************************************************************************************************************
+# print_table
+#   Prints rows as a table with aligned columns. The stack size column is aligned to the right.
+# ***************************************************************************************************************************************************
+def print_table(headings, rows):
+    widths = [max(len(row[column]) for row in [headings] + rows) for column in range(len(headings))]
+    size_column = headings.index("Stack size")
+
+    def format_row(row):
+        cells = []
+        for column, cell in enumerate(row):
+            if column == size_column:
+                cells.append(cell.rjust(widths[column]))
+            else:
+                cells.append(cell.ljust(widths[column]))
+        return "  ".join(cells).rstrip()
+
+    print(format_row(headings))
+    print("  ".join("-" * width for width in widths))
+    for row in rows[:-1]:
+        print(format_row(row))
+    print("  ".join("-" * width for width in widths))
+    print(format_row(rows[-1]))
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Prints the stack size of each RTOS task in a task file, and their total.")
+    parser.add_argument("tasks", nargs="?", default=DEFAULT_TASK_FILE,
+                        help="The task file, with task,macro,file on each line (Default = {}).".format(DEFAULT_TASK_FILE))
+    parser.add_argument("--source", "-s", action="append", default=None,
+                        help="A directory to search for the files named in the task file, including its subdirectories. May be given more "
+                             "than once (Default = the current directory).")
+    parser.add_argument("--header", "-H", action="append", default=[],
+                        help="A file to look up macros in that aren't defined in the task files, such as a configuration header. May be given "
+                             "more than once; they are searched in order.")
+    parser.add_argument("--output", "-o", default=None, help="Also write the table to this CSV file.")
+    parser.add_argument("--budget", "-b", type=lambda text: int(text, 0), default=None,
+                        help="Exit with an error if the total of the stack sizes is more than this.")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="The maximum number of files to read at once (Default = number of CPU cores).")
+    args = parser.parse_args(args)
+
+    if args.source is None:
+        args.source = ["."]
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if not os.path.isfile(args.tasks):
+        parser.error("Couldn't find {}".format(args.tasks))
+    for header in args.header:
+        if not os.path.isfile(header):
+            parser.error("Couldn't find {}".format(header))
+    return args
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    tasks = read_tasks(args.tasks)
+    file_names = sorted(set(task.file_name for task in tasks))
+    paths = find_files(file_names, args.source)
+
+    # Each file is only read once, however many tasks are in it or however many times it is given.
+    to_read = sorted(set(paths.values()))
+    to_read += [header for header in args.header if header not in to_read]
+    indexes = index_files(to_read, args.jobs)
+
+    resolve_tasks(tasks, paths, indexes, args.header)
+
+    rows = table_rows(tasks)
+    print_table(TABLE_HEADINGS, rows)
+
+    if args.output is not None:
+        with open(args.output, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(TABLE_HEADINGS)
+            writer.writerows(rows)
+
+    failed = False
+    for task in tasks:
+        if task.error is not None:
+            stderr_out("Python Error: {} ({}): {}".format(task.name, task.macro, task.error))
+            failed = True
+
+    total = sum(task.size for task in tasks if task.size is not None)
+    if (args.budget is not None) and (total > args.budget):
+        stderr_out("Python Error: The total stack size {} is over the budget of {}".format(total, args.budget))
+        failed = True
+
+    if failed:
+        sys.exit(-1)
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+# ***************************************************************************************************************************************************
+# COPYRIGHT NOTICE
+#
+# Copyright (c) 2026 by Parker-Hannifin Corporation
+# All rights reserved.
+#
+# No part of this work may be reproduced, published, or distributed in any form or by any means (electronically, mechanically, photocopying,
+# recording or otherwise), or stored in a database or retrieval system, without the prior written permission of Parker-Hannifin Corporation in each
+# instance.
+#
+#
+# Coding Standard(s):
+#   - 983F30.01A - Parker WPG Python Coding Standard
+#
+# Description:
+#   Lints a file list for several variants, linting each module only once for all the variants it is the same in. For example:
+#
+#   Usage: python variant_plan.py files.lnt -v project_specific.lnt,GVI075.lnt -v project_specific.lnt,GVI250.lnt --lint lint-nt
+#
+#   writes lint_all_output_GVI075.txt and lint_all_output_GVI250.txt. Each --variant names the .lnt files lint is run with for a variant, and the
+#   variant is named after the last of them (or given a name, as in -v GVI=project_specific.lnt,GVI075.lnt). Everything after --lint is the
+#   lint command; the .lnt files of the variant and a file listing the modules to lint are appended to it.
+#
+#   A module is the same in two variants when lint is given the same input for it in both:
+#     - The same options, apart from the -i, -d and -u options.
+#     - The same files, found through the -i directories of each variant (see include_graph.py).
+#     - The same value, or lack of one, for every define that either variant sets and whose name appears anywhere in those files.
+#   Each group of variants a module is the same in is linted once, with the .lnt files of the first variant of the group, and its "--- Module:"
+#   section is written to the output of every variant in the group. Most modules only depend on a few of the -d_t_indy_* defines, so the
+#   number of modules linted grows with the number of different configurations rather than with the number of variants.
+#
+#   The sections are kept in the --cache directory of lint_cache.py, so modules that haven't changed since the last run aren't linted again
+#   either. With --prune, modules with no code for a variant are left out of it (see conditional_compilation.py). With --plan, only the
+#   number of modules each variant would lint is printed.
+#
+#   Lint only sees the modules it is given, so the "--- Global Wrap-up" of each variant's output holds the messages of the run made with the
+#   variant's own .lnt files, which only covers the modules linted in that run. The wrap-up of a run of all the variant's modules is cached under
+#   their keys and its options (see lint_cache.py), and used whenever the variant's modules and options are the same again. A variant with
+#   nothing to lint and no cached wrap-up lints all its own modules for one. The wrap-up of a variant that only lints some of its modules and
+#   has none cached is written under a note saying how many of its modules it covers, and isn't cached.
+#
+# Input Documents:
+#   The following is a list of input documents that support this document. Input documents that change after release of this document may have an
+#   impact on this document.
+#     - None.
+#
+# History:
+#   2026-Oct-18 - Request user-025
+#     - Created.
+#   2026-Oct-18 - Request user-025
+#     - Cached the global wrap-up of each variant, and lint all of a variant's modules when it has nothing else to get one from.
+#   2026-Oct-18 - Request user-025
+#     - Only cache the global wrap-up of a run of all a variant's modules, and mark the wrap-up of a run of some of them as partial.
+#
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+#   IMPORTS
+# ***************************************************************************************************************************************************
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import ntpath
+import os
+import re
+import sys
+import time
+
+import conditional_compilation
+import include_graph
+import lint_cache
+import lnt_options
+import makeLintFileList
+import run_lint_shards
+
+# ***************************************************************************************************************************************************
+#   CONSTANTS
+# ***************************************************************************************************************************************************
+DEFAULT_OUTPUT_PATTERN = "lint_all_output_{}.txt"
+DEFAULT_MODULES_PATTERN = "lint_plan_{}.lnt"
+
+# The options that don't go into a module's key as they are: -i directories are replaced by the files found through them, and defines by the
+# values of the defines the module's files use.
+SEARCH_OR_DEFINE_OPTION = re.compile(r"-i|[-+]d|-u")
+
+NAME = re.compile(rb"[A-Za-z_]\w*")
+
+# ***************************************************************************************************************************************************
+#   CLASSES
+# ***************************************************************************************************************************************************
+
+
+# One variant: the .lnt files lint is run with for it, and what is known about them.
+class Variant:
+
+    def __init__(self, name, lnt_files):
+        self.name = name
+        self.lnt_files = lnt_files
+        self.configuration = lnt_options.resolve(lnt_files)
+        # The digest of the options that go into a module's key as they are.
+        digest = hashlib.sha1()
+        for text, _, _ in self.configuration.options:
+            if not SEARCH_OR_DEFINE_OPTION.match(text):
+                digest.update(text.encode("utf-8") + b"\n")
+        self.options_digest = digest.hexdigest()
+        # The modules of the file list for this variant, and the key of each.
+        self.units = []
+        self.keys = {}
+
+
+# Works out which variants each module is the same in.
+class VariantPlan:
+
+    # ***********************************************************************************************************************************************
+    # Parameters:
+    #   variants : The variants, as Variant objects.
+    #   units    : The modules of the file list.
+    #   command  : The lint command, without the .lnt files of a variant.
+    #   prune    : If asserted, modules with no code for a variant are left out of it.
+    #   jobs     : The maximum number of files to read at once.
+    # ***********************************************************************************************************************************************
+    def __init__(self, variants, units, command, prune, jobs):
+        self.variants = variants
+        # The names every variant may define. A define set by none of them is the same in all of them.
+        self.define_names = set()
+        for variant in variants:
+            self.define_names.update(variant.configuration.defines)
+        # File path to the names in it.
+        self.names = {}
+        # An include graph for each list of include directories, so variants with the same -i directories share one.
+        graphs = {}
+        sources = {}
+
+        for variant in variants:
+            directories = tuple(variant.configuration.includes)
+            if directories not in graphs:
+                graph = include_graph.IncludeGraph(None)
+                graph.update(units, directories, jobs)
+                graphs[directories] = (graph, graph.unit_digests(units))
+            graph, digests = graphs[directories]
+
+            evaluator = conditional_compilation.variant_evaluator(variant.lnt_files, sources) if prune else None
+            for unit in units:
+                if (evaluator is not None) and not evaluator.has_code(unit):
+                    continue
+                path = os.path.normpath(makeLintFileList.native_path(unit))
+                variant.units.append(unit)
+                variant.keys[unit] = lint_cache.module_key(path, digests[path], self.configuration_digest(variant, graph, path), command)
+
+    # ***********************************************************************************************************************************************
+    # Returns the digest of what a variant gives lint for a module, other than the files themselves: the options, and the values of the
+    # defines whose names appear in the module or the files it includes.
+    # ***********************************************************************************************************************************************
+    def configuration_digest(self, variant, graph, path):
+        used = set()
+        for reached in graph.reachable(path):
+            used.update(self.file_names(reached))
+
+        defines = variant.configuration.defines
+        relevant = self.define_names & used
+        # A define's value may use other defines.
+        pending = list(relevant)
+        while pending:
+            value = defines.get(pending.pop(), [""])[0]
+            for name in conditional_compilation.NAME.findall(value):
+                if (name in self.define_names) and (name not in relevant):
+                    relevant.add(name)
+                    pending.append(name)
+
+        digest = hashlib.sha1(variant.options_digest.encode("utf-8"))
+        for name in sorted(relevant):
+            if name in defines:
+                value, _, parameters = defines[name]
+                digest.update("{}{}={}\n".format(name, parameters or "", value).encode("utf-8"))
+            else:
+                digest.update("{}=<undefined>\n".format(name).encode("utf-8"))
+        return digest.hexdigest()
+
+    # ***********************************************************************************************************************************************
+    # Returns the set of names in a file, or an empty set if it can't be read. Names in comments are included, which can only make a module
+    # depend on more defines than it does.
+    # ***********************************************************************************************************************************************
+    def file_names(self, path):
+        names = self.names.get(path)
+        if names is None:
+            try:
+                with open(path, "rb") as file:
+                    names = {name.decode("latin-1") for name in NAME.findall(file.read())}
+            except OSError:
+                names = set()
+            self.names[path] = names
+        return names
+
+    # ***********************************************************************************************************************************************
+    # Returns the modules each variant has to lint, as a dict of variant name to the modules, in file list order. The variants named in full
+    # lint all their modules. Each other key is linted by the first variant that has it, unless it is in skip. A variant in full only takes keys
+    # from the variants after it, so the variants before it keep what they have to lint.
+    # ***********************************************************************************************************************************************
+    def assign(self, skip=(), full=()):
+        assigned = {}
+        seen = set(skip)
+        for variant in self.variants:
+            if variant.name in full:
+                assigned[variant.name] = list(variant.units)
+                seen.update(variant.keys.values())
+                continue
+            assigned[variant.name] = []
+            for unit in variant.units:
+                key = variant.keys[unit]
+                if key not in seen:
+                    seen.add(key)
+                    assigned[variant.name].append(unit)
+        return assigned
+
+
+# ***************************************************************************************************************************************************
+#   FUNCTIONS
+# ***************************************************************************************************************************************************
+
+# ***************************************************************************************************************************************************
+# stderr_out
+#   Parameters:
+#       message : String to print to stderr.
+#       exit    : If asserted, will exit with error level -1 (default False).
+#
+#   Returns:
+#       None.
+# ***************************************************************************************************************************************************
+def stderr_out(message, exit=False):
+    sys.stderr.write("{}\n".format(message))
+
+    if (exit):
+        sys.exit(-1)
+    return None
+
+
+# ***************************************************************************************************************************************************
+# parse_variant
+#   Parses an argument of --variant, "[NAME=]a.lnt,b.lnt", into a (name, [.lnt files]) tuple. The name defaults to that of the last .lnt file.
+# ***************************************************************************************************************************************************
+def parse_variant(text):
+    name, equals, files = text.partition("=")
+    if not equals:
+        name, files = "", text
+    lnt_files = [file_name for file_name in files.split(",") if file_name]
+    if not lnt_files:
+        raise argparse.ArgumentTypeError("expected [NAME=]a.lnt,b.lnt, not {}".format(text))
+    return name or ntpath.splitext(ntpath.basename(lnt_files[-1]))[0], lnt_files
+
+
+# ***************************************************************************************************************************************************
+# variant_output
+#   Returns the lint output of a variant, made from the cached section of each of its modules and its global wrap-up.
+#
+#   Parameters:
+#       cache   : The LintResultCache the sections are in.
+#       variant : The Variant.
+#       wrap_up : The global wrap-up lines, from the variant's own run or the cache, marked by lint_cache.partial_wrap_up() when they only
+#                 cover some of its modules.
+#       run     : The run_lint_shards.LintRunOutput of the variant's own run, or None.
+#
+#   Returns:
+#       The output text, and the modules whose sections weren't found.
+# ***************************************************************************************************************************************************
+def variant_output(cache, variant, wrap_up, run):
+    entries = []
+    missing = []
+    for unit in variant.units:
+        entry = cache.load(variant.keys[unit])
+        if entry is None:
+            missing.append(unit)
+        else:
+            entries.append(entry)
+
+    # Only the global wrap-up of the run is used; its module sections come from the cache like the others. The run's summary counts modules of
+    # other variants, so the messages are counted again.
+    newline = run.newline if run is not None else run_lint_shards.LintRunOutput("".join(cache.preamble)).newline
+    output = cache.output(entries, newline, wrap_up)
+    if run is not None:
+        output.preamble = run.preamble
+
+    # Lint writes the module paths made absolute.
+    order = [os.path.abspath(makeLintFileList.native_path(unit)) for unit in variant.units]
+    return run_lint_shards.merge_outputs([output], order), missing
+
+
+# ***************************************************************************************************************************************************
+# parse_args
+#   Parses an array of command line arguments.
+# ***************************************************************************************************************************************************
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Lints a file list for several variants, linting modules that are the same in several once.")
+    parser.add_argument("file_list", help="The file list written by makeLintFileList.py.")
+    parser.add_argument("--variant", "-v", type=parse_variant, action="append", required=True, metavar="[NAME=]a.lnt,b.lnt",
+                        help="The .lnt files lint is run with for a variant, separated by commas. May be given more than once.")
+    parser.add_argument("--output", "-o", default=DEFAULT_OUTPUT_PATTERN,
+                        help="The output file of each variant, {} being the variant name (Default = {}).".format(
+                            "{}", DEFAULT_OUTPUT_PATTERN))
+    parser.add_argument("--modules", default=DEFAULT_MODULES_PATTERN,
+                        help="The file the modules each variant lints are written to, {} being the variant name (Default = {}).".format(
+                            "{}", DEFAULT_MODULES_PATTERN))
+    parser.add_argument("--cache", "-c", default=lint_cache.DEFAULT_CACHE_DIRECTORY,
+                        help="The directory the module sections are cached in (Default = {}).".format(lint_cache.DEFAULT_CACHE_DIRECTORY))
+    parser.add_argument("--max_size", "-m", type=int, default=lint_cache.DEFAULT_MAX_SIZE_MB,
+                        help="The most the cached sections may take, in MB (Default = {}).".format(lint_cache.DEFAULT_MAX_SIZE_MB))
+    parser.add_argument("--prune", "-p", action="store_true", help="Leave out modules with no code for a variant.")
+    parser.add_argument("--plan", action="store_true", help="Only print how many modules each variant would lint.")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="The maximum number of lint processes to run, and files to read, at once (Default = number of CPU cores).")
+    parser.add_argument("--lint", nargs=argparse.REMAINDER, required=True,
+                        help="The lint command and its options, without the .lnt files of a variant. Must be the last option.")
+    args = parser.parse_args(args)
+
+    if not args.lint:
+        parser.error("--lint needs a command")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.max_size < 0:
+        parser.error("--max_size can't be negative")
+    names = [name for name, _ in args.variant]
+    if len(set(names)) != len(names):
+        parser.error("Every variant needs a different name")
+    for name in [args.file_list] + [lnt for _, lnt_files in args.variant for lnt in lnt_files]:
+        if not os.path.isfile(name):
+            parser.error("Couldn't find {}".format(name))
+    return args
+
+
+# ***************************************************************************************************************************************************
+#   ENTRY POINT
+# ***************************************************************************************************************************************************
+if (__name__ == '__main__'):
+    args = parse_args(sys.argv[1:])
+
+    variants = [Variant(name, lnt_files) for name, lnt_files in args.variant]
+    failed = False
+    for variant in variants:
+        for error in variant.configuration.errors:
+            stderr_out("Python Error: {}: {}".format(variant.name, error))
+            failed = True
+    if failed:
+        sys.exit(-1)
+
+    start = time.perf_counter()
+    units = run_lint_shards.read_file_list(args.file_list)
+    plan = VariantPlan(variants, units, args.lint, args.prune, args.jobs)
+    cache = lint_cache.LintResultCache(args.cache)
+    keys = {variant.keys[unit] for variant in variants for unit in variant.units}
+    cached = {key for key in keys if os.path.exists(cache.path(key))}
+    wrap_keys = {variant.name: lint_cache.wrap_up_key(variant.keys.values(), variant.configuration.digest()) for variant in variants}
+    # A variant with no modules has nothing to wrap up.
+    wrap_ups = {variant.name: cache.load_wrap_up(wrap_keys[variant.name]) if variant.units else [] for variant in variants}
+
+    # A variant left with nothing to lint gets its wrap-up from the cache, or else lints all its modules for one. Those modules then don't need
+    # linting by the other variants, which may leave another variant with nothing to lint.
+    full = set()
+    while True:
+        assigned = plan.assign(cached, full)
+        more = {variant.name for variant in variants
+                if (wrap_ups[variant.name] is None) and (not assigned[variant.name]) and (variant.name not in full)}
+        if not more:
+            break
+        full.update(more)
+
+    print("{} modules in {} variants: {} different, {} cached, {} to lint ({:.2f} s)".format(
+        sum(len(variant.units) for variant in variants), len(variants), len(keys), len(cached),
+        sum(len(modules) for modules in assigned.values()), time.perf_counter() - start))
+    for variant in variants:
+        print("  {}: {} modules, {} to lint{}".format(variant.name, len(variant.units), len(assigned[variant.name]),
+                                                      " (all, for the global wrap-up)" if variant.name in full else ""))
+    if args.plan:
+        sys.exit(0)
+
+    def lint(variant):
+        modules_file = args.modules.format(variant.name)
+        makeLintFileList.write_generated_file(modules_file, [unit + "\n" for unit in assigned[variant.name]])
+        return run_lint_shards.run_shard(args.lint + variant.lnt_files, modules_file)
+
+    to_run = [variant for variant in variants if assigned[variant.name]]
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = dict(zip([variant.name for variant in to_run], pool.map(lint, to_run)))
+
+    runs = {}
+    for variant in to_run:
+        text, seconds = results[variant.name]
+        if text is None:
+            stderr_out("Python Error: Lint failed to run for {}.".format(variant.name), True)
+        print("Linted {} modules for {} ({:.1f} s)".format(len(assigned[variant.name]), variant.name, seconds))
+        runs[variant.name] = run_lint_shards.LintRunOutput(text)
+        sections = {}
+        for path, lines in runs[variant.name].modules:
+            sections.setdefault(makeLintFileList.normalise_path(path), []).append(lines)
+        for unit in assigned[variant.name]:
+            linted = sections.get(makeLintFileList.normalise_path(os.path.abspath(makeLintFileList.native_path(unit))))
+            if linted is not None:
+                cache.store(variant.keys[unit], linted)
+        # Only a run of all the variant's modules gives their wrap-up; a cached one is kept over a partial one.
+        wrap_up = runs[variant.name].global_lines
+        if len(assigned[variant.name]) == len(variant.units):
+            wrap_ups[variant.name] = wrap_up
+            cache.store_wrap_up(wrap_keys[variant.name], wrap_up)
+        elif wrap_ups[variant.name] is None:
+            wrap_ups[variant.name] = lint_cache.partial_wrap_up(wrap_up, len(assigned[variant.name]), len(variant.units),
+                                                                runs[variant.name].newline)
+        cache.update_index(runs[variant.name])
+
+    for variant in variants:
+        merged, missing = variant_output(cache, variant, wrap_ups[variant.name], runs.get(variant.name))
+        for unit in missing:
+            stderr_out("Python Error: {}: lint gave no output for {}".format(variant.name, unit))
+            failed = True
+        with open(args.output.format(variant.name), "w", encoding=run_lint_shards.OUTPUT_ENCODING, newline="") as file:
+            file.write(merged)
+
+    # Only evicted once every variant's output is written, as the sections linted by this run are needed for it.
+    evicted = cache.evict(args.max_size * 1024 * 1024)
+    if evicted:
+        print("Evicted {} cached modules".format(evicted))
+    if failed:
+        sys.exit(-1)